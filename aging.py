@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Aging work in progress against the historical cycle-time distribution.
+
+CycleTimeCDF sorts the historical cycle times once; placing an open item's
+age on that distribution is then a bisect (O(log n)), so the aging table
+costs O(m log n) for m open items rather than a pass over the history per
+item.  Items are banded by the same percentiles the aging chart draws as
+reference lines (P50 / P70 / P85 / P95).
+"""
+from array import array
+from bisect import bisect_right
+
+AGING_PERCENTILES = (50, 70, 85, 95)
+
+
+class CycleTimeCDF:
+    """Empirical CDF of historical cycle times (business days)."""
+
+    def __init__(self, cycle_times):
+        self.values = array("d", sorted(cycle_times))
+        if not self.values:
+            raise ValueError("no historical cycle times")
+
+    def __len__(self):
+        return len(self.values)
+
+    def rank(self, age):
+        """Fraction of historical items that finished within `age` days."""
+        return bisect_right(self.values, age) / len(self.values)
+
+    def percentile(self, p):
+        """p-th percentile (0-100), linear interpolation."""
+        k = (p / 100) * (len(self.values) - 1)
+        f = int(k)
+        c = min(f + 1, len(self.values) - 1)
+        return self.values[f] + (self.values[c] - self.values[f]) * (k - f)
+
+    def thresholds(self, percentiles=AGING_PERCENTILES):
+        return {p: round(self.percentile(p), 2) for p in percentiles}
+
+
+def age_band(rank, percentiles=AGING_PERCENTILES):
+    """'<P50', 'P50-P70', ... '>P95' for a CDF rank in [0, 1]."""
+    pct = rank * 100
+    if pct <= percentiles[0]:
+        return f"<P{percentiles[0]}"
+    for lo, hi in zip(percentiles, percentiles[1:]):
+        if pct <= hi:
+            return f"P{lo}-P{hi}"
+    return f">P{percentiles[-1]}"
+
+
+def aging_report(items, cdf):
+    """Rows for open items, oldest first.
+
+    items is an iterable of dicts with at least key, status and age (business
+    days); each row gains `percentile` (0-100) and `band`."""
+    rows = []
+    for item in items:
+        rank = cdf.rank(item["age"])
+        rows.append(dict(item, age=round(item["age"], 2),
+                         percentile=round(rank * 100, 1), band=age_band(rank)))
+    rows.sort(key=lambda r: r["age"], reverse=True)
+    return rows
@@ -7,9 +7,32 @@ data) and key_to_sprint.json, computes true cycle time and status-duration
 metrics, then generates an interactive HTML dashboard.
 """
 
-import json, os, math, statistics
-from datetime import datetime, date, timedelta, timezone
+import json, os, math, statistics, heapq, random
+from datetime import datetime, time, timedelta
 from collections import defaultdict
+from operator import attrgetter
+
+from outliers import find_candidates
+from classify import NON_DEV_WORK_TYPES, TEAM_LABELS, UNTAGGED_TEAM, team_of
+from sprint_files import sprint_index
+from key_intern import KeyInterner
+from records import IssueRecord, RecordTable
+from histogram import make_binning, bin_counts
+from topk import Ranking, TopK
+import forecast
+from bootstrap import bootstrap_groups, ci, N_RESAMPLES, CI_LEVEL
+from flow import status_intervals, cumulative_flow, flag_intervals
+from intervals import BoardIndex, merge_intervals, intersect_intervals
+from aging import CycleTimeCDF, aging_report
+from calendars import get_calendar, DEFAULT_CALENDAR
+from sprints import SPRINT_WINDOWS, SprintWindowIndex, sprint_memberships
+from story_points import sp_history, sp_as_of, sp_final, commitment_time
+from scope import sprint_scope
+from hierarchy import Hierarchy, final_link
+from assignees import holder_intervals, split_by_holder, handoffs, HandoffMatrix
+from cube import Cube, sp_bucket
+from chunks import ChunkWriter, table, chunk_name
+from downsample import density_grid, stratified_sample
 
 # ── Paths ────────────────────────────────────────────────────────────────────
 BASE = os.path.dirname(os.path.abspath(__file__))
@@ -19,43 +42,34 @@ SPRINT_DIR   = os.path.join(BASE, "sprint_issues")
 RAW_DIR      = BASE  # raw_search_*.json lives here
 OUTPUT_HTML  = os.path.join(BASE, "dashboard.html")
 METRICS_JSON = os.path.join(BASE, "computed_metrics.json")
+OPEN_ISSUES  = os.path.join(BASE, "open_issues.json")   # non-Done issues (aging WIP)
+DATA_DIR     = os.path.join(BASE, "dashboard_data")     # lazily loaded detail chunks
+DASHBOARD_GZIP = True                                   # also write precompressed .json.gz
 
 # ── Sprint ordering & dates ──────────────────────────────────────────────────
-SPRINT_ORDER = [
-    "BIP AI FY25Q4.1", "BIP AI FY25Q4.2", "BIP AI FY25Q4.3",
-    "BIP AI FY25Q4.4", "BIP AI FY25Q4.5", "BIP AI FY25Q4.6",
-    "BIP AI FY25Q4.7",
-    "BIP AI FY26Q1.1", "BIP AI FY26Q1.2", "BIP AI FY26Q1.3",
-    "BIP AI FY26Q1.4", "BIP AI FY26Q1.5", "BIP AI FY26Q1.6",
-    "BIP AI FY26Q1.7",
-    "BIP AI FY26Q2.1", "BIP AI FY26Q2.2", "BIP AI FY26Q2.3",
-]
+SPRINT_ORDER = list(SPRINT_WINDOWS)      # sprint names in order (sprints.py)
 
-SPRINT_THROUGHPUT = {}  # populated from sprint_issues/*.json
-SPRINT_SP = {}          # populated from sp_values.json + key_to_sprint.json
+SPRINT_THROUGHPUT = {}  # delivered issues per sprint (SPRINT_ATTRIBUTION)
+SPRINT_SP = {}          # final story points per sprint (Story Points changelog)
+SPRINT_SP_COMMITTED = {}  # story points as of commitment to the sprint
 SP_VALUES_JSON = os.path.join(BASE, "sp_values.json")
 
-# ── US Federal Holidays (observed dates) ─────────────────────────────────────
-# Covers the data range Jun 2025 – Feb 2026.  When a holiday falls on Saturday
-# the observed date is the preceding Friday; Sunday → following Monday.
-US_HOLIDAYS = {
-    # 2025
-    date(2025, 1,  1),   # New Year's Day
-    date(2025, 1, 20),   # MLK Day
-    date(2025, 2, 17),   # Presidents' Day
-    date(2025, 5, 26),   # Memorial Day
-    date(2025, 6, 19),   # Juneteenth
-    date(2025, 7,  4),   # Independence Day (Friday)
-    date(2025, 9,  1),   # Labor Day
-    date(2025, 10, 13),  # Columbus Day
-    date(2025, 11, 11),  # Veterans Day
-    date(2025, 11, 27),  # Thanksgiving
-    date(2025, 12, 25),  # Christmas
-    # 2026
-    date(2026, 1,  1),   # New Year's Day
-    date(2026, 1, 19),   # MLK Day
-    date(2026, 2, 16),   # Presidents' Day
-}
+# ── Business calendars ───────────────────────────────────────────────────────
+# Status durations and cycle/lead time are measured on a business calendar
+# from calendars.py (timezone, working hours, rule-generated US federal
+# holidays with the Saturday -> Friday / Sunday -> Monday observed shifts).
+# An issue is measured on its sprint's calendar if the sprint is mapped in
+# SPRINT_CALENDARS, else on its team's (TEAM_CALENDARS, keyed by the team
+# label from classify.team_of), else on TEAM_CALENDAR; new regions or working
+# hours go in via calendars.register_calendar().
+TEAM_CALENDAR    = DEFAULT_CALENDAR
+TEAM_CALENDARS   = {}      # team label -> calendar name
+SPRINT_CALENDARS = {}      # sprint name -> calendar name
+BUSINESS_CAL = get_calendar(TEAM_CALENDAR)
+
+def issue_calendar(sprint, team):
+    name = SPRINT_CALENDARS.get(sprint) or TEAM_CALENDARS.get(team, TEAM_CALENDAR)
+    return get_calendar(name)
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 def parse_dt(s):
@@ -64,53 +78,21 @@ def parse_dt(s):
         return None
     return datetime.fromisoformat(s)
 
-def business_days_between(dt_start, dt_end):
+def is_business_day(d, cal=None):
+    """True for weekdays that are not holidays on the (team) calendar."""
+    return (cal or BUSINESS_CAL).is_business_day(d)
+
+def business_days_between(dt_start, dt_end, cal=None):
     """Return the number of business days (float) between two datetimes,
-    excluding weekends (Sat/Sun) and US federal holidays.
+    excluding weekends (Sat/Sun) and holidays of `cal` (the team calendar
+    by default).
 
-    Fractional days are calculated based on an 8-hour workday (480 min).
-    If start and end fall on the same business day the result is the
-    intra-day fraction.  Non-business-day portions are skipped."""
+    Working minutes between the two timestamps divided by the length of a
+    working day (see business_time.py), so partial first/last days count
+    fractionally and non-business time is skipped."""
     if dt_start is None or dt_end is None:
         return None
-    if dt_end <= dt_start:
-        return 0.0
-
-    d_start = dt_start.date()
-    d_end   = dt_end.date()
-
-    def is_business(d):
-        return d.weekday() < 5 and d not in US_HOLIDAYS
-
-    # Same calendar day
-    if d_start == d_end:
-        if is_business(d_start):
-            return (dt_end - dt_start).total_seconds() / 86400.0
-        return 0.0
-
-    total = 0.0
-
-    # Partial first day (fraction remaining)
-    if is_business(d_start):
-        end_of_day = datetime.combine(d_start + timedelta(days=1),
-                                      datetime.min.time(),
-                                      tzinfo=dt_start.tzinfo)
-        total += (end_of_day - dt_start).total_seconds() / 86400.0
-
-    # Full days in between
-    cur = d_start + timedelta(days=1)
-    while cur < d_end:
-        if is_business(cur):
-            total += 1.0
-        cur += timedelta(days=1)
-
-    # Partial last day
-    if is_business(d_end):
-        start_of_day = datetime.combine(d_end, datetime.min.time(),
-                                        tzinfo=dt_end.tzinfo)
-        total += (dt_end - start_of_day).total_seconds() / 86400.0
-
-    return total
+    return (cal or BUSINESS_CAL).days_between(dt_start, dt_end)
 
 def mins_to_days(m):
     """Convert minutes to calendar days (float)."""
@@ -181,48 +163,101 @@ REOPENED_KEYS = {
 # ── Load data ────────────────────────────────────────────────────────────────
 with open(ISSUE_DATA) as f:
     all_issues = json.load(f)
+open_issues = {}
+if os.path.exists(OPEN_ISSUES):
+    with open(OPEN_ISSUES) as f:
+        open_issues = json.load(f)
+
+# Exclude non-development work (support, shadowing, ...).  The work type is
+# classified from summary/labels at ingestion (see classify.py).
+SUMMARY_EXCLUDE_KEYS = {k for k, v in all_issues.items()
+                        if v.get("work_type") in NON_DEV_WORK_TYPES}
+AUTO_OUTLIER_KEYS = set()   # filled from outliers.find_candidates() below
+AUTO_OUTLIER_MIN_SCORE = 5.0
+
+# ── Exclusion bitmask ────────────────────────────────────────────────────────
+# Each exclusion category owns one bit.  Every record carries the OR of the
+# categories it belongs to, so any combination of exclusions can be applied
+# (or lifted) later with a single `excl & mask` test instead of re-running
+# the whole script with edited key sets.
+EXCLUSION_CATEGORIES = [
+    # (bit, id, label, keys)
+    (1 << 0, "manual",   "Manual outliers",      EXCLUDED_KEYS),
+    (1 << 1, "no_sp",    "No story points",      NO_STORY_POINTS),
+    (1 << 2, "canceled", "Canceled before Done", CANCELED_KEYS),
+    (1 << 3, "reopened", "Reopened (multi-day)", REOPENED_KEYS),
+    (1 << 4, "summary",  "Non-dev work (summary)", SUMMARY_EXCLUDE_KEYS),
+    (1 << 5, "auto",     "Auto-detected outliers", AUTO_OUTLIER_KEYS),
+]
+EXCLUDE_ALL = 0
+for _bit, _cid, _label, _keys in EXCLUSION_CATEGORIES:
+    EXCLUDE_ALL |= _bit
 
-# Exclude non-development work by summary keywords
-SUMMARY_EXCLUDE_KEYS = set()
-for sp in SPRINT_ORDER:
-    fname = sp.replace(" ", "_") + ".json"
-    fpath = os.path.join(SPRINT_DIR, fname)
-    if os.path.exists(fpath):
-        with open(fpath) as f:
-            for iss in json.load(f):
-                s = (iss.get("summary") or "").lower()
-                if "adhoc support" in s or "on call" in s or "shadow" in s:
-                    SUMMARY_EXCLUDE_KEYS.add(iss["key"])
-
-issues = {k: v for k, v in all_issues.items()
-          if k not in EXCLUDED_KEYS and k not in NO_STORY_POINTS
-          and k not in CANCELED_KEYS and k not in REOPENED_KEYS
-          and k not in SUMMARY_EXCLUDE_KEYS}
+# Mask applied to the headline metrics; the what-if block below evaluates
+# every other combination.  Auto-detected outliers are opt-in until the
+# detector has been reviewed against the manual list.
+EXCLUDE_MASK = EXCLUDE_ALL & ~(1 << 5)
+
+def exclusion_bitsets():
+    """Compile each category's key set into a bitset over interned ids."""
+    return [(bit, KEYS.bitset(keys)) for bit, _cid, _label, keys in EXCLUSION_CATEGORIES]
+
+def exclusion_bits(key_id, bitsets):
+    """Return the OR of all exclusion-category bits that apply to key_id."""
+    bits = 0
+    for bit, members in bitsets:
+        if key_id in members:
+            bits |= bit
+    return bits
+
+issues = all_issues
 
 with open(KEY_SPRINT) as f:
     key_to_sprint = json.load(f)
 
-# Load throughput from sprint_issues directory
-for sp in SPRINT_ORDER:
-    fname = sp.replace(" ", "_") + ".json"
-    fpath = os.path.join(SPRINT_DIR, fname)
-    if os.path.exists(fpath):
-        with open(fpath) as f:
-            SPRINT_THROUGHPUT[sp] = len(json.load(f))
-    else:
-        SPRINT_THROUGHPUT[sp] = 0
-
-# Load story-point totals per sprint from sp_values.json
+# Story points come from the Story Points changelog (see below); sp_values.json
+# is only needed for issues whose points were set at creation and never changed.
+_sp_vals = {}
 if os.path.exists(SP_VALUES_JSON):
     with open(SP_VALUES_JSON) as f:
         _sp_vals = json.load(f)   # key -> SP value
-    for k, v in _sp_vals.items():
-        sprint = key_to_sprint.get(k)
-        if sprint and sprint in SPRINT_THROUGHPUT:
-            SPRINT_SP[sprint] = SPRINT_SP.get(sprint, 0) + v
+
+# ── Key interning ────────────────────────────────────────────────────────────
+# Every key seen is mapped to a dense int id once; sprint and story-point
+# lookups below are list/array indexing and exclusion sets are bitsets.  Other
+# per-issue maps stay keyed by issue key.  KEYS.keys[id] gives the key back for
+# display.
+KEYS = KeyInterner(key_to_sprint)
+for _k in all_issues:
+    KEYS.intern(_k)
+for _k in _sp_vals:
+    KEYS.intern(_k)
+
+# Sprint attribution: a Done issue belongs to the sprint whose window
+# contains its done_at (one bisect, see sprints.py).  Issues whose done_at
+# falls outside every window keep their key_to_sprint.json sprint: the first
+# sprint file the issue appeared in, i.e. the sprint it was carried over
+# FROM.  Setting SPRINT_ATTRIBUTION = "sprint_file" restores that file-based
+# attribution for every issue.
+SPRINT_ATTRIBUTION = "done_window"
+SPRINT_INDEX = SprintWindowIndex(tz=BUSINESS_CAL.tz)
+sprint_by_key = dict(key_to_sprint)
+if SPRINT_ATTRIBUTION == "done_window":
+    for _k, _d in all_issues.items():
+        _sp = SPRINT_INDEX.sprint_at(parse_dt(_d.get("done_at")))
+        if _sp:
+            sprint_by_key[_k] = _sp
+REATTRIBUTED = sum(1 for _k in all_issues if sprint_by_key.get(_k) != key_to_sprint.get(_k))
+SPRINT_OF = KEYS.column(sprint_by_key)                          # id -> sprint
+
+# Team labels and current assignees from the sprint-file index (no
+# descriptions decoded); the latest sprint file has the latest assignee.
+team_by_key = {}
+assignee_by_key = {}
 for sp in SPRINT_ORDER:
-    SPRINT_SP.setdefault(sp, 0)
-    SPRINT_SP[sp] = int(SPRINT_SP[sp])
+    for _e in sprint_index(sp):
+        team_by_key.setdefault(_e["key"], team_of(_e.get("labels")))
+        assignee_by_key[_e["key"]] = (_e.get("assignee") or {}).get("display_name")
 
 # ── Build "last In Progress" lookup from raw changelogs ──────────────────────
 # For cycle time we use the LAST transition into an active status (In Progress,
@@ -232,7 +267,18 @@ for sp in SPRINT_ORDER:
 # previous Done (or start).
 import glob as _glob
 LAST_ACTIVE = {}           # key -> ISO timestamp of last "real" start
+DONE_EVENTS = {}           # key -> (author, ISO timestamp) of final move to Done
+REWORK = {}                # key -> number of backward moves (review/test -> IP, reopen)
+STATUS_TIMELINES = {}      # key -> [(status, enter, exit)] from status_intervals()
+SPRINT_MEMBERSHIP = {}     # key -> [(sprint, added, removed)] from sprint_memberships()
+SP_HISTORY = {}            # key -> SpHistory (change times, points) from sp_history()
+FLAGGED_ACTIVE = {}        # key -> [(start, end)] flagged while in an active-work status
+HIERARCHY_LINKS = {}       # key -> epic (Epic Link) or parent (Parent Link) key
+HOLDER_SEGMENTS = {}       # key -> [(status, assignee, start, end)] from split_by_holder()
+HANDOFFS = {}              # key -> [(from, to, when)] assignee hand-offs
+REVIEW_STATUSES = {"In Testing", "Peer Review Needed"}
 ACTIVE_STATUSES = {"In Progress", "In Testing", "Peer Review Needed", "Blocked"}
+WORK_STATUSES = ACTIVE_STATUSES - {"Blocked"}   # "active work", as in active_days
 for raw_path in sorted(_glob.glob(os.path.join(RAW_DIR, "raw_search_*.json"))) + \
                 sorted(_glob.glob(os.path.join(RAW_DIR, "raw_search_sample_*.json"))):
     with open(raw_path) as f:
@@ -243,12 +289,47 @@ for raw_path in sorted(_glob.glob(os.path.join(RAW_DIR, "raw_search_*.json"))) +
         # Walk transitions and find the last time the issue entered an active
         # status after being in Backlog/Ready for Dev (i.e. last restart).
         last_start = None
+        rework = 0
+        transitions = []
+        sprint_changes = []
+        sp_changes = []
+        flag_changes = []
+        link_changes = {"Epic Link": [], "Parent Link": []}
+        assignee_changes = []
         for cl in changelogs:
             for item in cl.get("items", []):
+                if item.get("field") == "Sprint":
+                    sprint_changes.append((parse_dt(cl["created"]),
+                                           item.get("from_string"), item.get("to_string")))
+                    continue
+                if item.get("field") == "Story Points":
+                    sp_changes.append((parse_dt(cl["created"]),
+                                       item.get("from_string"), item.get("to_string")))
+                    continue
+                if item.get("field") == "Flagged":
+                    flag_changes.append((parse_dt(cl["created"]),
+                                         item.get("from_string"), item.get("to_string")))
+                    continue
+                if item.get("field") == "assignee":
+                    assignee_changes.append((parse_dt(cl["created"]),
+                                             item.get("from_string"), item.get("to_string")))
+                    continue
+                if item.get("field") in link_changes:
+                    link_changes[item["field"]].append((parse_dt(cl["created"]),
+                                                        item.get("from_string"),
+                                                        item.get("to_string")))
+                    continue
                 if item.get("field") != "status":
                     continue
                 to_s = item.get("to_string", "")
                 from_s = item.get("from_string", "")
+                transitions.append((parse_dt(cl["created"]), from_s, to_s))
+                if (from_s in REVIEW_STATUSES and to_s == "In Progress") or \
+                   (from_s == "Done" and to_s != "Done"):
+                    rework += 1
+                if to_s == "Done":
+                    DONE_EVENTS[key] = ((cl.get("author") or {}).get("display_name"),
+                                        cl["created"])
                 if to_s in ACTIVE_STATUSES:
                     if from_s in ("Backlog", "Ready for Dev", ""):
                         last_start = cl["created"]
@@ -256,12 +337,88 @@ for raw_path in sorted(_glob.glob(os.path.join(RAW_DIR, "raw_search_*.json"))) +
                         last_start = cl["created"]
         if last_start:
             LAST_ACTIVE[key] = last_start
+        REWORK[key] = rework
+        STATUS_TIMELINES[key] = status_intervals(parse_dt(iss.get("created")), transitions)
+        # Issues created straight into a sprint have no Sprint change logged.
+        SPRINT_MEMBERSHIP[key] = sprint_memberships(
+            parse_dt(iss.get("created")), sprint_changes,
+            initial=[key_to_sprint[key]] if key in key_to_sprint else [])
+        SP_HISTORY[key] = sp_history(parse_dt(iss.get("created")), sp_changes)
+        # Impediment flags only count while the issue was being worked on;
+        # flags raised in Backlog or while already Blocked are not extra time.
+        if flag_changes:
+            FLAGGED_ACTIVE[key] = intersect_intervals(
+                merge_intervals(flag_intervals(parse_dt(iss.get("created")), flag_changes)),
+                merge_intervals((enter, exit_) for status, enter, exit_ in STATUS_TIMELINES[key]
+                                if status in WORK_STATUSES))
+        # An issue's place in the hierarchy is its current epic, else its parent.
+        link = final_link(link_changes["Epic Link"]) or final_link(link_changes["Parent Link"])
+        if link:
+            HIERARCHY_LINKS[key] = link
+        # Who held the issue during each status interval (merge-join of the
+        # status and assignee timelines).  Without assignee changes the
+        # current assignee held it throughout.
+        holders = holder_intervals(parse_dt(iss.get("created")), assignee_changes,
+                                   current=assignee_by_key.get(key))
+        HOLDER_SEGMENTS[key] = split_by_holder(STATUS_TIMELINES[key], holders)
+        HANDOFFS[key] = handoffs(holders)
+
+# ── Story points (final and as of commitment) ───────────────────────────────
+# Read from the Story Points history collected above; sp_values.json covers
+# the issues whose points never changed after creation.  "Committed" points
+# are the value when the issue was committed to its sprint (sprint start,
+# or when it was added mid-sprint).
+sp_final_by_key = dict(_sp_vals)
+sp_committed_by_key = dict(_sp_vals)
+for key, hist in SP_HISTORY.items():
+    if not hist:
+        continue
+    sp_final_by_key[key] = sp_final(hist)
+    sprint = sprint_by_key.get(key)
+    if sprint in SPRINT_INDEX.position:
+        start = SPRINT_INDEX.window(sprint)[0]
+        sp_committed_by_key[key] = sp_as_of(
+            hist, commitment_time(SPRINT_MEMBERSHIP.get(key, []), sprint, start))
+    else:
+        sp_committed_by_key[key] = sp_final(hist)
+SP_FROM_CHANGELOG = sum(1 for h in SP_HISTORY.values() if h)
+SP_OF = KEYS.column({k: v for k, v in sp_final_by_key.items() if v is not None},
+                    default=math.nan, typecode="d")              # id -> final SP
+SP_COMMITTED_OF = KEYS.column({k: v for k, v in sp_committed_by_key.items() if v is not None},
+                              default=math.nan, typecode="d")    # id -> committed SP
+
+# Throughput and story points are both counted over SPRINT_OF, so they follow
+# SPRINT_ATTRIBUTION together: every delivered issue counts once, in the
+# sprint it is attributed to.
+for sp in SPRINT_ORDER:
+    SPRINT_THROUGHPUT[sp] = 0
+for sprint, v, c in zip(SPRINT_OF, SP_OF, SP_COMMITTED_OF):
+    if sprint in SPRINT_THROUGHPUT:
+        SPRINT_THROUGHPUT[sprint] += 1
+        if not math.isnan(v):
+            SPRINT_SP[sprint] = SPRINT_SP.get(sprint, 0) + v
+        if not math.isnan(c):
+            SPRINT_SP_COMMITTED[sprint] = SPRINT_SP_COMMITTED.get(sprint, 0) + c
+for sp in SPRINT_ORDER:
+    SPRINT_SP[sp] = int(SPRINT_SP.get(sp, 0))
+    SPRINT_SP_COMMITTED[sp] = int(SPRINT_SP_COMMITTED.get(sp, 0))
+
 
+# Changelog status -> duration field of the data file it corresponds to.
+STATUS_MINUTE_FIELDS = {
+    "In Progress": "in_progress_minutes", "In Testing": "in_testing_minutes",
+    "Peer Review Needed": "peer_review_minutes", "Blocked": "blocked_minutes",
+    "Canceled": "canceled_minutes", "Backlog": "backlog_minutes",
+    "Ready for Dev": "backlog_minutes",
+}
 
 # ── Compute per-issue metrics ────────────────────────────────────────────────
-records = []
+# Records are built for every issue (excluded or not); `excl` holds the
+# exclusion bitmask and `records` is the view selected by EXCLUDE_MASK.
+all_records = []
 for key, d in issues.items():
-    sprint = key_to_sprint.get(key, "Unknown")
+    key_id = KEYS.id(key)
+    sprint = SPRINT_OF[key_id] or "Unknown"
     first_active = parse_dt(d.get("first_active"))
     done_at      = parse_dt(d.get("done_at"))
     created      = parse_dt(d.get("created"))
@@ -273,44 +430,74 @@ for key, d in issues.items():
     cycle_start = last_active or first_active
 
     # Cycle time: last_active -> done_at  (business days)
-    cycle_days = business_days_between(cycle_start, done_at)
+    cal = issue_calendar(sprint, team_by_key.get(key, UNTAGGED_TEAM))
+    cycle_days = business_days_between(cycle_start, done_at, cal)
     if cycle_days == 0.0 and cycle_start is None:
         cycle_days = None   # Backlog->Done skip
 
     # Lead time: created -> done_at (business days)
-    lead_days = business_days_between(created, done_at)
-
-    # Status durations in days
-    ip_days      = mins_to_days(d.get("in_progress_minutes", 0))
-    test_days    = mins_to_days(d.get("in_testing_minutes", 0))
-    pr_days      = mins_to_days(d.get("peer_review_minutes", 0))
-    blocked_days = mins_to_days(d.get("blocked_minutes", 0))
-    cancel_days  = mins_to_days(d.get("canceled_minutes", 0))
-    backlog_days = mins_to_days(d.get("backlog_minutes", 0))
+    lead_days = business_days_between(created, done_at, cal)
+
+    # Status durations in business days, from the changelog timeline (the
+    # *_minutes fields in the data file are calendar minutes).
+    if key in STATUS_TIMELINES:
+        status_days = dict.fromkeys(STATUS_MINUTE_FIELDS.values(), 0.0)
+        for status, enter, exit_ in STATUS_TIMELINES[key]:
+            field = STATUS_MINUTE_FIELDS.get(status)
+            if field and exit_ is not None:
+                status_days[field] += business_days_between(enter, exit_, cal)
+    else:
+        status_days = {f: mins_to_days(d.get(f, 0)) for f in STATUS_MINUTE_FIELDS.values()}
+    ip_days      = status_days["in_progress_minutes"]
+    test_days    = status_days["in_testing_minutes"]
+    pr_days      = status_days["peer_review_minutes"]
+    blocked_days = status_days["blocked_minutes"]
+    cancel_days  = status_days["canceled_minutes"]
+    backlog_days = status_days["backlog_minutes"]
 
     # "Active work" = IP + Testing + PR (excludes Blocked/Canceled/Backlog)
     active_days = ip_days + test_days + pr_days
 
-    records.append({
-        "key": key,
-        "sprint": sprint,
-        "cycle_days": cycle_days,
-        "lead_days": lead_days,
-        "backlog_days": backlog_days,
-        "ip_days": ip_days,
-        "test_days": test_days,
-        "pr_days": pr_days,
-        "blocked_days": blocked_days,
-        "cancel_days": cancel_days,
-        "active_days": active_days,
-        "has_cycle": cycle_days is not None,
-    })
+    # Part of the active work spent flagged as an impediment
+    flagged_days = sum(business_days_between(a, b, cal)
+                       for a, b in FLAGGED_ACTIVE.get(key, ()) if b is not None)
+
+    all_records.append(IssueRecord(
+        key=key,
+        id=key_id,
+        sprint=sprint,
+        excl=0,             # filled in once auto outliers are known
+        cycle_days=cycle_days,
+        lead_days=lead_days,
+        backlog_days=backlog_days,
+        ip_days=ip_days,
+        test_days=test_days,
+        pr_days=pr_days,
+        blocked_days=blocked_days,
+        flagged_days=flagged_days,
+        cancel_days=cancel_days,
+        active_days=active_days,
+        has_cycle=cycle_days is not None,
+        rework=REWORK.get(key, 0),
+    ))
+
+# ── Automatic outlier candidates ────────────────────────────────────────────
+outlier_candidates = find_candidates(all_records, DONE_EVENTS)
+AUTO_OUTLIER_KEYS.update(c["key"] for c in outlier_candidates
+                         if c["score"] >= AUTO_OUTLIER_MIN_SCORE)
+
+_bitsets = exclusion_bitsets()
+excl_bits = {}
+for r in all_records:
+    r.excl = excl_bits[r.key] = exclusion_bits(r.id, _bitsets)
+
+records = RecordTable(r for r in all_records if not r.excl & EXCLUDE_MASK)
 
 
 # ── Aggregate overall ────────────────────────────────────────────────────────
-cycle_times = sorted([r["cycle_days"] for r in records if r["has_cycle"]])
-lead_times  = sorted([r["lead_days"]  for r in records if r["lead_days"] is not None])
-active_times = sorted([r["active_days"] for r in records if r["has_cycle"]])
+cycle_times = sorted(records.select("cycle_days", where="has_cycle"))
+lead_times  = sorted(v for v in records.column("lead_days") if v is not None)
+active_times = sorted(records.select("active_days", where="has_cycle"))
 
 overall = {
     "sample_size": len(records),
@@ -328,23 +515,72 @@ overall = {
     "active_mean":   round(safe_mean(active_times), 2)  if active_times else None,
 }
 
+# ── What-if exclusion views ─────────────────────────────────────────────────
+# Records sharing the same exclusion bits and sprint form one group; each
+# group's cycle times are sorted once, and every mask combination is then
+# answered by merging the groups it keeps (no per-mask re-scan of the record
+# list).  The headline stats merge across sprints; the per-sprint detail
+# (trend, status split, histograms) is built further down.
+_excl_groups = defaultdict(list)    # (excl bits, sprint) -> sorted cycle times
+_excl_sizes  = defaultdict(int)     # (excl bits, sprint) -> record count
+for r in all_records:
+    _excl_sizes[r.excl, r.sprint] += 1
+    if r.has_cycle:
+        _excl_groups[r.excl, r.sprint].append(r.cycle_days)
+for _cts in _excl_groups.values():
+    _cts.sort()
+
+def what_if_summary(mask):
+    """Headline cycle-time stats with the exclusion categories in mask applied."""
+    cts = list(heapq.merge(*(v for (bits, _sp), v in _excl_groups.items()
+                             if not bits & mask)))
+    size = sum(n for (bits, _sp), n in _excl_sizes.items() if not bits & mask)
+    return {
+        "sample_size":  size,
+        "with_cycle":   len(cts),
+        "cycle_median": round(safe_median(cts), 2) if cts else None,
+        "cycle_mean":   round(safe_mean(cts), 2)   if cts else None,
+        "cycle_p85":    round(percentile(cts, 85), 2) if cts else None,
+        "cycle_p95":    round(percentile(cts, 95), 2) if cts else None,
+    }
+
+what_if = {mask: what_if_summary(mask) for mask in range(EXCLUDE_ALL + 1)}
+exclusion_info = [{"bit": bit, "id": cid, "label": label,
+                   "count": sum(1 for b in excl_bits.values() if b & bit)}
+                  for bit, cid, label, _keys in EXCLUSION_CATEGORIES]
+
+# ── Carryover and scope churn ───────────────────────────────────────────────
+# Classifies every sprint membership interval against its sprint window (see
+# scope.py); story points are read point-in-time from the SP history.
+def _sp_at(key, ts):
+    hist = SP_HISTORY.get(key)
+    return sp_as_of(hist, ts) if hist else sp_final_by_key.get(key)
+
+sprint_scope_data = sprint_scope(
+    SPRINT_MEMBERSHIP, SPRINT_INDEX,
+    {k: parse_dt(ts) for k, (_author, ts) in DONE_EVENTS.items()},
+    sprint_by_key, _sp_at)
+
 # ── Aggregate per-sprint ─────────────────────────────────────────────────────
 sprint_data = {}
+records_by_sprint = records.group_by("sprint")
 for sp in SPRINT_ORDER:
-    sp_recs = [r for r in records if r["sprint"] == sp]
-    sp_cycles = sorted([r["cycle_days"] for r in sp_recs if r["has_cycle"]])
+    sp_recs = records_by_sprint.get(sp, RecordTable([]))
+    sp_cycles = sorted(sp_recs.select("cycle_days", where="has_cycle"))
 
     # Status averages for stacked chart (in days)
-    ip_vals   = [r["ip_days"] for r in sp_recs if r["has_cycle"]]
-    test_vals = [r["test_days"] for r in sp_recs if r["has_cycle"]]
-    pr_vals   = [r["pr_days"] for r in sp_recs if r["has_cycle"]]
-    blk_vals  = [r["blocked_days"] for r in sp_recs if r["has_cycle"]]
+    ip_vals   = sp_recs.select("ip_days", where="has_cycle")
+    test_vals = sp_recs.select("test_days", where="has_cycle")
+    pr_vals   = sp_recs.select("pr_days", where="has_cycle")
+    blk_vals  = sp_recs.select("blocked_days", where="has_cycle")
+    flag_vals = sp_recs.select("flagged_days", where="has_cycle")
 
     sprint_data[sp] = {
         "sample_count": len(sp_recs),
         "with_cycle": len(sp_cycles),
         "throughput": SPRINT_THROUGHPUT.get(sp, 0),
         "story_points": SPRINT_SP.get(sp, 0),
+        "story_points_committed": SPRINT_SP_COMMITTED.get(sp, 0),
         "cycle_median": round(safe_median(sp_cycles), 2) if sp_cycles else None,
         "cycle_mean":   round(safe_mean(sp_cycles), 2)   if sp_cycles else None,
         "cycle_p85":    round(percentile(sp_cycles, 85), 2) if sp_cycles else None,
@@ -352,44 +588,364 @@ for sp in SPRINT_ORDER:
         "avg_test_days":    round(safe_mean(test_vals), 2)  if test_vals else 0,
         "avg_pr_days":      round(safe_mean(pr_vals), 2)    if pr_vals else 0,
         "avg_blocked_days": round(safe_mean(blk_vals), 2)   if blk_vals else 0,
+        "avg_flagged_active_days": round(safe_mean(flag_vals), 2) if flag_vals else 0,
     }
+    sc = sprint_scope_data[sp]
+    sprint_data[sp].update({
+        "committed":       sc["committed"],
+        "added_mid_sprint": sc["added"],
+        "removed_mid_sprint": sc["removed"],
+        "carried_over":    sc["carried_over"],
+        "carried_in":      sc["carried_in"],
+        "sp_added_mid_sprint": sc["sp_added"],
+        "sp_reestimated":  sc["sp_changed"],
+        "scope_churn_pct": sc["churn_pct"],
+    })
+
+# ── Bootstrap confidence intervals (per sprint) ─────────────────────────────
+# Small sprints make point medians noisy; every sprint is resampled in one
+# batch (see bootstrap.py) and the replicates are reused for the early-vs-late
+# comparison in the insights below.
+BOOTSTRAP_SEED = 20250707
+boot = bootstrap_groups(
+    {sp: records_by_sprint[sp].select("cycle_days", where="has_cycle")
+     for sp in SPRINT_ORDER if sp in records_by_sprint},
+    rng=random.Random(BOOTSTRAP_SEED))
+for sp in SPRINT_ORDER:
+    for stat in ("median", "mean", "p85"):
+        sprint_data[sp][f"cycle_{stat}_ci"] = (
+            [round(x, 2) for x in ci(boot[sp][stat])] if sp in boot else None)
 
 # ── Build histogram buckets ─────────────────────────────────────────────────
-# Buckets: 0-1, 1-2, 2-5, 5-10, 10-20, 20-30, 30+
-HIST_BUCKETS = [
-    ("0-1d",  0, 1),
-    ("1-2d",  1, 2),
-    ("2-5d",  2, 5),
-    ("5-10d", 5, 10),
-    ("10-20d", 10, 20),
-    ("20-30d", 20, 30),
-    ("30d+",  30, 999),
-]
-histogram = []
-for label, lo, hi in HIST_BUCKETS:
-    count = len([c for c in cycle_times if lo <= c < hi])
-    histogram.append({"label": label, "count": count})
+# "fixed" = 0-1, 1-2, 2-5, 5-10, 10-20, 20-30, 30+ days; see histogram.py for
+# the log-scaled and Freedman-Diaconis alternatives.  The overall and
+# per-sprint histograms are filled in a single pass over the records.
+HIST_STRATEGY = "fixed"
+hist_binning = make_binning(HIST_STRATEGY, cycle_times)
+hist_counts, hist_by_sprint = bin_counts(
+    zip(records.select("cycle_days", where="has_cycle"),
+        records.select("sprint", where="has_cycle")),
+    hist_binning)
+histogram = [{"label": label, "count": count}
+             for label, count in zip(hist_binning.labels, hist_counts)]
+histogram_by_sprint = {sp: hist_by_sprint.get(sp, [0] * len(hist_binning))
+                       for sp in SPRINT_ORDER}
 
 # ── Status distribution (overall) ───────────────────────────────────────────
 status_totals = {
-    "In Progress":        sum(r["ip_days"] for r in records if r["has_cycle"]),
-    "In Testing":         sum(r["test_days"] for r in records if r["has_cycle"]),
-    "Peer Review Needed": sum(r["pr_days"] for r in records if r["has_cycle"]),
-    "Blocked":            sum(r["blocked_days"] for r in records if r["has_cycle"]),
+    "In Progress":        records.total("ip_days", where="has_cycle"),
+    "In Testing":         records.total("test_days", where="has_cycle"),
+    "Peer Review Needed": records.total("pr_days", where="has_cycle"),
+    "Blocked":            records.total("blocked_days", where="has_cycle"),
 }
+# Flagged time overlaps the active statuses above, so it is reported beside
+# them rather than as another slice of the total.
+flagged_active_total = records.total("flagged_days", where="has_cycle")
 # Also compute percentage of total tracked time
 total_status_days = sum(status_totals.values())
 status_pct = {k: round(v / total_status_days * 100, 1) if total_status_days else 0
               for k, v in status_totals.items()}
 
-# ── Top outliers ─────────────────────────────────────────────────────────────
-sorted_by_cycle = sorted([r for r in records if r["has_cycle"]],
-                         key=lambda r: r["cycle_days"], reverse=True)
-top_longest = sorted_by_cycle[:10]
+# ── What-if detail per mask ─────────────────────────────────────────────────
+# The same (excl bits, sprint) groups also hold status-day totals and
+# histogram counts, so each mask's per-sprint trend, stacked status
+# averages, status split and histograms are merges of the groups it keeps.
+# Throughput and story points count delivered work and are not filtered.
+# Written as the "what_if" chunk, loaded when a toggle first changes.
+_STATUS_FIELDS = ("ip_days", "test_days", "pr_days", "blocked_days")
+_excl_status = defaultdict(lambda: [0.0] * len(_STATUS_FIELDS))   # group -> summed days
+_excl_hist = defaultdict(lambda: [0] * len(hist_binning))        # group -> bin counts
+for r in all_records:
+    if r.has_cycle:
+        totals = _excl_status[r.excl, r.sprint]
+        for i, field in enumerate(_STATUS_FIELDS):
+            totals[i] += getattr(r, field)
+        b = hist_binning.index(r.cycle_days)
+        if b >= 0:
+            _excl_hist[r.excl, r.sprint][b] += 1
+
+def what_if_detail(mask):
+    """Per-sprint series, status split and histograms with `mask` applied."""
+    kept = defaultdict(list)                      # sprint -> kept groups
+    for bits, sp in _excl_sizes:
+        if not bits & mask:
+            kept[sp].append((bits, sp))
+    out = {"samples": [], "cycle_median": [], "cycle_mean": [], "cycle_p85": [],
+           "avg_status": [], "hist_by_sprint": []}
+    status = [0.0] * len(_STATUS_FIELDS)
+    hist = [0] * len(hist_binning)
+    for sp in SPRINT_ORDER:
+        groups = kept.get(sp, [])
+        cts = list(heapq.merge(*(_excl_groups.get(g, ()) for g in groups)))
+        totals = [sum(_excl_status[g][i] for g in groups if g in _excl_status)
+                  for i in range(len(_STATUS_FIELDS))]
+        counts = [sum(_excl_hist[g][b] for g in groups if g in _excl_hist)
+                  for b in range(len(hist_binning))]
+        out["samples"].append(sum(_excl_sizes[g] for g in groups))
+        out["cycle_median"].append(round(safe_median(cts), 2) if cts else None)
+        out["cycle_mean"].append(round(safe_mean(cts), 2) if cts else None)
+        out["cycle_p85"].append(round(percentile(cts, 85), 2) if cts else None)
+        out["avg_status"].append([round(t / len(cts), 2) if cts else 0 for t in totals])
+        out["hist_by_sprint"].append(counts)
+        status = [a + b for a, b in zip(status, totals)]
+        hist = [a + b for a, b in zip(hist, counts)]
+    total = sum(status)
+    out["status_pct"] = [round(v / total * 100, 1) if total else 0 for v in status]
+    out["hist"] = hist
+    return out
+
+what_if_detail_by_mask = {mask: what_if_detail(mask) for mask in range(EXCLUDE_ALL + 1)}
 
-sorted_by_blocked = sorted([r for r in records if r["blocked_days"] > 0],
-                           key=lambda r: r["blocked_days"], reverse=True)
-top_blocked = sorted_by_blocked[:10]
+# ── Top outliers ─────────────────────────────────────────────────────────────
+# All leaderboards are filled in one pass with bounded heaps (see topk.py).
+# (name, title, metric header, record field)
+LEADERBOARDS = [
+    ("longest",  "Top 10 Longest Cycle Times",   "Cycle (d)",   "cycle_days"),
+    ("blocked",  "Top 10 Most Blocked Issues",   "Blocked (d)", "blocked_days"),
+    ("flagged",  "Top 10 Flagged While Active",  "Flagged (d)", "flagged_days"),
+    ("testing",  "Top 10 Longest in Testing",    "Test (d)",    "test_days"),
+    ("review",   "Top 10 Longest in Peer Review", "PR (d)",     "pr_days"),
+    ("rework",   "Top 10 Most Rework",           "Rework moves", "rework"),
+    ("backlog",  "Top 10 Longest Backlog Wait",  "Backlog (d)", "backlog_days"),
+]
+_rank_where = {"longest": attrgetter("has_cycle")}
+rankings = TopK([
+    Ranking(name, score=attrgetter(field),
+            where=_rank_where.get(name, lambda r, f=field: getattr(r, f) > 0))
+    for name, _title, _hdr, field in LEADERBOARDS
+]).update(records)
+leaderboards = {name: rankings.results(name) for name, *_ in LEADERBOARDS}
+top_longest = leaderboards["longest"]
+top_blocked = leaderboards["blocked"]
+
+# ── Delivery forecast (Monte Carlo) ─────────────────────────────────────────
+# Resamples historical throughput per sprint and per business day (see
+# forecast.py); "when done" percentiles are computed exactly from the
+# convolved throughput distribution.  Seeded so the dashboard is reproducible
+# between runs.
+FORECAST_SEED     = 20250707
+FORECAST_HORIZONS = [1, 2, 3, 6]          # sprints ahead
+FORECAST_TARGETS  = [50, 100, 200, 400]   # items to finish
+FORECAST_WEEKS    = [2, 4, 8, 13]         # calendar weeks after the last Done
+
+_rng = random.Random(FORECAST_SEED)
+sprint_thru_samples = [SPRINT_THROUGHPUT[s] for s in SPRINT_ORDER]
+
+# Daily Done counts over every business day of the history (zero days count).
+_done_per_day = defaultdict(int)
+for _author, _ts in DONE_EVENTS.values():
+    _done_per_day[parse_dt(_ts).date()] += 1
+_first_day, _last_day = min(_done_per_day), max(_done_per_day)
+daily_thru_samples = []
+_d = _first_day
+while _d <= _last_day:
+    if is_business_day(_d):
+        daily_thru_samples.append(_done_per_day.get(_d, 0))
+    _d += timedelta(days=1)
+
+def _business_days_after(start, n_calendar_days):
+    """Business days in (start, start + n_calendar_days]."""
+    return BUSINESS_CAL.business_days(start + timedelta(days=1),
+                                      start + timedelta(days=n_calendar_days))
+
+def _pcts(d):
+    return {f"p{c}": v for c, v in d.items()}
+
+forecast_data = {
+    "n_sims": forecast.N_SIMS,
+    "daily_samples": daily_thru_samples,
+    "by_sprints": [dict(sprints=h, **_pcts(forecast.how_many_by(
+                       sprint_thru_samples, h, rng=_rng)))
+                   for h in FORECAST_HORIZONS],
+    "by_date": [],
+    "when_done": [],
+}
+_when_sprints = forecast.when_done(sprint_thru_samples, FORECAST_TARGETS)
+_when_days    = forecast.when_done(daily_thru_samples, FORECAST_TARGETS)
+for n in FORECAST_TARGETS:
+    forecast_data["when_done"].append(dict(items=n, sprints=_pcts(_when_sprints[n]),
+                                           business_days=_pcts(_when_days[n])))
+for weeks in FORECAST_WEEKS:
+    bdays = _business_days_after(_last_day, weeks * 7)
+    forecast_data["by_date"].append(dict(
+        date=(_last_day + timedelta(weeks=weeks)).isoformat(), business_days=bdays,
+        **_pcts(forecast.how_many_by(daily_thru_samples, bdays, rng=_rng))))
+
+# ── Cumulative flow (sweep line over status intervals) ─────────────────────
+# Every issue in the raw changelogs, excluded or not: flow is about the board,
+# not the cycle-time sample.  Same window as the throughput history.
+cfd = cumulative_flow(STATUS_TIMELINES.values(), _first_day, _last_day)
+littles_law = cfd["littles_law"]
+
+# ── WIP aging snapshots (interval index) ────────────────────────────────────
+# As-of queries against the board at the end of every Friday in the history:
+# how much was in progress and how long (business days) it had been there.
+board = BoardIndex(STATUS_TIMELINES)
+_snap_tz = BUSINESS_CAL.tz          # team's local time zone (DST-aware)
+wip_aging = []
+_d = _first_day + timedelta(days=(4 - _first_day.weekday()) % 7)
+while _d <= _last_day:
+    _when = datetime.combine(_d, time(23, 59, 59), tzinfo=_snap_tz)
+    _snap = board.wip_snapshot(_when, age=business_days_between)
+    _ages = sorted(a for _k, _s, a in _snap)
+    wip_aging.append({
+        "date": _d.isoformat(),
+        "wip": len(_snap),
+        "age_median": round(percentile(_ages, 50), 2) if _ages else None,
+        "age_p85": round(percentile(_ages, 85), 2) if _ages else None,
+        "oldest": {"key": _snap[0][0], "age": round(_snap[0][2], 2)} if _snap else None,
+    })
+    _d += timedelta(weeks=1)
+
+# ── Aging work in progress ──────────────────────────────────────────────────
+# Open issues in a WIP status, aged in business days from the start of their
+# current stint of active work, and placed on the historical cycle-time CDF.
+# "Now" is the latest status change in the extract, so reruns are stable.
+# The oldest AGING_TOP_N items are inline (table, computed_metrics.json); the
+# full list is the "aging_wip" chunk.
+AGING_TOP_N = 25
+AS_OF = max(enter for intervals in STATUS_TIMELINES.values() for _s, enter, _e in intervals)
+cycle_cdf = CycleTimeCDF(cycle_times)
+aging_wip = aging_report(
+    ({"key": k, "status": v["status"], "work_type": v.get("work_type"),
+      "sprint": key_to_sprint.get(k, "Unknown"),
+      "age": business_days_between(parse_dt(v["active_since"]), AS_OF)}
+     for k, v in open_issues.items()
+     if v["status"] in ACTIVE_STATUSES and v.get("active_since")),
+    cycle_cdf)
+aging_thresholds = cycle_cdf.thresholds()
+aging_bands = {}
+for a in aging_wip:
+    aging_bands[a["band"]] = aging_bands.get(a["band"], 0) + 1
+
+# ── Epic / parent roll-ups ──────────────────────────────────────────────────
+# Issue -> epic -> parent links from the changelog, rolled up bottom-up once
+# per node (memoized).  Epics are not in the extract themselves, so epic
+# lead time starts at the earliest child's creation; cycle time runs from
+# the first child going active to the last child done (business days).
+# Only links changed after creation are in the changelog.  The top
+# EPIC_TOP_N are inline; every roll-up is in the "hierarchy" chunk.
+EPIC_TOP_N = 15
+_leaves = {key: (parse_dt(d.get("created")),
+                 parse_dt(LAST_ACTIVE.get(key)) or parse_dt(d.get("first_active")),
+                 parse_dt(d.get("done_at")))
+           for key, d in issues.items()}
+for key, v in open_issues.items():
+    _leaves.setdefault(key, (parse_dt(v.get("created")), parse_dt(v.get("first_active")), None))
+hierarchy = Hierarchy(HIERARCHY_LINKS, _leaves)
+epic_rollups = []
+for node in hierarchy.nodes():
+    r = hierarchy.rollup(node)
+    if not r.items:
+        continue
+    end = r.last_done if r.complete else None
+    epic_rollups.append({
+        "key": node,
+        "parent": hierarchy.parent.get(node),
+        "children": len(hierarchy.children[node]),
+        "items": r.items,
+        "done": r.done_items,
+        "complete": r.complete,
+        "first_active": r.started.isoformat() if r.started else None,
+        "last_done": r.last_done.isoformat() if r.last_done else None,
+        "lead_days": round(business_days_between(r.created, end), 2) if end and r.created else None,
+        "cycle_days": round(business_days_between(r.started, end), 2) if end and r.started else None,
+    })
+epic_rollups.sort(key=lambda e: (-e["done"], e["key"]))
+
+# ── Time per assignee and hand-offs ────────────────────────────────────────
+# Every issue in the raw changelogs (like the CFD), team calendar, closed
+# segments only.  Time held by nobody known is reported as unattributed.
+person_time = defaultdict(lambda: {"active_days": 0.0, "blocked_days": 0.0,
+                                   "issues": set(), "handoffs_out": 0, "handoffs_in": 0})
+unattributed_active = 0.0
+for key, segments in HOLDER_SEGMENTS.items():
+    for status, holder, start, end in segments:
+        if end is None or status not in ACTIVE_STATUSES:
+            continue
+        days = business_days_between(start, end)
+        if holder is None:
+            if status in WORK_STATUSES:
+                unattributed_active += days
+            continue
+        p = person_time[holder]
+        p["active_days" if status in WORK_STATUSES else "blocked_days"] += days
+        p["issues"].add(key)
+handoff_matrix = HandoffMatrix()
+for key, moves in HANDOFFS.items():
+    for giver, receiver, _when in moves:
+        handoff_matrix.add(giver, receiver)
+        person_time[giver]["handoffs_out"] += 1
+        person_time[receiver]["handoffs_in"] += 1
+assignee_time = sorted(
+    ({"name": name, "active_days": round(p["active_days"], 2),
+      "blocked_days": round(p["blocked_days"], 2), "issues": len(p["issues"]),
+      "handoffs_out": p["handoffs_out"], "handoffs_in": p["handoffs_in"]}
+     for name, p in person_time.items()),
+    key=lambda p: (-p["active_days"], p["name"]))
+
+# ── Sprint x team x status x SP cube ───────────────────────────────────────
+# Issues in the headline view (Done) plus open issues at their current status,
+# with mergeable measures per cell; every rollup is precomputed by build().
+CUBE_DIMS = ("sprint", "team", "status", "sp_bucket")
+cube = Cube(CUBE_DIMS)
+team_cycles, sp_bucket_cycles = defaultdict(list), defaultdict(list)
+for r in records:
+    cube.add((r.sprint, team_by_key.get(r.key, UNTAGGED_TEAM), "Done",
+              sp_bucket(sp_final_by_key.get(r.key))),
+             sp=sp_final_by_key.get(r.key),
+             cycle=r.cycle_days if r.has_cycle else None,
+             status_days={"ip": r.ip_days, "test": r.test_days,
+                          "pr": r.pr_days, "blocked": r.blocked_days})
+    if r.has_cycle:
+        team_cycles[team_by_key.get(r.key, UNTAGGED_TEAM)].append(r.cycle_days)
+        sp_bucket_cycles[sp_bucket(sp_final_by_key.get(r.key))].append(r.cycle_days)
+for key, v in open_issues.items():
+    cube.add((key_to_sprint.get(key, "Unknown"), team_by_key.get(key, UNTAGGED_TEAM),
+              v["status"], sp_bucket(sp_final_by_key.get(key))),
+             sp=sp_final_by_key.get(key))
+cube.build()
+CUBE_TEAMS = [t for t in TEAM_LABELS + [UNTAGGED_TEAM] if t in cube.members("team")]
+team_breakdown = {t: [cube.query(sprint=sp, team=t).n for sp in SPRINT_ORDER]
+                  for t in CUBE_TEAMS}
+
+def cube_summary(agg, cycles):
+    """Cube cell summary with median / p85 taken exactly from the cell's cycle
+    times, so the tables agree with percentile() elsewhere."""
+    cts = sorted(cycles)
+    return dict(agg.summary(),
+                cycle_median=round(safe_median(cts), 2) if cts else None,
+                cycle_p85=round(percentile(cts, 85), 2) if cts else None)
+
+team_summary = {t: cube_summary(cube.query(team=t), team_cycles[t]) for t in CUBE_TEAMS}
+sp_bucket_summary = {b: cube_summary(a, sp_bucket_cycles[b])
+                     for (b,), a in sorted(cube.rollup("sp_bucket").items())}
+
+# ── Cycle-time scatter: density grid and bounded sample ────────────────────
+# Points are ranked by (sprint, cycle time); x is that rank.  The page gets a
+# sprint x 1-day density grid inline and a stratified sample of at most
+# SCATTER_MAX_POINTS in a chunk, outliers (above P95, or auto-detected)
+# always included; a sprint's full points come from its sprint chunk when
+# the chart is zoomed into it.
+SCATTER_MAX_POINTS = 400
+SCATTER_BIN_DAYS = 1.0
+scatter_points = sorted((r for r in records if r.has_cycle),
+                        key=lambda r: (SPRINT_ORDER.index(r.sprint) if r.sprint in SPRINT_ORDER else 99,
+                                       r.cycle_days))
+_p95 = overall["cycle_p95"]
+
+def scatter_keep(r):
+    return r.cycle_days > _p95 or r.key in AUTO_OUTLIER_KEYS
+
+scatter_sample = [(i, scatter_points[i]) for i in stratified_sample(
+    scatter_points, SCATTER_MAX_POINTS,
+    stratum=lambda r: (r.sprint, int(r.cycle_days // SCATTER_BIN_DAYS)),
+    value=attrgetter("cycle_days"), keep=scatter_keep)]
+scatter_density = density_grid([(r.sprint, r.cycle_days) for r in scatter_points],
+                               SPRINT_ORDER, SCATTER_BIN_DAYS)
+scatter_offsets = {}                     # sprint -> [first x - 1, points, chunk]
+for i, r in enumerate(scatter_points):
+    scatter_offsets.setdefault(r.sprint, [i, 0, "sprints/" + chunk_name(r.sprint)])[1] += 1
 
 # ── Compute insights ────────────────────────────────────────────────────────
 insights = []
@@ -412,9 +968,9 @@ if overall["cycle_max"] and overall["cycle_min"]:
     )
 
 # 3. Blocked time
-blocked_issues = [r for r in records if r["blocked_days"] > 0.5]
+blocked_issues = [r for r in records if r.blocked_days > 0.5]
 if blocked_issues:
-    avg_blk = safe_mean([r["blocked_days"] for r in blocked_issues])
+    avg_blk = safe_mean([r.blocked_days for r in blocked_issues])
     insights.append(
         f"<strong>{len(blocked_issues)} issues</strong> spent more than half a day blocked. "
         f"Among those, the average blocked time was <strong>{round(avg_blk, 1)} days</strong>. "
@@ -430,7 +986,7 @@ if status_pct.get("In Testing", 0) > 30:
     )
 
 # 5. Backlog->Done skips
-skip_keys = [r["key"] for r in records if not r["has_cycle"]]
+skip_keys = [r.key for r in records if not r.has_cycle]
 if skip_keys:
     insights.append(
         f"{len(skip_keys)} issue(s) went directly from Backlog to Done without entering "
@@ -444,6 +1000,18 @@ early_medians = [sprint_data[s]["cycle_median"] for s in early_sprints
                  if sprint_data[s]["cycle_median"] is not None]
 late_medians  = [sprint_data[s]["cycle_median"] for s in late_sprints
                  if sprint_data[s]["cycle_median"] is not None]
+trend_ci = None
+_early_reps = [boot[s]["median"] for s in early_sprints if s in boot]
+_late_reps  = [boot[s]["median"] for s in late_sprints if s in boot]
+if _early_reps and _late_reps:
+    # Replicate-wise (late avg median - early avg median)
+    _diff_reps = [sum(l) / len(l) - sum(e) / len(e)
+                  for e, l in zip(zip(*_early_reps), zip(*_late_reps))]
+    trend_ci = [round(x, 2) for x in ci(_diff_reps)]
+    trend_ci_text = (f" The {CI_LEVEL}% bootstrap interval for the change is "
+                     f"{trend_ci[0]:+.1f} to {trend_ci[1]:+.1f} days"
+                     + (", so the difference is within sampling noise."
+                        if trend_ci[0] <= 0 <= trend_ci[1] else "."))
 if early_medians and late_medians:
     e_avg = safe_mean(early_medians)
     l_avg = safe_mean(late_medians)
@@ -453,6 +1021,7 @@ if early_medians and late_medians:
             f"Cycle times improved over time: the first 4 sprints averaged "
             f"{round(e_avg, 1)}-day median vs {round(l_avg, 1)} days in the last 4 "
             f"(~{int(pct_imp)}% improvement)."
+            + (trend_ci_text if trend_ci else "")
         )
     elif l_avg > e_avg:
         pct_deg = round((l_avg - e_avg) / e_avg * 100, 0)
@@ -460,6 +1029,7 @@ if early_medians and late_medians:
             f"Cycle times increased over time: the first 4 sprints averaged "
             f"{round(e_avg, 1)}-day median vs {round(l_avg, 1)} days in the last 4 "
             f"(~{int(pct_deg)}% increase). Investigate growing complexity or WIP limits."
+            + (trend_ci_text if trend_ci else "")
         )
 
 # 7. Throughput trend
@@ -477,8 +1047,8 @@ if early_thru and late_thru:
 # This captures how much of total lead time is spent in active statuses
 eff_ratios = []
 for r in records:
-    if r["has_cycle"] and r["lead_days"] and r["lead_days"] > 0:
-        eff_ratios.append(r["active_days"] / r["lead_days"] * 100)
+    if r.has_cycle and r.lead_days and r.lead_days > 0:
+        eff_ratios.append(r.active_days / r.lead_days * 100)
 if eff_ratios:
     med_eff = round(safe_median(eff_ratios), 0)
     insights.append(
@@ -503,31 +1073,109 @@ metrics = {
     "sprint_order": SPRINT_ORDER,
     "sprint_data": sprint_data,
     "histogram": histogram,
+    "histogram_strategy": HIST_STRATEGY,
+    "histogram_by_sprint": histogram_by_sprint,
     "status_totals": {k: round(v, 1) for k, v in status_totals.items()},
     "status_pct": status_pct,
-    "top_longest": [{"key": r["key"], "sprint": r["sprint"],
-                     "cycle_days": round(r["cycle_days"], 2),
-                     "ip": round(r["ip_days"], 2),
-                     "test": round(r["test_days"], 2),
-                     "blocked": round(r["blocked_days"], 2)}
+    "flagged_active_days": round(flagged_active_total, 1),
+    "flagged_active_issues": sum(1 for v in records.select("flagged_days", where="has_cycle") if v > 0),
+    "top_longest": [{"key": r.key, "sprint": r.sprint,
+                     "cycle_days": round(r.cycle_days, 2),
+                     "ip": round(r.ip_days, 2),
+                     "test": round(r.test_days, 2),
+                     "blocked": round(r.blocked_days, 2)}
                     for r in top_longest],
-    "top_blocked": [{"key": r["key"], "sprint": r["sprint"],
-                     "blocked_days": round(r["blocked_days"], 2),
-                     "cycle_days": round(r["cycle_days"], 2)}
+    "top_blocked": [{"key": r.key, "sprint": r.sprint,
+                     "blocked_days": round(r.blocked_days, 2),
+                     "cycle_days": round(r.cycle_days, 2)}
                     for r in top_blocked],
+    "forecast": forecast_data,
+    "cfd": cfd,
+    "sprint_windows": {sp: [d.isoformat() for d in SPRINT_INDEX.days[sp]] for sp in SPRINT_ORDER},
+    "story_points_source": {"changelog": SP_FROM_CHANGELOG,
+                            "sp_values_fallback": sum(1 for k in sp_final_by_key
+                                                      if not SP_HISTORY.get(k))},
+    "sprint_attribution": {
+        "method": SPRINT_ATTRIBUTION,
+        "reattributed": REATTRIBUTED,
+        "multi_sprint": sum(1 for m in SPRINT_MEMBERSHIP.values()
+                            if len({sp for sp, _a, _r in m}) > 1),
+    },
+    "wip_aging": wip_aging,
+    "hierarchy": {"linked_issues": len(HIERARCHY_LINKS),
+                  "nodes": len(epic_rollups), "roots": len(hierarchy.roots()),
+                  "complete": sum(1 for e in epic_rollups if e["complete"]),
+                  "top": epic_rollups[:EPIC_TOP_N]},
+    "scatter": {"points": len(scatter_points), "sampled": len(scatter_sample),
+                "max_points": SCATTER_MAX_POINTS,
+                "outliers_kept": sum(1 for _i, r in scatter_sample if scatter_keep(r)),
+                "density": scatter_density},
+    "cube": dict(cube.to_json(), team_breakdown=team_breakdown,
+                 teams=team_summary, sp_buckets=sp_bucket_summary),
+    "assignees": {"people": assignee_time,
+                  "unattributed_active_days": round(unattributed_active, 1),
+                  "handoff_matrix": handoff_matrix.to_json(),
+                  "top_handoffs": [{"from": a, "to": b, "count": n}
+                                   for a, b, n in handoff_matrix.top(15)]},
+    "aging_wip": {"as_of": AS_OF.isoformat(), "thresholds": aging_thresholds,
+                  "open_issues": len(open_issues), "wip_items": len(aging_wip),
+                  "bands": aging_bands, "oldest": aging_wip[:AGING_TOP_N]},
+    "bootstrap": {"resamples": N_RESAMPLES, "level": CI_LEVEL,
+                  "early_late_median_change_ci": trend_ci},
+    "leaderboards": {name: [{"key": r.key, "sprint": r.sprint,
+                             "value": round(getattr(r, field), 2),
+                             "cycle_days": round(r.cycle_days, 2) if r.has_cycle else None}
+                            for r in leaderboards[name]]
+                     for name, _title, _hdr, field in LEADERBOARDS},
     "insights": insights,
-    "all_issues": [{"key": r["key"], "sprint": r["sprint"],
-                    "cycle": round(r["cycle_days"], 2) if r["cycle_days"] else None,
-                    "ip": round(r["ip_days"], 2),
-                    "test": round(r["test_days"], 2),
-                    "pr": round(r["pr_days"], 2),
-                    "blocked": round(r["blocked_days"], 2),
-                    "backlog": round(r["backlog_days"], 2)}
-                   for r in sorted(records, key=lambda r: r["sprint"])],
+    "exclusions": exclusion_info,
+    "exclude_mask": EXCLUDE_MASK,
+    "what_if": what_if,
+    "outlier_candidates": [dict(c, manual=c["key"] in EXCLUDED_KEYS)
+                           for c in outlier_candidates[:50]],
 }
 
+# ── Detail chunks (loaded by the dashboard on demand) ───────────────────────
+# Per-issue, per-sprint, open-WIP and per-epic detail is kept out of both
+# the HTML and computed_metrics.json; see chunks.py.  The "issues" chunk has every record
+# with its exclusion bits (serve.py filters on them) and unrounded business
+# days, so serve.py's stats match this script's; sprint chunks follow
+# EXCLUDE_MASK like the rest of the page and are rounded for display.
+ISSUE_COLUMNS = ("key", "sprint", "team", "sp", "cycle", "ip", "test", "pr",
+                 "blocked", "flagged", "backlog", "rework", "excl")
+
+def issue_row(r, ndigits=2):
+    def rnd(v):
+        return v if ndigits is None else round(v, ndigits)
+    return (r.key, r.sprint, team_by_key.get(r.key, UNTAGGED_TEAM), sp_final_by_key.get(r.key),
+            rnd(r.cycle_days) if r.has_cycle else None,
+            rnd(r.ip_days), rnd(r.test_days), rnd(r.pr_days),
+            rnd(r.blocked_days), rnd(r.flagged_days), rnd(r.backlog_days),
+            r.rework, r.excl)
+
+AGING_COLUMNS = ("key", "sprint", "status", "work_type", "age", "percentile", "band")
+EPIC_COLUMNS = ("key", "parent", "children", "items", "done", "complete",
+                "first_active", "last_done", "lead_days", "cycle_days")
+
+chunk_writer = ChunkWriter(DATA_DIR, gzip_chunks=DASHBOARD_GZIP)
+chunk_writer.write("issues", table(ISSUE_COLUMNS, (
+    issue_row(r, ndigits=None) for r in sorted(all_records, key=lambda r: r.sprint))))
+for sp in SPRINT_ORDER:
+    chunk_writer.write("sprints/" + chunk_name(sp), table(
+        ISSUE_COLUMNS, map(issue_row, sorted(records_by_sprint.get(sp, []),
+                                             key=lambda r: -(r.cycle_days or 0)))))
+chunk_writer.write("what_if", what_if_detail_by_mask)
+chunk_writer.write("scatter", table(("x", "key", "sprint", "cycle", "outlier"), (
+    (i + 1, r.key, r.sprint, round(r.cycle_days, 2), int(scatter_keep(r)))
+    for i, r in scatter_sample)))
+chunk_writer.write("aging_wip", table(AGING_COLUMNS, (
+    [a[c] for c in AGING_COLUMNS] for a in aging_wip)))
+chunk_writer.write("hierarchy", table(EPIC_COLUMNS, (
+    [e[c] for c in EPIC_COLUMNS] for e in epic_rollups)))
+metrics["chunks"] = {"dir": os.path.basename(DATA_DIR), "files": chunk_writer.finish()}
+
 with open(METRICS_JSON, "w") as f:
-    json.dump(metrics, f, indent=2)
+    json.dump(metrics, f, separators=(",", ":"))
 print(f"Wrote {METRICS_JSON}")
 
 # ── Generate HTML Dashboard ──────────────────────────────────────────────────
@@ -535,6 +1183,8 @@ sprint_labels_js   = json.dumps([s.replace("BIP AI ", "") for s in SPRINT_ORDER]
 cycle_medians_js   = json.dumps([sprint_data[s]["cycle_median"] for s in SPRINT_ORDER])
 cycle_means_js     = json.dumps([sprint_data[s]["cycle_mean"] for s in SPRINT_ORDER])
 cycle_p85s_js      = json.dumps([sprint_data[s]["cycle_p85"] for s in SPRINT_ORDER])
+median_ci_lo_js    = json.dumps([(sprint_data[s]["cycle_median_ci"] or [None])[0] for s in SPRINT_ORDER])
+median_ci_hi_js    = json.dumps([(sprint_data[s]["cycle_median_ci"] or [None, None])[1] for s in SPRINT_ORDER])
 throughputs_js     = json.dumps([sprint_data[s]["throughput"] for s in SPRINT_ORDER])
 story_points_js    = json.dumps([sprint_data[s]["story_points"] for s in SPRINT_ORDER])
 avg_ip_js          = json.dumps([sprint_data[s]["avg_ip_days"] for s in SPRINT_ORDER])
@@ -543,33 +1193,127 @@ avg_pr_js          = json.dumps([sprint_data[s]["avg_pr_days"] for s in SPRINT_O
 avg_blk_js         = json.dumps([sprint_data[s]["avg_blocked_days"] for s in SPRINT_ORDER])
 hist_labels_js     = json.dumps([h["label"] for h in histogram])
 hist_counts_js     = json.dumps([h["count"] for h in histogram])
+hist_by_sprint_js  = json.dumps([histogram_by_sprint[s] for s in SPRINT_ORDER])
 status_labels_js   = json.dumps(list(status_pct.keys()))
 status_values_js   = json.dumps(list(status_pct.values()))
-
-# Scatter data: all issues with cycle time
-scatter_js = json.dumps([
-    {"x": i+1, "y": round(r["cycle_days"], 2), "key": r["key"], "sprint": r["sprint"]}
-    for i, r in enumerate(sorted(
-        [r for r in records if r["has_cycle"]],
-        key=lambda r: (SPRINT_ORDER.index(r["sprint"]) if r["sprint"] in SPRINT_ORDER else 99,
-                       r["cycle_days"])
-    ))
-])
+what_if_js         = json.dumps(what_if, separators=(",", ":"))
+exclusions_js      = json.dumps(exclusion_info)
+wip_aging_js       = json.dumps(wip_aging, separators=(",", ":"))
+aging_js           = json.dumps({"thresholds": aging_thresholds}, separators=(",", ":"))
+cfd_js             = json.dumps({k: cfd[k] for k in ("days", "states", "counts")},
+                                separators=(",", ":"))
+teams_js           = json.dumps(team_breakdown, separators=(",", ":"))
+scatter_meta_js    = json.dumps({"density": scatter_density, "offsets": scatter_offsets,
+                                 "points": len(scatter_points)}, separators=(",", ":"))
 
 # Top longest table rows
 longest_rows = ""
 for r in top_longest:
     longest_rows += f"""<tr>
-        <td>{r['key']}</td><td>{r['sprint'].replace('BIP AI ', '')}</td>
-        <td>{round(r['cycle_days'], 1)}</td><td>{round(r['ip_days'], 1)}</td>
-        <td>{round(r['test_days'], 1)}</td><td>{round(r['blocked_days'], 1)}</td>
+        <td>{r.key}</td><td>{r.sprint.replace('BIP AI ', '')}</td>
+        <td>{round(r.cycle_days, 1)}</td><td>{round(r.ip_days, 1)}</td>
+        <td>{round(r.test_days, 1)}</td><td>{round(r.blocked_days, 1)}</td>
     </tr>\n"""
 
 top_blocked_rows = ""
 for r in top_blocked:
     top_blocked_rows += f"""<tr>
-        <td>{r['key']}</td><td>{r['sprint'].replace('BIP AI ', '')}</td>
-        <td>{round(r['blocked_days'], 1)}</td><td>{round(r['cycle_days'], 1)}</td>
+        <td>{r.key}</td><td>{r.sprint.replace('BIP AI ', '')}</td>
+        <td>{round(r.blocked_days, 1)}</td><td>{round(r.cycle_days, 1)}</td>
+    </tr>\n"""
+
+# What-if exclusion toggles (checked = category excluded)
+excl_toggles_html = ""
+for ex in exclusion_info:
+    checked = " checked" if EXCLUDE_MASK & ex["bit"] else ""
+    excl_toggles_html += f"""<label class="toggle">
+        <input type="checkbox" class="excl-toggle" value="{ex['bit']}"{checked}>
+        {ex['label']} <span class="unit">({ex['count']})</span>
+    </label>\n"""
+
+# Additional leaderboards (longest/blocked have their own tables above)
+leaderboard_cards = ""
+for name, title, hdr, field in LEADERBOARDS[2:]:
+    rows = ""
+    for r in leaderboards[name]:
+        cyc = round(r.cycle_days, 1) if r.has_cycle else "&#8212;"
+        rows += f"""<tr>
+        <td>{r.key}</td><td>{r.sprint.replace('BIP AI ', '')}</td>
+        <td>{round(getattr(r, field), 1)}</td><td>{cyc}</td>
+    </tr>\n"""
+    leaderboard_cards += f"""<div class="card">
+    <h3>{title}</h3>
+    <table>
+      <thead><tr><th>Key</th><th>Sprint</th><th>{hdr}</th><th>Cycle (d)</th></tr></thead>
+      <tbody>{rows}</tbody>
+    </table>
+  </div>
+"""
+
+# Forecast tables
+forecast_sprint_rows = ""
+for f_ in forecast_data["by_sprints"]:
+    forecast_sprint_rows += f"""<tr><td>Next {f_['sprints']} sprint(s)</td>
+        <td>{f_['p85']}</td><td>{f_['p95']}</td></tr>\n"""
+for f_ in forecast_data["by_date"]:
+    forecast_sprint_rows += f"""<tr><td>By {f_['date']} ({f_['business_days']} business days)</td>
+        <td>{f_['p85']}</td><td>{f_['p95']}</td></tr>\n"""
+forecast_when_rows = ""
+for f_ in forecast_data["when_done"]:
+    forecast_when_rows += f"""<tr><td>{f_['items']}</td>
+        <td>{f_['sprints']['p85']}</td><td>{f_['sprints']['p95']}</td>
+        <td>{f_['business_days']['p85']}</td><td>{f_['business_days']['p95']}</td></tr>\n"""
+
+# Aging WIP table (oldest 25)
+AGING_BAND_COLORS = {"<P50": "var(--green)", "P50-P70": "var(--text)",
+                     "P70-P85": "var(--orange)", "P85-P95": "var(--red)", ">P95": "var(--red)"}
+aging_rows = ""
+for a in aging_wip[:AGING_TOP_N]:
+    aging_rows += f"""<tr>
+        <td>{a['key']}</td><td>{a['sprint'].replace('BIP AI ', '')}</td><td>{a['status']}</td>
+        <td>{a['age']}</td><td>{a['percentile']}</td>
+        <td style="color:{AGING_BAND_COLORS[a['band']]}">{a['band']}</td>
+    </tr>\n"""
+if not aging_rows:
+    aging_rows = f"""<tr><td colspan="6" style="color:var(--muted)">No open work in progress
+        in the current extract ({len(open_issues)} open issues, as of {AS_OF:%Y-%m-%d}).</td></tr>\n"""
+
+# Epic roll-ups (top EPIC_TOP_N by child throughput)
+epic_rows = ""
+for e in epic_rollups[:EPIC_TOP_N]:
+    lead, cyc = (("&mdash;" if v is None else v) for v in (e["lead_days"], e["cycle_days"]))
+    epic_rows += f"""<tr>
+        <td>{e['key']}</td><td>{e['parent'] or '&mdash;'}</td><td>{e['done']} / {e['items']}</td>
+        <td>{(e['first_active'] or '')[:10]}</td><td>{(e['last_done'] or '')[:10]}</td>
+        <td>{lead}</td><td>{cyc}</td>
+    </tr>\n"""
+
+# Time per assignee and most frequent hand-offs
+assignee_rows = ""
+for a in assignee_time[:15]:
+    assignee_rows += f"""<tr>
+        <td>{a['name']}</td><td>{a['active_days']}</td><td>{a['blocked_days']}</td>
+        <td>{a['issues']}</td><td>{a['handoffs_in']}</td><td>{a['handoffs_out']}</td>
+    </tr>\n"""
+handoff_rows = ""
+for a, b, n in handoff_matrix.top(15):
+    handoff_rows += f"<tr><td>{a}</td><td>{b}</td><td>{n}</td></tr>\n"
+
+# Per-team summary from the cube
+team_rows = ""
+for t, ts in team_summary.items():
+    team_rows += f"""<tr>
+        <td>{t}</td><td>{ts['items']}</td><td>{ts['story_points']:.0f}</td>
+        <td>{ts['cycle_median']}</td><td>{ts['cycle_p85']}</td><td>{ts['cycle_mean']}</td>
+    </tr>\n"""
+
+# Auto-detected outlier candidates (top 15)
+outlier_rows = ""
+for c in outlier_candidates[:15]:
+    manual = "&#10003;" if c["key"] in EXCLUDED_KEYS else ""
+    outlier_rows += f"""<tr>
+        <td>{c['key']}</td><td>{c['sprint'].replace('BIP AI ', '')}</td>
+        <td>{c['score']}</td><td>{manual}</td><td>{'<br>'.join(c['reasons'])}</td>
     </tr>\n"""
 
 insights_html = "\n".join(f'<li class="insight">{ins}</li>' for ins in insights)
@@ -579,18 +1323,29 @@ sprint_detail_rows = ""
 for sp in SPRINT_ORDER:
     sd = sprint_data[sp]
     label = sp.replace("BIP AI ", "")
-    sprint_detail_rows += f"""<tr>
-        <td>{label}</td>
+    median_ci = (f"<br><span class=\"unit\">{sd['cycle_median_ci'][0]}&ndash;{sd['cycle_median_ci'][1]}</span>"
+                 if sd["cycle_median_ci"] else "")
+    sp_committed = (f"<br><span class=\"unit\">{sd['story_points_committed']} committed</span>"
+                    if sd["story_points_committed"] != sd["story_points"] else "")
+    sprint_detail_rows += f"""<tr class="sprint-row" data-chunk="sprints/{chunk_name(sp)}">
+        <td>{label} <span class="unit">&#9656;</span></td>
         <td>{sd['throughput']}</td>
-        <td>{sd['story_points']}</td>
+        <td>{sd['story_points']}{sp_committed}</td>
         <td>{sd['sample_count']}</td>
-        <td>{sd['cycle_median'] if sd['cycle_median'] is not None else '&#8212;'}</td>
+        <td>{sd['cycle_median'] if sd['cycle_median'] is not None else '&#8212;'}{median_ci}</td>
         <td>{sd['cycle_mean'] if sd['cycle_mean'] is not None else '&#8212;'}</td>
         <td>{sd['cycle_p85'] if sd['cycle_p85'] is not None else '&#8212;'}</td>
         <td>{sd['avg_ip_days']}</td>
         <td>{sd['avg_test_days']}</td>
         <td>{sd['avg_pr_days']}</td>
         <td>{sd['avg_blocked_days']}</td>
+        <td>{sd['avg_flagged_active_days']}</td>
+        <td>{sd['committed']}</td>
+        <td>{sd['added_mid_sprint']}<br><span class="unit">{sd['sp_added_mid_sprint']:g} SP</span></td>
+        <td>{sd['removed_mid_sprint']}</td>
+        <td>{sd['carried_over']}</td>
+        <td>{sd['carried_in']}</td>
+        <td>{sd['scope_churn_pct'] if sd['scope_churn_pct'] is not None else '&#8212;'}</td>
     </tr>\n"""
 
 
@@ -650,6 +1405,12 @@ html = """<!DOCTYPE html>
   .insight:nth-child(6) { border-left-color: var(--green); }
   .insight:nth-child(7) { border-left-color: var(--teal); }
   .insight:nth-child(8) { border-left-color: var(--accent); }
+  .toggles { display: flex; gap: 18px; flex-wrap: wrap; margin-bottom: 14px; font-size: 0.85rem; }
+  .toggle { cursor: pointer; }
+  .toggle .unit { color: var(--muted); }
+  .sprint-row { cursor: pointer; }
+  .sprint-issues td { background: rgba(88,166,255,0.03); font-size: 0.8rem; }
+  .chunk-error { color: var(--muted); font-size: 0.8rem; margin-top: 8px; }
   @media (max-width: 900px) { .grid { grid-template-columns: 1fr; } }
 </style>
 </head>
@@ -658,7 +1419,9 @@ html = """<!DOCTYPE html>
 <h1>BIP AI &mdash; Cycle Time Dashboard</h1>
 <p class="subtitle">
   True cycle time (In Progress &rarr; Done) in business days (excl. weekends &amp; US holidays) &middot;
-  """ + str(overall['with_cycle']) + """ issues with Story Points across 17 sprints (FY25Q4.1 &ndash; FY26Q2.3)
+  """ + str(overall['with_cycle']) + """ issues with Story Points across 17 sprints (FY25Q4.1 &ndash; FY26Q2.3),
+  """ + ("attributed to the sprint in which they were done" if SPRINT_ATTRIBUTION == "done_window"
+        else "attributed to the first sprint they appeared in") + """
 </p>
 
 <!-- KPIs -->
@@ -685,6 +1448,32 @@ html = """<!DOCTYPE html>
   </div>
 </div>
 
+<!-- Live filters (shown when served by serve.py) -->
+<div class="card full" id="liveFilters" style="margin-bottom:24px;display:none">
+  <h3>Filters</h3>
+  <div class="toggles">
+    <label>From <select id="fSprintFrom"></select></label>
+    <label>To <select id="fSprintTo"></select></label>
+    <label>Team <select id="fTeam"><option value="">All</option></select></label>
+    <label>Story points <select id="fSp"><option value="">All</option></select></label>
+  </div>
+  <p class="subtitle" id="liveSummary" style="margin:0"></p>
+</div>
+
+<!-- What-if exclusions -->
+<div class="card full" style="margin-bottom:24px">
+  <h3>What-if Exclusions</h3>
+  <p class="subtitle" style="margin:0 0 12px">Toggles redraw the cycle-time trend, status and
+    histogram charts; throughput and story points count all delivered work and do not change.</p>
+  <div class="toggles">
+    """ + excl_toggles_html + """
+  </div>
+  <table>
+    <thead><tr><th>Metric</th><th>This View</th><th>Dashboard</th><th>&Delta;</th></tr></thead>
+    <tbody id="whatIfBody"></tbody>
+  </table>
+</div>
+
 <!-- Charts Row 1: Cycle Time Trend + Throughput -->
 <div class="grid">
   <div class="card">
@@ -706,6 +1495,9 @@ html = """<!DOCTYPE html>
   <div class="card">
     <h3>Time in Status (overall %)</h3>
     <canvas id="chartStatus"></canvas>
+    <p class="subtitle" style="margin:12px 0 0">Flagged as an impediment while in active work:
+      """ + f"{round(flagged_active_total, 1)}" + """ business days across
+      """ + str(metrics["flagged_active_issues"]) + """ issues (on top of Blocked status time).</p>
   </div>
 </div>
 
@@ -716,8 +1508,118 @@ html = """<!DOCTYPE html>
     <canvas id="chartStacked"></canvas>
   </div>
   <div class="card">
-    <h3>Cycle Time Scatter (all issues)</h3>
+    <h3>Cycle Time Scatter (""" + f"{len(scatter_sample)} of {len(scatter_points)}" + """ issues, all outliers)</h3>
     <canvas id="chartScatter"></canvas>
+    <p class="subtitle" style="margin:12px 0 0">Bubbles show density per sprint and day of cycle
+      time. Click a point to zoom into its sprint with every issue;
+      <a href="#" id="scatterReset">show all sprints</a>.</p>
+  </div>
+</div>
+
+<!-- Distribution drift -->
+<div class="card full" style="margin-bottom:24px">
+  <h3>Cycle Time Distribution by Sprint (% of issues per bucket)</h3>
+  <canvas id="chartHistDrift"></canvas>
+</div>
+
+<!-- Cumulative flow -->
+<div class="card full" style="margin-bottom:24px">
+  <h3>Cumulative Flow (all issues, daily)</h3>
+  <canvas id="chartCFD"></canvas>
+  <p class="subtitle" style="margin:12px 0 0">Little's law: average WIP """ + f"{littles_law['avg_wip']}" + """
+    vs throughput """ + f"{littles_law['throughput']}" + """/day &times; """ + f"{littles_law['avg_days_in_wip']}" + """ days in WIP
+    = """ + f"{littles_law['predicted_wip']}" + """ (ratio """ + f"{littles_law['ratio']}" + """).
+    Arrivals """ + f"{littles_law['arrival_rate']}" + """/day.</p>
+</div>
+
+<!-- WIP aging -->
+<div class="card full" style="margin-bottom:24px">
+  <h3>WIP Age at End of Each Week (business days)</h3>
+  <canvas id="chartWipAging"></canvas>
+</div>
+
+<!-- Aging WIP -->
+<div class="grid">
+  <div class="card">
+    <h3>Aging Work in Progress (business days vs historical cycle time)</h3>
+    <canvas id="chartAgingWip"></canvas>
+  </div>
+  <div class="card">
+    <h3>Oldest Open Items</h3>
+    <table>
+      <thead><tr><th>Key</th><th>Sprint</th><th>Status</th><th>Age (d)</th>
+        <th>Percentile</th><th>Band</th></tr></thead>
+      <tbody>""" + aging_rows + """</tbody>
+    </table>
+  </div>
+</div>
+
+<!-- Teams (cube) -->
+<div class="grid">
+  <div class="card">
+    <h3>Items per Sprint by Team</h3>
+    <canvas id="chartTeams"></canvas>
+  </div>
+  <div class="card">
+    <h3>Teams (from the sprint &times; team &times; status &times; SP cube)</h3>
+    <table>
+      <thead><tr><th>Team</th><th>Items</th><th>SP</th><th>Median (d)</th>
+        <th>P85 (d)</th><th>Mean (d)</th></tr></thead>
+      <tbody>""" + team_rows + """</tbody>
+    </table>
+    <p class="subtitle" style="margin:12px 0 0">Percentiles from mergeable sketches (&plusmn;1%).</p>
+  </div>
+</div>
+
+<!-- Epic roll-ups -->
+<div class="card full" style="margin-bottom:24px">
+  <h3>Epic Roll-ups (""" + f"{len(epic_rollups)} epics/parents, {len(HIERARCHY_LINKS)} linked issues" + """)</h3>
+  <p class="subtitle" style="margin:0 0 12px">Lead time from the earliest child created, cycle time
+    from the first child active, both to the last child done (business days; complete epics only).</p>
+  <table>
+    <thead><tr><th>Epic</th><th>Parent</th><th>Done / Items</th><th>First Active</th>
+      <th>Last Done</th><th>Lead (d)</th><th>Cycle (d)</th></tr></thead>
+    <tbody>""" + epic_rows + """</tbody>
+  </table>
+</div>
+
+<!-- Assignees -->
+<div class="grid">
+  <div class="card">
+    <h3>Active Time by Assignee (business days)</h3>
+    <p class="subtitle" style="margin:0 0 12px">Status time split by who held the issue;
+      """ + f"{unattributed_active:.0f}" + """ active days were held by no known assignee.</p>
+    <table>
+      <thead><tr><th>Assignee</th><th>Active</th><th>Blocked</th><th>Issues</th>
+        <th>Handed In</th><th>Handed Out</th></tr></thead>
+      <tbody>""" + assignee_rows + """</tbody>
+    </table>
+  </div>
+  <div class="card">
+    <h3>Most Frequent Hand-offs</h3>
+    <table>
+      <thead><tr><th>From</th><th>To</th><th>Count</th></tr></thead>
+      <tbody>""" + handoff_rows + """</tbody>
+    </table>
+  </div>
+</div>
+
+<!-- Forecast -->
+<div class="grid">
+  <div class="card">
+    <h3>Forecast: How Many Items? (Monte Carlo, """ + f"{forecast.N_SIMS:,}" + """ runs)</h3>
+    <table>
+      <thead><tr><th>Horizon</th><th>85% confident &ge;</th><th>95% confident &ge;</th></tr></thead>
+      <tbody>""" + forecast_sprint_rows + """</tbody>
+    </table>
+  </div>
+  <div class="card">
+    <h3>Forecast: When Will N Items Be Done?</h3>
+    <table>
+      <thead><tr><th>Items</th><th>Sprints (85%)</th><th>Sprints (95%)</th>
+        <th>Bus. days (85%)</th><th>Bus. days (95%)</th></tr></thead>
+      <tbody>""" + forecast_when_rows + """</tbody>
+    </table>
   </div>
 </div>
 
@@ -732,12 +1634,15 @@ html = """<!DOCTYPE html>
 <!-- Sprint Detail Table -->
 <div class="card full" style="margin-bottom:24px">
   <h3>Sprint Detail</h3>
+  <p class="subtitle" style="margin:0 0 12px">Click a sprint to list its issues.</p>
   <div style="overflow-x:auto">
   <table>
     <thead><tr>
       <th>Sprint</th><th>Throughput</th><th>Story Pts</th><th>Analyzed</th>
       <th>Median CT</th><th>Mean CT</th><th>P85 CT</th>
-      <th>Avg IP</th><th>Avg Test</th><th>Avg PR</th><th>Avg Blocked</th>
+      <th>Avg IP</th><th>Avg Test</th><th>Avg PR</th><th>Avg Blocked</th><th>Avg Flagged</th>
+      <th>Committed</th><th>Added</th><th>Removed</th><th>Carried Over</th><th>Carried In</th>
+      <th>Churn %</th>
     </tr></thead>
     <tbody>
       """ + sprint_detail_rows + """
@@ -764,11 +1669,29 @@ html = """<!DOCTYPE html>
   </div>
 </div>
 
+<!-- More leaderboards -->
+<div class="grid">
+  """ + leaderboard_cards + """
+</div>
+
+<!-- Outlier candidates -->
+<div class="card full" style="margin-bottom:24px">
+  <h3>Outlier Candidates (auto-detected)</h3>
+  <div style="overflow-x:auto">
+  <table>
+    <thead><tr><th>Key</th><th>Sprint</th><th>Score</th><th>Manual</th><th>Reasons</th></tr></thead>
+    <tbody>""" + outlier_rows + """</tbody>
+  </table>
+  </div>
+</div>
+
 <script>
 const sprintLabels = """ + sprint_labels_js + """;
 const cycleMedians = """ + cycle_medians_js + """;
 const cycleMeans   = """ + cycle_means_js + """;
 const cycleP85s    = """ + cycle_p85s_js + """;
+const medianCiLo   = """ + median_ci_lo_js + """;
+const medianCiHi   = """ + median_ci_hi_js + """;
 const throughputs  = """ + throughputs_js + """;
 const storyPoints  = """ + story_points_js + """;
 const avgIP        = """ + avg_ip_js + """;
@@ -777,16 +1700,117 @@ const avgPR        = """ + avg_pr_js + """;
 const avgBlocked   = """ + avg_blk_js + """;
 const histLabels   = """ + hist_labels_js + """;
 const histCounts   = """ + hist_counts_js + """;
+const histBySprint = """ + hist_by_sprint_js + """;
+const cfd          = """ + cfd_js + """;
+const teamsBySprint = """ + teams_js + """;
+const scatterMeta  = """ + scatter_meta_js + """;
+const wipAging     = """ + wip_aging_js + """;
+const agingWip     = """ + aging_js + """;
 const statusLabels = """ + status_labels_js + """;
 const statusValues = """ + status_values_js + """;
-const scatterData  = """ + scatter_js + """;
+const whatIf       = """ + what_if_js + """;
+const exclusions   = """ + exclusions_js + """;
+const excludeMask  = """ + str(EXCLUDE_MASK) + """;
+
+// === Detail chunks (dashboard_data/, fetched on first use) ===
+const DATA_DIR = '""" + os.path.basename(DATA_DIR) + """/';
+const chunkCache = {};
+function loadChunk(name) {
+  if (!chunkCache[name]) {
+    chunkCache[name] = fetch(DATA_DIR + name + '.json').then(r => {
+      if (!r.ok) throw new Error('HTTP ' + r.status);
+      return r.json();
+    });
+  }
+  return chunkCache[name];
+}
+function chunkRows(t) {
+  return t.rows.map(row => Object.fromEntries(t.columns.map((c, i) => [c, row[i]])));
+}
+function chunkError(el, err) {
+  el.insertAdjacentHTML('afterend', '<p class="chunk-error">Detail data not loaded (' +
+    err.message + '). Open the dashboard over HTTP, e.g. <code>python3 serve.py</code>.</p>');
+}
+function whenVisible(el, fn) {
+  if (!('IntersectionObserver' in window)) { fn(); return; }
+  const obs = new IntersectionObserver(entries => {
+    if (entries.some(e => e.isIntersecting)) { obs.disconnect(); fn(); }
+  }, { rootMargin: '200px' });
+  obs.observe(el);
+}
+
+// === Sprint detail: issue list per sprint ===
+document.querySelectorAll('.sprint-row').forEach(tr => tr.addEventListener('click', () => {
+  const open = tr.nextElementSibling;
+  if (open && open.classList.contains('sprint-issues')) { open.remove(); return; }
+  const cell = document.createElement('td');
+  cell.colSpan = tr.children.length;
+  cell.textContent = 'Loading\u2026';
+  const row = document.createElement('tr');
+  row.className = 'sprint-issues';
+  row.appendChild(cell);
+  tr.after(row);
+  loadChunk(tr.dataset.chunk).then(t => {
+    const fmt = v => v === null ? '&#8212;' : v;
+    cell.innerHTML = '<table><thead><tr>' +
+      ['Key', 'Team', 'SP', 'Cycle', 'IP', 'Test', 'PR', 'Blocked', 'Flagged', 'Rework']
+        .map(h => '<th>' + h + '</th>').join('') + '</tr></thead><tbody>' +
+      chunkRows(t).map(d => '<tr><td>' + [d.key, d.team, d.sp, d.cycle, d.ip, d.test, d.pr,
+        d.blocked, d.flagged, d.rework].map(fmt).join('</td><td>') + '</td></tr>').join('') +
+      '</tbody></table>';
+  }).catch(err => { cell.textContent = 'Detail data not loaded (' + err.message + ').'; });
+}));
+
+const charts = {};      // charts the what-if toggles and live filters redraw
+
+// === What-if exclusion toggles ===
+// Headline stats are inline; the per-sprint detail for every mask is the
+// "what_if" chunk, fetched the first time a toggle changes.  When the page is
+// served by serve.py the live filters take over the charts instead.
+function whatIfCharts(mask) {
+  if (document.getElementById('liveFilters').style.display !== 'none') return;
+  loadChunk('what_if').then(all => {
+    const d = all[mask], base = mask === excludeMask;
+    ['cycle_median', 'cycle_mean', 'cycle_p85'].forEach((k, i) => { charts.trend.data.datasets[i].data = d[k]; });
+    charts.trend.data.datasets[3].data = base ? medianCiHi : [];   // CIs exist for the dashboard mask only
+    charts.trend.data.datasets[4].data = base ? medianCiLo : [];
+    [0, 1, 2, 3].forEach(i => { charts.stacked.data.datasets[i].data = d.avg_status.map(a => a[i]); });
+    charts.status.data.datasets[0].data = d.status_pct;
+    charts.hist.data.datasets[0].data = d.hist;
+    charts.drift.data.datasets.forEach((ds, b) => {
+      ds.data = d.hist_by_sprint.map(counts => {
+        const n = counts.reduce((a, c) => a + c, 0);
+        return n ? Math.round(counts[b] / n * 1000) / 10 : 0;
+      });
+    });
+    [charts.trend, charts.stacked, charts.status, charts.hist, charts.drift].forEach(c => c.update());
+  }).catch(err => chunkError(document.getElementById('whatIfBody').closest('table'), err));
+}
+function renderWhatIf() {
+  let mask = 0;
+  document.querySelectorAll('.excl-toggle').forEach(cb => { if (cb.checked) mask |= +cb.value; });
+  const view = whatIf[mask], base = whatIf[excludeMask];
+  const rows = [['Issues', 'sample_size'], ['With cycle time', 'with_cycle'],
+                ['Median CT', 'cycle_median'], ['Mean CT', 'cycle_mean'],
+                ['P85 CT', 'cycle_p85'], ['P95 CT', 'cycle_p95']];
+  document.getElementById('whatIfBody').innerHTML = rows.map(([label, k]) => {
+    const v = view[k], b = base[k];
+    const d = (v === null || b === null) ? '&#8212;' : Math.round((v - b) * 100) / 100;
+    return '<tr><td>' + label + '</td><td>' + (v === null ? '&#8212;' : v) + '</td><td>' +
+           (b === null ? '&#8212;' : b) + '</td><td>' + d + '</td></tr>';
+  }).join('');
+  return mask;
+}
+document.querySelectorAll('.excl-toggle').forEach(cb => cb.addEventListener('change',
+  () => whatIfCharts(renderWhatIf())));
+renderWhatIf();
 
 Chart.defaults.color = '#8b949e';
 Chart.defaults.borderColor = '#30363d';
 Chart.defaults.font.family = "-apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial";
 
 // === Cycle Time Trend ===
-new Chart(document.getElementById('chartTrend'), {
+charts.trend = new Chart(document.getElementById('chartTrend'), {
   type: 'line',
   data: {
     labels: sprintLabels,
@@ -797,11 +1821,17 @@ new Chart(document.getElementById('chartTrend'), {
         tension: 0.3, pointRadius: 3, borderWidth: 2, fill: false, spanGaps: true },
       { label: 'P85', data: cycleP85s, borderColor: '#f85149', borderDash: [2,4],
         tension: 0.3, pointRadius: 3, borderWidth: 1.5, fill: false, spanGaps: true },
+      { label: 'Median """ + str(CI_LEVEL) + """% CI', data: medianCiHi, borderColor: 'rgba(88,166,255,0.25)',
+        backgroundColor: 'rgba(88,166,255,0.12)', pointRadius: 0, borderWidth: 1, tension: 0.3,
+        fill: '+1', spanGaps: true },
+      { label: 'Median CI low', data: medianCiLo, borderColor: 'rgba(88,166,255,0.25)',
+        pointRadius: 0, borderWidth: 1, tension: 0.3, fill: false, spanGaps: true },
     ]
   },
   options: {
     responsive: true,
-    plugins: { legend: { position: 'top', labels: { boxWidth: 14, padding: 12 } } },
+    plugins: { legend: { position: 'top', labels: { boxWidth: 14, padding: 12,
+                 filter: item => item.text !== 'Median CI low' } } },
     scales: {
       x: { ticks: { maxRotation: 45, font: { size: 10 } } },
       y: { title: { display: true, text: 'Days' }, beginAtZero: true }
@@ -810,7 +1840,7 @@ new Chart(document.getElementById('chartTrend'), {
 });
 
 // === Throughput ===
-new Chart(document.getElementById('chartThru'), {
+charts.thru = new Chart(document.getElementById('chartThru'), {
   type: 'bar',
   data: {
     labels: sprintLabels,
@@ -834,7 +1864,7 @@ new Chart(document.getElementById('chartThru'), {
 });
 
 // === Histogram ===
-new Chart(document.getElementById('chartHist'), {
+charts.hist = new Chart(document.getElementById('chartHist'), {
   type: 'bar',
   data: {
     labels: histLabels,
@@ -848,8 +1878,130 @@ new Chart(document.getElementById('chartHist'), {
   }
 });
 
+// === Distribution drift (per-sprint histograms, normalised) ===
+// One colour per bin (the log / fd strategies produce more than a fixed
+// palette holds): green for the shortest bucket through to red for the longest.
+const driftColors = histLabels.map((_, b) =>
+  'hsl(' + Math.round(140 * (1 - b / Math.max(histLabels.length - 1, 1))) + ', 62%, 52%)');
+charts.drift = new Chart(document.getElementById('chartHistDrift'), {
+  type: 'bar',
+  data: {
+    labels: sprintLabels,
+    datasets: histLabels.map((label, b) => ({
+      label: label,
+      data: histBySprint.map(counts => {
+        const n = counts.reduce((a, c) => a + c, 0);
+        return n ? Math.round(counts[b] / n * 1000) / 10 : 0;
+      }),
+      backgroundColor: driftColors[b],
+    }))
+  },
+  options: {
+    responsive: true,
+    plugins: { legend: { position: 'top', labels: { boxWidth: 14, padding: 12 } },
+               tooltip: { callbacks: { label: ctx => ctx.dataset.label + ': ' + ctx.parsed.y + '%' } } },
+    scales: {
+      x: { stacked: true, ticks: { maxRotation: 45, font: { size: 10 } } },
+      y: { stacked: true, max: 100, title: { display: true, text: '% of issues' }, beginAtZero: true }
+    }
+  }
+});
+
+// === Cumulative flow (stacked areas, Done at the bottom) ===
+const cfdColors = {
+  'Done': '#3fb950', 'Canceled': '#6e7681', 'In Testing': '#bc8cff',
+  'Peer Review Needed': '#d29922', 'Blocked': '#f85149', 'In Progress': '#58a6ff',
+  'Ready for Dev': '#39c5cf', 'Backlog': '#30363d'
+};
+new Chart(document.getElementById('chartCFD'), {
+  type: 'line',
+  data: {
+    labels: cfd.days,
+    datasets: cfd.states.map(s => ({
+      label: s, data: cfd.counts[s], fill: true, pointRadius: 0, borderWidth: 1,
+      borderColor: cfdColors[s], backgroundColor: cfdColors[s] + 'b3'
+    }))
+  },
+  options: {
+    responsive: true,
+    interaction: { mode: 'index', intersect: false },
+    plugins: { legend: { position: 'top', labels: { boxWidth: 14, padding: 12 } } },
+    scales: {
+      x: { ticks: { maxTicksLimit: 16, font: { size: 10 } } },
+      y: { stacked: true, title: { display: true, text: 'Issues' }, beginAtZero: true }
+    }
+  }
+});
+
+// === WIP aging snapshots ===
+new Chart(document.getElementById('chartWipAging'), {
+  type: 'bar',
+  data: {
+    labels: wipAging.map(w => w.date),
+    datasets: [
+      { type: 'line', label: 'Median WIP age', data: wipAging.map(w => w.age_median),
+        borderColor: '#58a6ff', backgroundColor: '#58a6ff', tension: 0.2, yAxisID: 'y' },
+      { type: 'line', label: 'P85 WIP age', data: wipAging.map(w => w.age_p85),
+        borderColor: '#f0883e', backgroundColor: '#f0883e', tension: 0.2, yAxisID: 'y' },
+      { type: 'line', label: 'Cycle time P85', data: wipAging.map(() => """ + f"{overall['cycle_p85']}" + """),
+        borderColor: '#f85149', borderDash: [6, 4], pointRadius: 0, yAxisID: 'y' },
+      { label: 'Items in WIP', data: wipAging.map(w => w.wip),
+        backgroundColor: 'rgba(139,148,158,0.35)', yAxisID: 'y1' }
+    ]
+  },
+  options: {
+    responsive: true,
+    interaction: { mode: 'index', intersect: false },
+    plugins: {
+      legend: { position: 'top', labels: { boxWidth: 14, padding: 12 } },
+      tooltip: { callbacks: { afterBody: items => {
+        const w = wipAging[items[0].dataIndex];
+        return w.oldest ? 'Oldest: ' + w.oldest.key + ' (' + w.oldest.age + 'd)' : '';
+      } } }
+    },
+    scales: {
+      x: { ticks: { maxRotation: 45, font: { size: 10 } } },
+      y: { position: 'left', title: { display: true, text: 'Business days' }, beginAtZero: true },
+      y1: { position: 'right', title: { display: true, text: 'Items' }, beginAtZero: true,
+            grid: { drawOnChartArea: false } }
+    }
+  }
+});
+
+// === Aging WIP (one column per WIP status, percentile lines across) ===
+// Every open item is in the "aging_wip" chunk; the table shows the oldest.
+const agingCols = ['In Progress', 'Peer Review Needed', 'In Testing', 'Blocked'];
+const agingLineColors = { 50: '#3fb950', 70: '#d29922', 85: '#f0883e', 95: '#f85149' };
+const agingCanvas = document.getElementById('chartAgingWip');
+whenVisible(agingCanvas, () => loadChunk('aging_wip').then(t => new Chart(agingCanvas, {
+  type: 'scatter',
+  data: {
+    datasets: [
+      { label: 'Open items', backgroundColor: 'rgba(88,166,255,0.8)', pointRadius: 5,
+        data: chunkRows(t).map((a, i) => ({
+          x: agingCols.indexOf(a.status) + ((i % 7) - 3) * 0.05, y: a.age, key: a.key })) },
+      ...Object.entries(agingWip.thresholds).map(([p, v]) => ({
+        type: 'line', label: 'P' + p + ' (' + v + 'd)', data: [{ x: -0.5, y: v }, { x: 3.5, y: v }],
+        borderColor: agingLineColors[p], borderDash: [6, 4], pointRadius: 0, borderWidth: 1.5 }))
+    ]
+  },
+  options: {
+    responsive: true,
+    plugins: {
+      legend: { position: 'top', labels: { boxWidth: 14, padding: 12 } },
+      tooltip: { callbacks: { label: ctx => ctx.raw.key
+        ? ctx.raw.key + ': ' + ctx.raw.y + 'd' : ctx.dataset.label } }
+    },
+    scales: {
+      x: { type: 'linear', min: -0.5, max: 3.5,
+           ticks: { stepSize: 1, callback: v => agingCols[v] || '' } },
+      y: { title: { display: true, text: 'Age (business days)' }, beginAtZero: true }
+    }
+  }
+})).catch(err => chunkError(agingCanvas, err)));
+
 // === Status Pie ===
-new Chart(document.getElementById('chartStatus'), {
+charts.status = new Chart(document.getElementById('chartStatus'), {
   type: 'doughnut',
   data: {
     labels: statusLabels,
@@ -869,7 +2021,7 @@ new Chart(document.getElementById('chartStatus'), {
 });
 
 // === Stacked Status by Sprint ===
-new Chart(document.getElementById('chartStacked'), {
+charts.stacked = new Chart(document.getElementById('chartStacked'), {
   type: 'bar',
   data: {
     labels: sprintLabels,
@@ -890,37 +2042,152 @@ new Chart(document.getElementById('chartStacked'), {
   }
 });
 
-// === Scatter Plot ===
-new Chart(document.getElementById('chartScatter'), {
-  type: 'scatter',
+// === Items per sprint by team ===
+const teamColors = ['rgba(88,166,255,0.7)', 'rgba(63,185,80,0.7)', 'rgba(210,153,34,0.7)',
+                    'rgba(188,140,255,0.7)', 'rgba(248,81,73,0.7)', 'rgba(139,148,158,0.7)',
+                    'rgba(139,148,158,0.4)'];
+new Chart(document.getElementById('chartTeams'), {
+  type: 'bar',
   data: {
-    datasets: [{
-      label: 'Cycle Time',
-      data: scatterData.map(d => ({ x: d.x, y: d.y })),
-      backgroundColor: 'rgba(88,166,255,0.5)',
-      pointRadius: 4,
-      pointHoverRadius: 7,
-    }]
+    labels: sprintLabels,
+    datasets: Object.keys(teamsBySprint).map((t, i) => ({
+      label: t, data: teamsBySprint[t], backgroundColor: teamColors[i % teamColors.length]
+    }))
   },
   options: {
     responsive: true,
-    plugins: {
-      legend: { display: false },
-      tooltip: {
-        callbacks: {
-          label: function(ctx) {
-            const d = scatterData[ctx.dataIndex];
-            return d.key + ' (' + d.sprint.replace('BIP AI ','') + '): ' + d.y + ' days';
-          }
-        }
-      }
-    },
+    plugins: { legend: { position: 'top', labels: { boxWidth: 14, padding: 12 } } },
     scales: {
-      x: { title: { display: true, text: 'Issue #' }, ticks: { display: false } },
-      y: { title: { display: true, text: 'Cycle Time (days)' }, beginAtZero: true }
+      x: { stacked: true, ticks: { maxRotation: 45, font: { size: 10 } } },
+      y: { stacked: true, title: { display: true, text: 'Issues' }, beginAtZero: true }
     }
   }
 });
+
+// === Scatter Plot: density bubbles + sampled points, full detail on zoom ===
+const scatterCanvas = document.getElementById('chartScatter');
+function densityBubbles() {
+  const d = scatterMeta.density, maxC = Math.max(1, ...d.counts.flat()), out = [];
+  const step = d.edges.length > 1 ? d.edges[1] - d.edges[0] : 1;
+  d.groups.forEach((g, gi) => {
+    const off = scatterMeta.offsets[g];
+    if (!off) return;
+    d.counts[gi].forEach((c, bi) => {
+      if (c) out.push({ x: off[0] + off[1] / 2, y: d.edges[bi] + step / 2, r: 3 + 14 * Math.sqrt(c / maxC), n: c });
+    });
+  });
+  return out;
+}
+whenVisible(scatterCanvas, () => loadChunk('scatter').then(t => {
+  const sample = chunkRows(t).map(d => ({ x: d.x, y: d.cycle, key: d.key, sprint: d.sprint, outlier: d.outlier }));
+  const chart = new Chart(scatterCanvas, {
+    type: 'scatter',
+    data: {
+      datasets: [{
+        type: 'bubble',
+        label: 'Density',
+        data: densityBubbles(),
+        backgroundColor: 'rgba(139,148,158,0.15)',
+        borderWidth: 0,
+      }, {
+        label: 'Cycle Time',
+        data: sample,
+        backgroundColor: sample.map(d => d.outlier ? 'rgba(248,81,73,0.6)' : 'rgba(88,166,255,0.5)'),
+        pointRadius: 4,
+        pointHoverRadius: 7,
+      }]
+    },
+    options: {
+      responsive: true,
+      plugins: {
+        legend: { display: false },
+        tooltip: {
+          callbacks: {
+            label: function(ctx) {
+              const d = ctx.raw;
+              if (ctx.dataset.type === 'bubble') return d.n + ' issues, ~' + d.y + ' days';
+              return d.key + ' (' + d.sprint.replace('BIP AI ','') + '): ' + d.y + ' days';
+            }
+          }
+        }
+      },
+      scales: {
+        x: { title: { display: true, text: 'Issue # (by sprint, then cycle time)' }, ticks: { display: false } },
+        y: { title: { display: true, text: 'Cycle Time (days)' }, beginAtZero: true }
+      },
+      onClick: (evt, els) => {
+        const el = els.find(e => e.datasetIndex === 1);
+        if (!el) return;
+        const sprint = sample[el.index].sprint, off = scatterMeta.offsets[sprint];
+        loadChunk(off[2]).then(st => {
+          const pts = chunkRows(st).filter(d => d.cycle !== null).sort((a, b) => a.cycle - b.cycle)
+            .map((d, i) => ({ x: off[0] + i + 1, y: d.cycle, key: d.key, sprint: sprint }));
+          const ds = chart.data.datasets[1];
+          ds.data = pts;
+          ds.backgroundColor = 'rgba(88,166,255,0.6)';
+          chart.options.scales.x.min = off[0] + 0.5;
+          chart.options.scales.x.max = off[0] + off[1] + 0.5;
+          chart.update();
+        }).catch(err => chunkError(scatterCanvas, err));
+      }
+    }
+  });
+  document.getElementById('scatterReset').addEventListener('click', e => {
+    e.preventDefault();
+    const ds = chart.data.datasets[1];
+    ds.data = sample;
+    ds.backgroundColor = sample.map(d => d.outlier ? 'rgba(248,81,73,0.6)' : 'rgba(88,166,255,0.5)');
+    delete chart.options.scales.x.min;
+    delete chart.options.scales.x.max;
+    chart.update();
+  });
+}).catch(err => chunkError(scatterCanvas, err)));
+
+// === Live filters: query serve.py's API (hidden when opened as a file) ===
+function applyFilters() {
+  const q = new URLSearchParams();
+  const val = id => document.getElementById(id).value;
+  q.set('sprint_from', val('fSprintFrom'));
+  q.set('sprint_to', val('fSprintTo'));
+  if (val('fTeam')) q.set('team', val('fTeam'));
+  if (val('fSp')) q.set('sp', val('fSp'));
+  let mask = 0;
+  document.querySelectorAll('.excl-toggle').forEach(cb => { if (cb.checked) mask |= +cb.value; });
+  q.set('exclude', mask);
+  fetch('/api/metrics?' + q).then(r => r.ok ? r.json() : Promise.reject(new Error('HTTP ' + r.status)))
+    .then(m => {
+      const labels = m.sprints.map(s => s.sprint.replace('BIP AI ', ''));
+      const col = k => m.sprints.map(s => s[k]);
+      charts.trend.data.labels = labels;
+      ['cycle_median', 'cycle_mean', 'cycle_p85'].forEach((k, i) => { charts.trend.data.datasets[i].data = col(k); });
+      charts.trend.data.datasets[3].data = [];     // bootstrap CIs are only precomputed
+      charts.trend.data.datasets[4].data = [];
+      charts.thru.data.labels = labels;
+      charts.thru.data.datasets[0].data = col('issues');
+      charts.thru.data.datasets[1].data = col('story_points');
+      charts.stacked.data.labels = labels;
+      ['avg_ip_days', 'avg_test_days', 'avg_pr_days', 'avg_blocked_days']
+        .forEach((k, i) => { charts.stacked.data.datasets[i].data = col(k); });
+      charts.status.data.datasets[0].data = Object.values(m.status_pct);
+      Object.values(charts).forEach(c => c.update());
+      const o = m.overall;
+      document.getElementById('liveSummary').textContent = o.sample_size + ' issues, ' +
+        o.story_points + ' SP \u00b7 median ' + o.cycle_median + 'd \u00b7 P85 ' + o.cycle_p85 +
+        'd \u00b7 P95 ' + o.cycle_p95 + 'd (throughput shows analyzed issues while filtering)';
+    }).catch(err => { document.getElementById('liveSummary').textContent = 'Query failed: ' + err.message; });
+}
+fetch('/api/meta').then(r => r.ok ? r.json() : Promise.reject()).then(meta => {
+  const opts = (el, values, label) => values.forEach(v => el.add(new Option(label ? label(v) : v, v)));
+  const short = s => s.replace('BIP AI ', '');
+  opts(document.getElementById('fSprintFrom'), meta.sprints, short);
+  opts(document.getElementById('fSprintTo'), meta.sprints, short);
+  document.getElementById('fSprintTo').value = meta.sprints[meta.sprints.length - 1];
+  opts(document.getElementById('fTeam'), meta.teams);
+  opts(document.getElementById('fSp'), meta.sp_buckets);
+  document.getElementById('liveFilters').style.display = '';
+  document.querySelectorAll('#liveFilters select, .excl-toggle')
+    .forEach(el => el.addEventListener('change', applyFilters));
+}).catch(() => {});
 </script>
 
 <p style="color:var(--muted);text-align:center;margin-top:32px;font-size:0.8rem">
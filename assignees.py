@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Per-assignee time attribution from the assignee changelog.
+
+holder_intervals() turns an issue's assignee changes into (assignee, start,
+end) intervals, the same shape as flow.status_intervals(); most issues log
+no assignee change, and their current assignee holds them throughout.  split_by_holder()
+merge-joins the two timelines of one issue: both are sorted and cover the
+issue's whole life, so one two-pointer walk yields every (status, assignee)
+segment in O(S + A).
+
+Hand-offs (A -> B, skipping unassigned gaps) go into HandoffMatrix, a
+sparse people x people count matrix: counts accumulate in a dict of
+(from id, to id) and are exported in CSR form (row pointers, column
+indices, counts) with only the non-zero cells.
+"""
+from array import array
+
+from flow import status_intervals
+
+
+def holder_intervals(created, changes, current=None):
+    """[(assignee, start, end)] from assignee changes; assignee None = unassigned.
+
+    `current` is the issue's assignee today (sprint index): with no change
+    logged it held the issue from creation.  Otherwise the first change's
+    from value is the initial holder - an empty one means the issue really
+    was unassigned, so `current` is not used there (it would invent a
+    hand-off back to whoever holds the issue now)."""
+    if not changes:
+        return [(current, created, None)]
+    return status_intervals(created, changes, initial=None)
+
+
+def split_by_holder(statuses, holders):
+    """[(status, holder, start, end)] segments of two interval timelines.
+
+    Both inputs are sorted, contiguous (start, end) runs ending in an open
+    (None) interval; segments of zero length are dropped."""
+    out = []
+    i = j = 0
+    while i < len(statuses) and j < len(holders):
+        status, s_start, s_end = statuses[i]
+        holder, h_start, h_end = holders[j]
+        start = max(s_start, h_start)
+        end = s_end if h_end is None else h_end if s_end is None else min(s_end, h_end)
+        if end is None or start < end:
+            out.append((status, holder, start, end))
+        if h_end is None or (s_end is not None and s_end <= h_end):
+            i += 1
+        else:
+            j += 1
+    return out
+
+
+def handoffs(holders):
+    """[(from, to, when)] between consecutive named assignees."""
+    out = []
+    last = None
+    for holder, start, _end in holders:
+        if holder is None:
+            continue
+        if last is not None and holder != last:
+            out.append((last, holder, start))
+        last = holder
+    return out
+
+
+class HandoffMatrix:
+    """Sparse hand-off counts between people, interned to dense ids."""
+
+    def __init__(self):
+        self.people = []
+        self._ids = {}
+        self._cells = {}        # (from id, to id) -> count
+
+    def person(self, name):
+        i = self._ids.get(name)
+        if i is None:
+            i = self._ids[name] = len(self.people)
+            self.people.append(name)
+        return i
+
+    def add(self, giver, receiver, n=1):
+        cell = (self.person(giver), self.person(receiver))
+        self._cells[cell] = self._cells.get(cell, 0) + n
+
+    def __len__(self):
+        return len(self._cells)
+
+    def to_csr(self):
+        """(indptr, indices, counts) arrays; row r spans indptr[r]:indptr[r + 1]."""
+        indptr = array("i", [0] * (len(self.people) + 1))
+        indices, counts = array("i"), array("i")
+        for (r, c), n in sorted(self._cells.items()):
+            indices.append(c)
+            counts.append(n)
+            indptr[r + 1] += 1
+        for r in range(len(self.people)):
+            indptr[r + 1] += indptr[r]
+        return indptr, indices, counts
+
+    def top(self, k=10):
+        """[(from, to, count)] of the k most frequent hand-offs."""
+        cells = sorted(self._cells.items(), key=lambda kv: (-kv[1], kv[0]))[:k]
+        return [(self.people[r], self.people[c], n) for (r, c), n in cells]
+
+    def to_json(self):
+        indptr, indices, counts = self.to_csr()
+        return {"people": self.people, "indptr": list(indptr),
+                "indices": list(indices), "counts": list(counts)}
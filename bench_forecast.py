@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the forecast against the naive per-simulation loop, using the
+per-sprint and per-business-day throughput recorded in computed_metrics.json.
+
+"how many" runs the batched, block-drawn simulation; "when" uses the exact
+convolved completion distribution (no simulation).  Both are compared with
+the naive loop at n_sims simulations.
+
+Usage: python3 bench_forecast.py [n_sims]
+"""
+import json, os, sys, time, random
+
+import forecast
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+QUANTILES = (5, 50, 95)
+
+
+def timed(fn, *args, **kw):
+    t0 = time.perf_counter()
+    out = fn(*args, **kw)
+    return out, time.perf_counter() - t0
+
+
+def _pick(sorted_vals):
+    n = len(sorted_vals)
+    return [sorted_vals[int(q / 100 * (n - 1))] for q in QUANTILES]
+
+
+def main():
+    n_sims = int(sys.argv[1]) if len(sys.argv) > 1 else forecast.N_SIMS
+    with open(os.path.join(BASE, "computed_metrics.json")) as f:
+        metrics = json.load(f)
+    sprints = [metrics["sprint_data"][s]["throughput"] for s in metrics["sprint_order"]]
+    days = metrics["forecast"]["daily_samples"]
+    horizon, day_horizon = 6, 65
+    target = 4 * round(sum(sprints) / len(sprints))
+    day_target = 400
+
+    def how_many(samples, h):
+        return lambda: _pick(forecast.simulate_totals(samples, h, n_sims, random.Random(1)))
+
+    def how_many_naive(samples, h):
+        return lambda: _pick(forecast.simulate_totals_naive(samples, h, n_sims, random.Random(1)))
+
+    def when(samples, t):
+        return lambda: list(forecast.when_done(samples, t, confidences=QUANTILES).values())
+
+    def when_naive(samples, t):
+        return lambda: _pick(forecast.simulate_completion_naive(samples, t, n_sims,
+                                                                random.Random(1)))
+
+    cases = [
+        (f"how many in {horizon} sprints", how_many(sprints, horizon),
+         how_many_naive(sprints, horizon)),
+        (f"when will {target} be done", when(sprints, target), when_naive(sprints, target)),
+        (f"how many in {day_horizon} days", how_many(days, day_horizon),
+         how_many_naive(days, day_horizon)),
+        (f"when will {day_target} be done (days)", when(days, day_target),
+         when_naive(days, day_target)),
+    ]
+    print(f"{n_sims:,} simulations, {len(sprints)} sprint / {len(days)} daily samples\n")
+    for label, fast, naive in cases:
+        fast_out, t_fast = timed(fast)
+        naive_out, t_naive = timed(naive)
+        # Same distribution, different draws: compare a few quantiles.
+        print(f"{label:34s} fast {t_fast * 1000:7.1f} ms   "
+              f"naive {t_naive * 1000:7.1f} ms   "
+              f"speedup {t_naive / t_fast:5.1f}x")
+        print(f"{'':34s} P5/P50/P95 fast {fast_out}  naive {naive_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Bootstrap confidence intervals for per-group (per-sprint) statistics.
+
+bootstrap_groups() draws the resamples for ALL groups up front (one
+random.choices() call per group, B resamples at once), sorts each resample
+once, and evaluates every statistic on the sorted resamples.  It returns
+the replicate values so callers can build further comparisons (e.g. early
+vs late sprints) from the same resamples without drawing again.
+"""
+import math, random
+
+N_RESAMPLES = 2000
+CI_LEVEL = 95
+
+
+def _pct(sorted_vals, p):
+    """p-th percentile (0-100), linear interpolation, of a sorted list."""
+    k = (p / 100) * (len(sorted_vals) - 1)
+    f, c = math.floor(k), math.ceil(k)
+    if f == c:
+        return sorted_vals[f]
+    return sorted_vals[f] * (c - k) + sorted_vals[c] * (k - f)
+
+STATS = {
+    "median": lambda s: _pct(s, 50),
+    "mean":   lambda s: sum(s) / len(s),
+    "p85":    lambda s: _pct(s, 85),
+}
+
+
+def bootstrap_groups(groups, stats=STATS, n_resamples=N_RESAMPLES, rng=random):
+    """{group: {stat: [replicate values]}} for every non-empty group."""
+    out = {}
+    for name, values in groups.items():
+        n = len(values)
+        if not n:
+            continue
+        draws = rng.choices(values, k=n * n_resamples)
+        resamples = [sorted(draws[i:i + n]) for i in range(0, n * n_resamples, n)]
+        out[name] = {stat: list(map(fn, resamples)) for stat, fn in stats.items()}
+    return out
+
+
+def ci(replicates, level=CI_LEVEL):
+    """Percentile interval [lo, hi] of a list of bootstrap replicates."""
+    s = sorted(replicates)
+    tail = (100 - level) / 2
+    return [_pct(s, tail), _pct(s, 100 - tail)]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Business time between timestamps via a minute-resolution prefix sum.
+
+BusinessCalendar lays the calendar out as one slot per local wall-clock
+minute (1 = working minute, 0 = night / weekend / holiday) and keeps the
+running total of working minutes.  The working time between two
+timestamps is then a difference of two prefix-sum lookups - O(1) per
+interval however long the history - instead of a walk over every day in
+between.
+
+Working hours and the timezone are configurable; the default of 0-24h on
+weekdays that are not holidays matches business_days_between() in
+analyze.py, so "business days" mean the same thing for cycle time and for
+time in status.  The covered range grows a year at a time on demand.
+
+holidays may be a set of dates or a rule, year -> dates (see calendars.py),
+evaluated for every year the calendar is compiled for.  Alongside the
+minute prefix sum each compiled calendar keeps a day bitmap and the
+running count of business days, so whole-day counts are O(1) as well.
+"""
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate
+
+MINUTES_PER_DAY = 1440
+WEEKEND = (5, 6)
+
+
+class BusinessCalendar:
+    def __init__(self, tz, work_hours=(0, 24), holidays=(), weekend=WEEKEND):
+        self.tz = tz
+        start_h, end_h = work_hours
+        self.day_start = round(start_h * 60)
+        self.day_end = round(end_h * 60)
+        if not 0 <= self.day_start < self.day_end <= MINUTES_PER_DAY:
+            raise ValueError(f"bad working hours {work_hours!r}")
+        self.minutes_per_day = self.day_end - self.day_start
+        self.holidays = holidays if callable(holidays) else frozenset(holidays or ())
+        self.weekend = frozenset(weekend)
+        self.first_year = self.last_year = None
+        self._days = b""          # 1 per business day, from Jan 1 of first_year
+        self._day_cum = array("l")  # business days before each day
+        self._mask = b""          # 1 per working minute
+        self._cum = array("q")    # working minutes before each minute slot
+
+    # ── compilation ─────────────────────────────────────────────────────────
+    def _compile(self, first_year, last_year):
+        self.first_year, self.last_year = first_year, last_year
+        self.origin = date(first_year, 1, 1)
+        n_days = (date(last_year + 1, 1, 1) - self.origin).days
+        holidays = self.holidays
+        if callable(holidays):
+            holidays = {d for y in range(first_year, last_year + 1) for d in holidays(y)}
+        work = bytes(self.day_start) + b"\x01" * self.minutes_per_day + \
+               bytes(MINUTES_PER_DAY - self.day_end)
+        off = bytes(MINUTES_PER_DAY)
+        days = bytearray(n_days)
+        for i in range(n_days):
+            d = self.origin + timedelta(days=i)
+            days[i] = d.weekday() not in self.weekend and d not in holidays
+        self._days = bytes(days)
+        self._day_cum = array("l", accumulate(self._days, initial=0))
+        self._mask = b"".join(work if b else off for b in self._days)
+        self._cum = array("q", accumulate(self._mask, initial=0))
+
+    def _cover(self, year):
+        if self.first_year is None:
+            self._compile(year, year)
+        elif year < self.first_year:
+            self._compile(year, self.last_year)
+        elif year > self.last_year:
+            self._compile(self.first_year, year)
+
+    # ── queries ─────────────────────────────────────────────────────────────
+    def _day_index(self, d):
+        if not (self.first_year is not None and self.first_year <= d.year <= self.last_year):
+            self._cover(d.year)
+        return (d - self.origin).days
+
+    def is_business_day(self, d):
+        i = self._day_index(d)        # may recompile: index before reading _days
+        return bool(self._days[i])
+
+    def business_days(self, first, last):
+        """Number of business days d with first <= d <= last."""
+        if last < first:
+            return 0
+        self._day_index(first), self._day_index(last)     # compile both years first
+        cum = self._day_cum
+        return cum[self._day_index(last) + 1] - cum[self._day_index(first)]
+
+    def _local(self, dt):
+        return dt.astimezone(self.tz) if dt.tzinfo else dt
+
+    def _working_minutes_before(self, local):
+        """Working minutes from the calendar origin up to local time `local`
+        (its year must already be compiled)."""
+        i = (local.date() - self.origin).days * MINUTES_PER_DAY + local.hour * 60 + local.minute
+        frac = (local.second + local.microsecond / 1e6) / 60
+        return self._cum[i] + self._mask[i] * frac
+
+    def minutes_between(self, start, end):
+        """Working minutes in [start, end]; 0 if end <= start."""
+        if end <= start:
+            return 0.0
+        start, end = self._local(start), self._local(end)
+        # Compile both years before reading _cum: covering an earlier year
+        # moves the origin, so both lookups must use the same compilation.
+        self._day_index(start.date()), self._day_index(end.date())
+        return self._working_minutes_before(end) - self._working_minutes_before(start)
+
+    def days_between(self, start, end):
+        """Working time in [start, end] in working days (minutes_per_day each)."""
+        return self.minutes_between(start, end) / self.minutes_per_day
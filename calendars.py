@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Calendar registry with rule-generated holidays.
+
+Holidays are generated for any year from rules (fixed dates, "n-th weekday
+of the month", Easter-relative) instead of being typed in by hand, and
+shifted to the observed day:
+
+  us_federal   Saturday -> preceding Friday, Sunday -> following Monday
+  england      Saturday/Sunday -> next free weekday (substitute day)
+
+get_calendar(name) returns a compiled, cached BusinessCalendar (day
+bitmap, cumulative business-day counts and the minute prefix sum, see
+business_time.py); register_calendar() adds team-specific calendars.
+
+Usage: python3 calendars.py [calendar] [year ...]
+"""
+import sys
+from datetime import date, timedelta
+from zoneinfo import ZoneInfo
+
+from business_time import BusinessCalendar, WEEKEND
+
+DEFAULT_CALENDAR = "us_federal"
+
+MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
+
+
+# ── Holiday rules ───────────────────────────────────────────────────────────
+def nth_weekday(year, month, weekday, n):
+    """n-th (1-based) weekday of a month; n = -1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+def easter(year):
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+US_FEDERAL_RULES = [
+    # (name, year -> actual date)
+    ("New Year's Day",   lambda y: date(y, 1, 1)),
+    ("MLK Day",          lambda y: nth_weekday(y, 1, MON, 3)),
+    ("Presidents' Day",  lambda y: nth_weekday(y, 2, MON, 3)),
+    ("Memorial Day",     lambda y: nth_weekday(y, 5, MON, -1)),
+    ("Juneteenth",       lambda y: date(y, 6, 19)),
+    ("Independence Day", lambda y: date(y, 7, 4)),
+    ("Labor Day",        lambda y: nth_weekday(y, 9, MON, 1)),
+    ("Columbus Day",     lambda y: nth_weekday(y, 10, MON, 2)),
+    ("Veterans Day",     lambda y: date(y, 11, 11)),
+    ("Thanksgiving",     lambda y: nth_weekday(y, 11, THU, 4)),
+    ("Christmas",        lambda y: date(y, 12, 25)),
+]
+
+ENGLAND_RULES = [
+    ("New Year's Day",      lambda y: date(y, 1, 1)),
+    ("Good Friday",         lambda y: easter(y) - timedelta(days=2)),
+    ("Easter Monday",       lambda y: easter(y) + timedelta(days=1)),
+    ("Early May bank holiday", lambda y: nth_weekday(y, 5, MON, 1)),
+    ("Spring bank holiday", lambda y: nth_weekday(y, 5, MON, -1)),
+    ("Summer bank holiday", lambda y: nth_weekday(y, 8, MON, -1)),
+    ("Christmas Day",       lambda y: date(y, 12, 25)),
+    ("Boxing Day",          lambda y: date(y, 12, 26)),
+]
+
+
+def us_observed(d):
+    """Federal rule: Saturday -> Friday before, Sunday -> Monday after."""
+    if d.weekday() == SAT:
+        return d - timedelta(days=1)
+    if d.weekday() == SUN:
+        return d + timedelta(days=1)
+    return d
+
+def us_federal_holidays(year):
+    """{observed date: name} of US federal holidays observed in `year`.
+
+    Rules of the next year are included because New Year's Day on a
+    Saturday is observed on Dec 31 of the year before."""
+    out = {}
+    for y in (year, year + 1):
+        for name, rule in US_FEDERAL_RULES:
+            d = us_observed(rule(y))
+            if d.year == year:
+                out[d] = name
+    return out
+
+def england_holidays(year):
+    """{date: name} of England & Wales bank holidays, with substitute days."""
+    out = {}
+    for name, rule in ENGLAND_RULES:
+        d = rule(year)
+        while d.weekday() in WEEKEND or d in out:
+            d += timedelta(days=1)
+        out[d] = name
+    return out
+
+
+# ── Registry ────────────────────────────────────────────────────────────────
+CALENDAR_SPECS = {
+    # name: (timezone, working hours, holiday rule)
+    "us_federal": ("America/New_York", (0, 24), us_federal_holidays),
+    "england":    ("Europe/London",    (0, 24), england_holidays),
+    "weekdays":   ("UTC",              (0, 24), None),
+}
+_compiled = {}
+
+
+def register_calendar(name, tz, work_hours=(0, 24), holidays=None):
+    """Add (or replace) a calendar; holidays is a year -> dates rule."""
+    CALENDAR_SPECS[name] = (tz, work_hours, holidays)
+    _compiled.pop(name, None)
+
+def get_calendar(name=DEFAULT_CALENDAR):
+    """Compiled BusinessCalendar for a registered name (cached)."""
+    cal = _compiled.get(name)
+    if cal is None:
+        if name not in CALENDAR_SPECS:
+            raise KeyError(f"unknown calendar {name!r}; known: {', '.join(CALENDAR_SPECS)}")
+        tz, work_hours, holidays = CALENDAR_SPECS[name]
+        cal = _compiled[name] = BusinessCalendar(ZoneInfo(tz), work_hours, holidays or ())
+    return cal
+
+def holiday_names(name, year):
+    """{date: holiday name} for one registered calendar and year."""
+    rule = CALENDAR_SPECS[name][2]
+    return dict(sorted(rule(year).items())) if rule else {}
+
+
+def main():
+    args = sys.argv[1:]
+    name = args.pop(0) if args and not args[0].isdigit() else DEFAULT_CALENDAR
+    years = [int(a) for a in args] or [date.today().year]
+    cal = get_calendar(name)
+    for year in years:
+        first, last = date(year, 1, 1), date(year, 12, 31)
+        print(f"{name} {year}: {cal.business_days(first, last)} business days")
+        for d, label in holiday_names(name, year).items():
+            print(f"  {d:%a %Y-%m-%d}  {label}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Compact JSON chunks for the dashboard's lazily loaded detail views.
+
+dashboard.html carries only summary data inline; per-issue and per-sprint
+detail goes into dashboard_data/<name>.json, fetched by the page the first
+time a chart or table needs it.  Chunks are written without whitespace,
+row tables are columnar ({"columns": [...], "rows": [[...], ...]}) so key
+names are not repeated per issue, and with gzip enabled a precompressed
+<name>.json.gz sits next to each file for servers that can send it as-is
+(serve.py).  The .gz files carry no timestamp, and unchanged chunks are not
+rewritten, so reruns leave identical files.
+
+manifest.json lists every chunk with its size and a content hash (usable
+as an ETag).  Files from a previous run that were not written again are
+removed.
+"""
+import gzip, hashlib, json, os
+
+MANIFEST = "manifest.json"
+
+
+def table(columns, rows):
+    """Columnar form of a row table."""
+    return {"columns": list(columns), "rows": [list(r) for r in rows]}
+
+
+def chunk_name(text):
+    """'BIP AI FY26Q1.1' -> 'BIP_AI_FY26Q1.1' (safe as a file name)."""
+    return "".join(c if c.isalnum() or c in "._-" else "_" for c in text)
+
+
+def _write_if_changed(path, data):
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class ChunkWriter:
+    def __init__(self, out_dir, gzip_chunks=True):
+        self.out_dir = out_dir
+        self.gzip = gzip_chunks
+        self.manifest = {}
+
+    def write(self, name, obj):
+        """Write chunk `name` (may contain '/'); returns its manifest entry."""
+        data = json.dumps(obj, separators=(",", ":")).encode()
+        path = os.path.join(self.out_dir, name + ".json")
+        _write_if_changed(path, data)
+        entry = {"bytes": len(data), "etag": hashlib.sha1(data).hexdigest()[:16]}
+        if self.gzip:
+            gz = gzip.compress(data, compresslevel=9, mtime=0)
+            _write_if_changed(path + ".gz", gz)
+            entry["gz_bytes"] = len(gz)
+        self.manifest[name] = entry
+        return entry
+
+    def finish(self):
+        """Write manifest.json and drop chunk files not written this run."""
+        self.write(MANIFEST[:-len(".json")], {"chunks": self.manifest})
+        keep = {os.path.join(self.out_dir, n + ".json") for n in self.manifest}
+        keep |= {p + ".gz" for p in keep} if self.gzip else set()
+        for root, _dirs, files in os.walk(self.out_dir):
+            for fn in files:
+                path = os.path.join(root, fn)
+                if path not in keep and fn.endswith((".json", ".json.gz")):
+                    os.remove(path)
+        return self.manifest
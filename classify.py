@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Work-type classification of issues from summary text and labels.
+
+WORK_TYPE_RULES is the configurable rule set.  Every keyword and regex of
+every rule is compiled into ONE alternation regex with a named group per
+pattern, so an issue's summary is scanned once regardless of how many
+rules exist.  Labels are matched through a dict lookup.  When several
+rules match, the one listed first wins.
+
+process_search_batch.py calls classify_issue() during ingestion and stores
+the result as "work_type" in issue_data_full.json; analyze.py reads that
+field instead of re-opening the sprint files.
+
+Usage: python3 classify.py            # print work-type counts per sprint file
+"""
+import ast, re
+
+DEFAULT_WORK_TYPE = "development"
+
+WORK_TYPE_RULES = [
+    # Case-insensitive substrings / regexes on the summary, exact labels.
+    {"work_type": "support",   "keywords": ["adhoc support", "on call"],
+     "regexes": [], "labels": []},
+    {"work_type": "shadowing", "keywords": ["shadow"],
+     "regexes": [], "labels": []},
+]
+
+# Work types that analyze.py excludes from cycle-time metrics.
+NON_DEV_WORK_TYPES = {"support", "shadowing"}
+
+# Team labels, in priority order: an issue carrying several belongs to the
+# first one listed, so per-team counts add up to the total.
+TEAM_LABELS = ["MLOps_Eng", "Infra_Cloud", "BIPAI_Tenant", "Solutions_Eng",
+               "Data_Science", "it_ai"]
+UNTAGGED_TEAM = "Untagged"
+
+
+class WorkTypeClassifier:
+    """A rule set compiled into a single summary regex plus a label map."""
+
+    def __init__(self, rules=None, default=DEFAULT_WORK_TYPE):
+        self.rules = list(WORK_TYPE_RULES if rules is None else rules)
+        self.default = default
+        alternatives = []
+        self._group_rule = {}           # regex group name -> rule index
+        self._label_rule = {}           # label -> rule index (first rule wins)
+        for i, rule in enumerate(self.rules):
+            patterns = [re.escape(k) for k in rule.get("keywords", [])]
+            patterns += list(rule.get("regexes", []))
+            for j, pat in enumerate(patterns):
+                name = f"r{i}_{j}"
+                alternatives.append(f"(?P<{name}>{pat})")
+                self._group_rule[name] = i
+            for label in rule.get("labels", []):
+                self._label_rule.setdefault(label, i)
+        self._summary_re = (re.compile("|".join(alternatives), re.IGNORECASE)
+                            if alternatives else None)
+
+    def classify(self, summary, labels=()):
+        """Return the work type for a summary string and iterable of labels."""
+        best = len(self.rules)
+        for label in labels or ():
+            best = min(best, self._label_rule.get(label, best))
+        if self._summary_re is not None and summary:
+            for m in self._summary_re.finditer(summary):
+                best = min(best, self._group_rule[m.lastgroup])
+                if best == 0:
+                    break
+        return self.rules[best]["work_type"] if best < len(self.rules) else self.default
+
+
+_default_classifier = None
+
+def parse_labels(value):
+    """Sprint files store labels either as a list or as its Python repr."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value.split()
+    return list(value)
+
+def team_of(labels):
+    """Primary team label of an issue, or UNTAGGED_TEAM."""
+    present = set(parse_labels(labels))
+    return next((t for t in TEAM_LABELS if t in present), UNTAGGED_TEAM)
+
+
+def classify_issue(issue):
+    """Classify a sprint-file issue dict with the default rule set."""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = WorkTypeClassifier()
+    return _default_classifier.classify(issue.get("summary") or "",
+                                        parse_labels(issue.get("labels")))
+
+
+def main():
+    import glob, json, os
+    from collections import Counter
+    base = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(base, "sprint_issues", "*.json"))):
+        with open(path) as f:
+            counts = Counter(classify_issue(iss) for iss in json.load(f))
+        print(f"{os.path.basename(path):28s} " +
+              "  ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+
+
+if __name__ == "__main__":
+    main()
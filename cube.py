@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Small in-process OLAP cube over sprint x team x status x story-point bucket.
+
+Facts are issues.  Each base cell keeps mergeable aggregates (Agg): counts
+and sums, plus a QuantileSketch of cycle times.  build() materializes every
+cuboid of the lattice - one per subset of rolled-up dimensions, 2^d of
+them - each computed from a parent that has one dimension fewer rolled up,
+so a slice or rollup along any axis is afterwards a dict lookup.
+
+QuantileSketch is a log-bucketed histogram (relative accuracy ALPHA):
+values fall into buckets of geometrically growing width, two sketches
+merge by adding bucket counts, and a quantile is read by walking the
+buckets, so per-cell percentiles survive any rollup without the raw data.
+"""
+import math
+
+ALL = "*"
+ALPHA = 0.01                 # sketch relative accuracy
+SP_BUCKETS = [(None, "none"), (1, "1"), (2, "2"), (3, "3"), (5, "5"), (math.inf, "8+")]
+
+
+def sp_bucket(sp):
+    """Story points -> bucket label ('none' when unestimated)."""
+    if not sp:
+        return "none"
+    return next(label for top, label in SP_BUCKETS[1:] if sp <= top)
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch over non-negative values."""
+    __slots__ = ("counts", "zeros", "n")
+
+    _gamma = (1 + ALPHA) / (1 - ALPHA)
+    _log_gamma = math.log(_gamma)
+
+    def __init__(self):
+        self.counts = {}      # bucket index -> count
+        self.zeros = 0
+        self.n = 0
+
+    def add(self, x):
+        self.n += 1
+        if x <= 0:
+            self.zeros += 1
+            return
+        i = math.ceil(math.log(x) / self._log_gamma)
+        self.counts[i] = self.counts.get(i, 0) + 1
+
+    def merge(self, other):
+        out = QuantileSketch()
+        out.counts = dict(self.counts)
+        for i, c in other.counts.items():
+            out.counts[i] = out.counts.get(i, 0) + c
+        out.zeros = self.zeros + other.zeros
+        out.n = self.n + other.n
+        return out
+
+    def quantile(self, q):
+        """Approximate q-quantile (0..1) of the added values, None if empty."""
+        if not self.n:
+            return None
+        rank = q * (self.n - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for i in sorted(self.counts):
+            seen += self.counts[i]
+            if rank < seen:
+                return 2 * self._gamma ** i / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.counts) / (self._gamma + 1)
+
+
+class Agg:
+    """Mergeable measures of one cube cell."""
+    __slots__ = ("n", "sp", "cycle", "cycle_sum", "status_days")
+
+    def __init__(self):
+        self.n = 0
+        self.sp = 0.0
+        self.cycle = QuantileSketch()
+        self.cycle_sum = 0.0
+        self.status_days = {}     # status field -> summed business days
+
+    def add(self, sp=None, cycle=None, status_days=None):
+        self.n += 1
+        self.sp += sp or 0
+        if cycle is not None:
+            self.cycle.add(cycle)
+            self.cycle_sum += cycle
+        for k, v in (status_days or {}).items():
+            self.status_days[k] = self.status_days.get(k, 0.0) + v
+
+    def merge(self, other):
+        out = Agg()
+        out.n = self.n + other.n
+        out.sp = self.sp + other.sp
+        out.cycle = self.cycle.merge(other.cycle)
+        out.cycle_sum = self.cycle_sum + other.cycle_sum
+        out.status_days = dict(self.status_days)
+        for k, v in other.status_days.items():
+            out.status_days[k] = out.status_days.get(k, 0.0) + v
+        return out
+
+    def summary(self):
+        """Counts, sums and the mean; exact percentiles need the cell's raw
+        cycle times, the sketch only approximates them (to ALPHA)."""
+        return {"items": self.n, "story_points": round(self.sp, 1),
+                "cycle_n": self.cycle.n,
+                "cycle_mean": round(self.cycle_sum / self.cycle.n, 2) if self.cycle.n else None,
+                "status_days": {k: round(v, 1) for k, v in self.status_days.items()}}
+
+
+class Cube:
+    def __init__(self, dims):
+        self.dims = tuple(dims)
+        self.base = {}
+        self.cuboids = None   # rolled-up bitmask -> {coords: Agg}
+
+    def add(self, coords, **measures):
+        coords = tuple(coords)
+        cell = self.base.get(coords)
+        if cell is None:
+            cell = self.base[coords] = Agg()
+        cell.add(**measures)
+        self.cuboids = None
+
+    def build(self):
+        """Materialize the whole lattice (each cuboid from a one-step parent)."""
+        d = len(self.dims)
+        self.cuboids = {0: self.base}
+        for mask in sorted(range(1, 1 << d), key=lambda m: bin(m).count("1")):
+            low = mask & -mask                     # roll this dim up from the parent
+            pos = low.bit_length() - 1
+            cuboid = {}
+            for coords, agg in self.cuboids[mask ^ low].items():
+                key = coords[:pos] + (ALL,) + coords[pos + 1:]
+                cuboid[key] = cuboid[key].merge(agg) if key in cuboid else agg
+            self.cuboids[mask] = cuboid
+        return self
+
+    def _mask(self, keep):
+        return sum(1 << i for i, dim in enumerate(self.dims) if dim not in keep)
+
+    def query(self, **where):
+        """Agg of one slice, e.g. query(sprint=..., team=...); other dims rolled up."""
+        if self.cuboids is None:
+            self.build()
+        key = tuple(where.get(dim, ALL) for dim in self.dims)
+        return self.cuboids[self._mask(where)].get(key) or Agg()
+
+    def rollup(self, *by, **where):
+        """{(values of `by`...): Agg} grouped by `by`, filtered by `where`."""
+        if self.cuboids is None:
+            self.build()
+        keep = set(by) | set(where)
+        idx = [self.dims.index(dim) for dim in by]
+        fixed = [(self.dims.index(dim), v) for dim, v in where.items()]
+        return {tuple(coords[i] for i in idx): agg
+                for coords, agg in self.cuboids[self._mask(keep)].items()
+                if all(coords[i] == v for i, v in fixed)}
+
+    def members(self, dim):
+        i = self.dims.index(dim)
+        return sorted({coords[i] for coords in self.base})
+
+    def to_json(self):
+        """Base cells as rows: coords + [items, story points, cycle n, cycle sum]."""
+        return {"dims": list(self.dims),
+                "cells": [list(coords) + [a.n, round(a.sp, 1), a.cycle.n, round(a.cycle_sum, 2)]
+                          for coords, a in sorted(self.base.items())]}
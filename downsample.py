@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Bounded-size views of the per-issue cycle-time scatter.
+
+density_grid() counts points per (group, value bin) - a fixed-size 2D
+histogram whose size depends on the number of sprints and bins, not on the
+number of issues.  stratified_sample() picks at most `budget` points: every
+point flagged by `keep` (the outliers) is taken, and the rest of the budget
+is shared between strata (group x bin) in proportion to their size
+(largest remainder, at least one point per non-empty stratum when the
+budget allows).  Inside a stratum points are taken at evenly spaced ranks
+of the value, so the sample keeps each stratum's spread.  Selection is
+deterministic.
+
+The x axis of the scatter is not a time series, so a stratified sample is
+used rather than a shape-preserving line downsampler such as LTTB.
+"""
+import math
+from collections import defaultdict
+
+
+def density_grid(points, groups, bin_days=1.0):
+    """{"groups", "edges", "counts"[group][bin]} for (group, value) points."""
+    values = [v for _g, v in points]
+    n_bins = max(1, math.ceil(max(values, default=0) / bin_days + 1e-9))
+    index = {g: i for i, g in enumerate(groups)}
+    counts = [[0] * n_bins for _ in groups]
+    for g, v in points:
+        if g in index:
+            counts[index[g]][min(int(v // bin_days), n_bins - 1)] += 1
+    return {"groups": list(groups), "edges": [round(i * bin_days, 2) for i in range(n_bins)],
+            "counts": counts}
+
+
+def stratified_sample(items, budget, stratum, value, keep=None):
+    """Indices into `items` of a sample of at most `budget` (sorted)."""
+    kept = [i for i, it in enumerate(items) if keep and keep(it)]
+    if len(items) <= budget:
+        return list(range(len(items)))
+    kept_set = set(kept)
+    strata = defaultdict(list)
+    for i, it in enumerate(items):
+        if i not in kept_set:
+            strata[stratum(it)].append(i)
+    rest = sum(len(m) for m in strata.values())
+    room = max(0, budget - len(kept))
+    if not rest or not room:
+        return sorted(kept)[:budget]
+    # Largest-remainder allocation, with a floor of one per stratum when the
+    # budget allows it.
+    floor = 1 if room >= len(strata) else 0
+    quotas = {s: room * len(m) / rest for s, m in strata.items()}
+    alloc = {s: min(len(strata[s]), max(floor, int(q))) for s, q in quotas.items()}
+    spare = room - sum(alloc.values())
+    while spare < 0:                      # floors overshot: trim the largest
+        s = max(alloc, key=alloc.get)
+        alloc[s] -= 1
+        spare += 1
+    for s in sorted(quotas, key=lambda s: quotas[s] - int(quotas[s]), reverse=True):
+        if spare <= 0:
+            break
+        if alloc[s] < len(strata[s]):
+            alloc[s] += 1
+            spare -= 1
+    chosen = list(kept)
+    for s, members in strata.items():
+        members.sort(key=lambda i: value(items[i]))
+        k = alloc[s]
+        if k >= len(members):
+            chosen.extend(members)
+        elif k == 0:
+            continue
+        elif k == 1:
+            chosen.append(members[len(members) // 2])
+        else:
+            step = (len(members) - 1) / (k - 1)
+            chosen.extend(members[round(j * step)] for j in range(k))
+    return sorted(chosen)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Cumulative flow from status transitions.
+
+status_intervals() turns one issue's status changelog into (status, enter,
+exit) intervals.  cumulative_flow() then runs a sweep line over every
+interval of every issue: each interval contributes an enter and an exit
+event, the events are sorted once (O(E log E)) and swept day by day, so
+the per-day counts cost O(E + D) instead of re-scanning every issue for
+every day.
+
+The same sweep counts arrivals into and departures from work in progress
+(a run of consecutive WIP statuses), which gives the inputs for a
+Little's-law check:  average WIP ~= throughput x average time in WIP.
+"""
+import json
+from datetime import datetime, timedelta
+
+CFD_STATES = ["Done", "Canceled", "In Testing", "Peer Review Needed",
+              "Blocked", "In Progress", "Ready for Dev", "Backlog"]
+WIP_STATES = {"In Progress", "Peer Review Needed", "In Testing", "Blocked"}
+INITIAL_STATE = "Backlog"
+
+
+def status_intervals(created, transitions, initial=INITIAL_STATE):
+    """[(status, enter, exit)] for one issue; exit is None for the current status.
+
+    transitions is an iterable of (timestamp, from_status, to_status); the
+    status before the first transition is its from_status (or `initial`)."""
+    transitions = sorted(transitions, key=lambda t: t[0])
+    status = (transitions[0][1] if transitions else None) or initial
+    enter = created
+    out = []
+    for ts, _from, to in transitions:
+        out.append((status, enter, ts))
+        status, enter = to, ts
+    out.append((status, enter, None))
+    return out
+
+
+def flag_intervals(created, changes):
+    """[(flagged, unflagged)] from Flagged field changes; unflagged may be None.
+
+    changes is an iterable of (timestamp, from_string, to_string); any
+    non-empty value (e.g. "Impediment") counts as flagged."""
+    out = []
+    since = None
+    for ts, _from, to in sorted(changes, key=lambda c: c[0]):
+        if to and since is None:
+            since = ts
+        elif not to and since is not None:
+            out.append((since, ts))
+            since = None
+    if since is not None:
+        out.append((since, None))
+    return out
+
+
+def load_status_timelines(raw_paths):
+    """{key: status_intervals()} straight from raw_search_*.json files.
+
+    analyze.py builds the same timelines inside its own changelog pass; this
+    is for standalone tools (intervals.py)."""
+    timelines = {}
+    for path in raw_paths:
+        with open(path) as f:
+            raw = json.load(f)
+        for iss in raw.get("issues", []):
+            if iss["key"] in timelines:
+                continue
+            transitions = [(datetime.fromisoformat(cl["created"]),
+                            item.get("from_string", ""), item.get("to_string", ""))
+                           for cl in iss.get("changelogs", [])
+                           for item in cl.get("items", []) if item.get("field") == "status"]
+            timelines[iss["key"]] = status_intervals(
+                datetime.fromisoformat(iss["created"]), transitions)
+    return timelines
+
+
+def wip_stints(intervals, wip=WIP_STATES):
+    """[(enter, exit)] of each run of consecutive WIP statuses; exit may be None."""
+    stints = []
+    start = None
+    for status, enter, exit_ in intervals:
+        if status in wip:
+            if start is None:
+                start = enter
+        elif start is not None:
+            stints.append((start, enter))
+            start = None
+    if start is not None:
+        stints.append((start, None))
+    return stints
+
+
+def cumulative_flow(timelines, start=None, end=None, states=CFD_STATES, wip=WIP_STATES):
+    """Daily status counts plus WIP arrivals/departures over [start, end].
+
+    timelines is an iterable of per-issue interval lists (status_intervals()
+    output).  Days are the local dates of the changelog timestamps; counts
+    are taken at the end of each day.  Events before `start` are folded
+    into the first day's counts, events after `end` are ignored."""
+    index = {s: i for i, s in enumerate(states)}
+    events = []       # (day, kind, slot, delta); kind 0 = status, 1 = arrival, 2 = departure
+    stint_days = []   # (exit day, length in days) of completed WIP stints
+    for intervals in timelines:
+        for status, enter, exit_ in intervals:
+            slot = index.get(status)
+            if slot is None:
+                continue
+            events.append((enter.date(), 0, slot, 1))
+            if exit_ is not None:
+                events.append((exit_.date(), 0, slot, -1))
+        for enter, exit_ in wip_stints(intervals, wip):
+            events.append((enter.date(), 1, 0, 1))
+            if exit_ is not None:
+                events.append((exit_.date(), 2, 0, 1))
+                stint_days.append((exit_.date(), (exit_ - enter).total_seconds() / 86400))
+    if not events:
+        return None
+    events.sort()
+    start = start or events[0][0]
+    end = end or events[-1][0]
+
+    counts = [0] * len(states)
+    days, series = [], [[] for _ in states]
+    arrivals, departures = [], []
+    i, n = 0, len(events)
+    day = start
+    while day <= end:
+        arr = dep = 0
+        while i < n and events[i][0] <= day:
+            ev_day, kind, slot, delta = events[i]
+            if kind == 0:
+                counts[slot] += delta
+            elif ev_day == day:       # flows before the window are not rates
+                if kind == 1:
+                    arr += 1
+                else:
+                    dep += 1
+            i += 1
+        days.append(day.isoformat())
+        for slot, c in enumerate(counts):
+            series[slot].append(c)
+        arrivals.append(arr)
+        departures.append(dep)
+        day += timedelta(days=1)
+
+    n_days = len(days)
+    wip_slots = [index[s] for s in states if s in wip]
+    avg_wip = sum(sum(series[s][d] for s in wip_slots) for d in range(n_days)) / n_days
+    in_window = [length for d, length in stint_days if start <= d <= end]
+    throughput = sum(departures) / n_days
+    avg_time = sum(in_window) / len(in_window) if in_window else 0.0
+    predicted = throughput * avg_time
+    return {
+        "days": days,
+        "states": list(states),
+        "counts": {s: series[i] for i, s in enumerate(states)},
+        "arrivals": arrivals,
+        "departures": departures,
+        "littles_law": {
+            "avg_wip": round(avg_wip, 2),
+            "arrival_rate": round(sum(arrivals) / n_days, 3),
+            "throughput": round(throughput, 3),
+            "avg_days_in_wip": round(avg_time, 2),
+            "predicted_wip": round(predicted, 2),
+            "ratio": round(avg_wip / predicted, 3) if predicted else None,
+        },
+    }
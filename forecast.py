@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo delivery forecasting from historical throughput.
+
+Each simulation resamples past throughput (per sprint or per business day)
+with replacement.  Two questions are answered:
+
+  how_many_by(samples, horizon)  - items finished within `horizon` periods,
+                                   at the given confidence levels
+  when_done(samples, target)     - periods needed to finish `target` items
+
+how_many_by() simulates in batches: all draws come from one
+random.choices() call, and per-simulation sums are reduced with map()/zip()
+instead of a Python loop per simulation.  Long horizons draw from the exact
+distribution of BLOCK consecutive periods (the empirical distribution
+convolved with itself), so a 65-day horizon costs 9 draws per simulation
+instead of 65.
+
+when_done() needs no simulation at all: completion_cdf() convolves the
+empirical distribution one period at a time, tracking only partial sums
+below the largest target, so P(done within k periods) is exact and its
+percentiles are what an unlimited number of simulated paths would give.
+All four per-day targets (160 samples, 80+ steps) take about 0.1 s.  The
+*_naive functions are the straightforward simulation loops, kept for
+bench_forecast.py.
+"""
+import random
+from collections import Counter
+from itertools import accumulate
+from operator import add
+
+N_SIMS = 100_000
+CONFIDENCES = (85, 95)
+MAX_STEPS = 500        # give up on when_done() after this many periods
+BLOCK = 8              # periods per pre-convolved block in simulate_totals()
+
+
+def _block_distribution(samples, size):
+    """(values, cumulative weights) of the sum of `size` resampled periods."""
+    base = Counter(samples)
+    dist = {0: 1}
+    for _ in range(size):
+        nxt = Counter()
+        for total, w in dist.items():
+            for v, c in base.items():
+                nxt[total + v] += w * c
+        dist = nxt
+    values = sorted(dist)
+    return values, list(accumulate(dist[v] for v in values))
+
+
+def simulate_totals(samples, horizon, n_sims=N_SIMS, rng=random):
+    """Sorted list of n_sims simulated totals over `horizon` periods."""
+    if horizon <= 0:
+        return [0] * n_sims
+    blocks, rest = divmod(horizon, BLOCK) if horizon > BLOCK else (0, horizon)
+    totals = [0] * n_sims
+    if blocks:
+        values, cum = _block_distribution(samples, BLOCK)
+        draws = rng.choices(values, cum_weights=cum, k=n_sims * blocks)
+        # zip(*[it] * n) groups the flat draw list into per-simulation tuples.
+        totals = list(map(sum, zip(*[iter(draws)] * blocks)))
+    if rest:
+        draws = rng.choices(samples, k=n_sims * rest)
+        totals = list(map(add, totals, map(sum, zip(*[iter(draws)] * rest))))
+    totals.sort()
+    return totals
+
+def completion_cdf(samples, targets, max_steps=MAX_STEPS, until=1.0):
+    """{target: [P(target reached within k periods) for k = 1, 2, ...]}.
+
+    Exact: the distribution of the running total is convolved with the
+    empirical per-period distribution once per period.  Totals at or above
+    the largest target are done for good (throughput is never negative), so
+    only the mass below it is carried.  Stops after max_steps periods or
+    once the largest target is reached with probability `until`."""
+    if max(samples) <= 0:
+        raise ValueError("historical throughput is all zero")
+    goals = sorted(set(targets))
+    top = max(goals[-1], 1)
+    n = len(samples)
+    base = [(v, c / n) for v, c in Counter(samples).items()]
+    below = [1.0] + [0.0] * (top - 1)       # P(running total == t), t < top
+    cdf = {g: [] for g in goals}
+    for _ in range(max_steps):
+        nxt = [0.0] * top
+        for v, p in base:
+            if v < top:
+                nxt[v:] = map(add, nxt[v:], map(p.__mul__, below[:top - v]))
+        below = nxt
+        mass = list(accumulate(below))          # mass[t] = P(running total <= t)
+        for g in goals:
+            cdf[g].append(1.0 - mass[g - 1] if g > 0 else 1.0)
+        if 1.0 - mass[-1] >= until:
+            break
+    return cdf
+
+
+def simulate_totals_naive(samples, horizon, n_sims=N_SIMS, rng=random):
+    totals = []
+    for _ in range(n_sims):
+        t = 0
+        for _ in range(horizon):
+            t += rng.choice(samples)
+        totals.append(t)
+    totals.sort()
+    return totals
+
+def simulate_completion_naive(samples, target, n_sims=N_SIMS, rng=random,
+                              max_steps=MAX_STEPS):
+    steps = []
+    for _ in range(n_sims):
+        t = n = 0
+        while t < target and n < max_steps:
+            t += rng.choice(samples)
+            n += 1
+        steps.append(n)
+    steps.sort()
+    return steps
+
+
+def how_many_by(samples, horizon, confidences=CONFIDENCES, n_sims=N_SIMS, rng=random):
+    """{confidence: items} - 'at least this many items with c% confidence'."""
+    totals = simulate_totals(samples, horizon, n_sims, rng)
+    return {c: totals[int((100 - c) / 100 * (n_sims - 1))] for c in confidences}
+
+def when_done(samples, target, confidences=CONFIDENCES, max_steps=MAX_STEPS):
+    """{confidence: periods} - 'done within this many periods with c% confidence'.
+
+    With a list of targets, returns {target: {confidence: periods}}; periods
+    is max_steps when the confidence is not reached by then."""
+    many = isinstance(target, (list, tuple))
+    cdfs = completion_cdf(samples, target if many else [target], max_steps,
+                          until=max(confidences) / 100)
+    out = {t: {c: next((k for k, p in enumerate(cdf, 1) if p >= c / 100), max_steps)
+               for c in confidences}
+           for t, cdf in cdfs.items()}
+    return out if many else out[target]
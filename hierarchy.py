@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Issue -> epic -> parent hierarchy with memoized bottom-up roll-ups.
+
+Hierarchy is built from a {child: parent} map (Epic Link, falling back to
+Parent Link).  rollup(node) combines its children's roll-ups - earliest
+created, earliest start, latest done, item counts - and caches the
+result, so every node of a portfolio is computed once (O(N) for all of
+them) and any later query is a dict lookup.  The aggregates are
+min / max / sum, so they merge in any order.
+
+Epics and parents are often not in the extract themselves; their lead
+time therefore runs from the earliest child's creation.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Rollup:
+    created: object = None      # earliest created of any item below
+    started: object = None      # earliest cycle start
+    last_done: object = None    # latest done_at of the items done so far
+    items: int = 0              # leaf issues below
+    done_items: int = 0
+
+    @property
+    def complete(self):
+        return self.items > 0 and self.items == self.done_items
+
+    def merge(self, other):
+        return Rollup(
+            created=_min(self.created, other.created),
+            started=_min(self.started, other.started),
+            last_done=_max(self.last_done, other.last_done),
+            items=self.items + other.items,
+            done_items=self.done_items + other.done_items,
+        )
+
+
+def _min(a, b):
+    return b if a is None else a if b is None else min(a, b)
+
+def _max(a, b):
+    return b if a is None else a if b is None else max(a, b)
+
+
+def link_target(value):
+    """'BIP-27990 Some summary' or 'BIP-27990' -> 'BIP-27990' (None if empty)."""
+    return value.split(None, 1)[0] if value and value.strip() else None
+
+
+def final_link(changes):
+    """Last target of a link field's (timestamp, from, to) changes."""
+    last = None
+    for _ts, _from, to in sorted(changes, key=lambda c: c[0]):
+        last = link_target(to)
+    return last
+
+
+class Hierarchy:
+    def __init__(self, parents, leaves):
+        """parents: {child: parent}; leaves: {key: (created, started, done)}."""
+        self.parent = {c: p for c, p in parents.items() if p and p != c}
+        self.children = {}
+        for child, parent in self.parent.items():
+            self.children.setdefault(parent, []).append(child)
+        self.leaves = leaves
+        self._memo = {}
+
+    def nodes(self):
+        """Keys that have children (epics and parents)."""
+        return list(self.children)
+
+    def roots(self):
+        return [n for n in self.children if n not in self.parent]
+
+    def rollup(self, node):
+        """Rollup of `node` and everything below it (memoized, iterative)."""
+        if node in self._memo:
+            return self._memo[node]
+        stack, on_path = [node], {node}
+        while stack:
+            cur = stack[-1]
+            pending = [c for c in self.children.get(cur, ())
+                       if c not in self._memo and c not in on_path]
+            if pending:
+                stack.extend(pending)
+                on_path.update(pending)
+                continue
+            stack.pop()
+            r = self._leaf(cur)
+            for c in self.children.get(cur, ()):
+                if c in self._memo:           # cycles in bad data are skipped
+                    r = r.merge(self._memo[c])
+            self._memo[cur] = r
+        return self._memo[node]
+
+    def _leaf(self, key):
+        if key not in self.leaves:
+            return Rollup()
+        created, started, done = self.leaves[key]
+        return Rollup(created=created, started=started, last_done=done, items=1, done_items=1 if done else 0)
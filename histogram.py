@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Cycle-time histograms.
+
+A Binning is a sorted list of lower bucket edges plus labels.  Each value is
+placed with one bisect (O(log B)), and bin_counts() fills the overall
+histogram and the per-group (per-sprint) histograms in the same pass.
+
+Strategies (BINNING_STRATEGIES):
+  fixed  - the hand-picked 0-1d ... 30d+ buckets used on the dashboard
+  log    - a [0, lo) bucket, then log-spaced edges from lo = max(P1, 0.1d)
+           up to the largest value
+  fd     - Freedman-Diaconis: width = 2 * IQR / n^(1/3)
+"""
+import math
+from bisect import bisect_right
+from collections import defaultdict
+
+# Lower edges of the fixed buckets; the last bucket is open-ended.
+FIXED_EDGES = [0, 1, 2, 5, 10, 20, 30]
+MAX_BINS = 40
+LOG_MIN_DAYS = 0.1     # log binning never starts below this (or P1)
+
+
+class Binning:
+    def __init__(self, edges, labels=None):
+        self.edges = list(edges)
+        self.labels = labels or _edge_labels(self.edges)
+
+    def __len__(self):
+        return len(self.edges)
+
+    def index(self, value):
+        """Bucket index for value, or -1 if it falls below the first edge."""
+        return bisect_right(self.edges, value) - 1
+
+
+def _fmt(x):
+    return f"{x:.3g}"
+
+def _edge_labels(edges):
+    labels = [f"{_fmt(lo)}-{_fmt(hi)}d" for lo, hi in zip(edges, edges[1:])]
+    return labels + [f"{_fmt(edges[-1])}d+"]
+
+
+def fixed_binning(values=None):
+    return Binning(FIXED_EDGES)
+
+def log_binning(values, n_bins=8):
+    """Exactly n_bins buckets: [0, lo) for zero and near-zero values, then
+    n_bins - 1 log-spaced buckets from lo to the largest value (the last one
+    starts below it).  lo is the 1st percentile of the positive values, but
+    at least LOG_MIN_DAYS, so seconds-long items do not stretch the scale."""
+    positive = sorted(v for v in values if v > 0)
+    if not positive:
+        return fixed_binning()
+    lo = max(LOG_MIN_DAYS, positive[int(0.01 * (len(positive) - 1))])
+    hi = positive[-1]
+    if hi <= lo or n_bins < 2:
+        return Binning([0, lo])
+    step = (math.log(hi) - math.log(lo)) / (n_bins - 1)
+    return Binning([0] + [lo * math.exp(i * step) for i in range(n_bins - 1)])
+
+def fd_binning(values):
+    """Freedman-Diaconis bin width, capped at MAX_BINS buckets."""
+    vals = sorted(values)
+    n = len(vals)
+    if n < 4:
+        return fixed_binning()
+    q1 = vals[int(0.25 * (n - 1))]
+    q3 = vals[int(0.75 * (n - 1))]
+    width = 2 * (q3 - q1) / n ** (1 / 3)
+    lo, hi = math.floor(vals[0]), vals[-1]
+    if width <= 0:
+        return fixed_binning()
+    width = max(width, (hi - lo) / MAX_BINS)
+    width = round(width, 2) or 0.01
+    n_edges = int((hi - lo) / width) + 1
+    return Binning([round(lo + i * width, 2) for i in range(n_edges)])
+
+
+BINNING_STRATEGIES = {
+    "fixed": fixed_binning,
+    "log":   log_binning,
+    "fd":    fd_binning,
+}
+
+def make_binning(strategy, values):
+    return BINNING_STRATEGIES[strategy](values)
+
+
+def bin_counts(pairs, binning):
+    """Histogram (value, group) pairs in a single pass.
+
+    Returns (overall_counts, {group: counts}), each a list aligned with
+    binning.labels."""
+    overall = [0] * len(binning)
+    by_group = defaultdict(lambda: [0] * len(binning))
+    for value, group in pairs:
+        i = binning.index(value)
+        if i < 0:
+            continue
+        overall[i] += 1
+        by_group[group][i] += 1
+    return overall, dict(by_group)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Point-in-time board queries over status intervals.
+
+IntervalIndex is a static centered interval tree: each node keeps the
+intervals that contain its center, sorted once by start and once by end,
+and a stabbing query walks a single root-to-leaf path, so "what was open
+at time t" costs O(log n + k) instead of a scan of every changelog.
+Intervals are half-open [start, end); an end of None means still open.
+
+BoardIndex builds one tree per status plus one over WIP stints (runs of
+consecutive WIP statuses, see flow.wip_stints()), which answers both
+"what was in Blocked on 2025-11-20" and "how old was the WIP then".
+
+merge_intervals() and intersect_intervals() are the set operations on
+per-issue interval lists (e.g. flagged time while in an active status):
+one sort plus a linear two-pointer sweep.
+
+Usage: python3 intervals.py YYYY-MM-DD[THH:MM] [status]
+"""
+import os, sys, glob, math
+from datetime import datetime, time
+
+from flow import load_status_timelines, wip_stints, WIP_STATES
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _ts(dt):
+    return math.inf if dt is None else dt.timestamp()
+
+
+def merge_intervals(intervals):
+    """Union of (start, end) intervals as a sorted, disjoint list.
+
+    end may be None (open-ended); it sorts after every timestamp."""
+    out = []
+    for start, end in sorted(intervals, key=lambda iv: iv[0]):
+        if out:
+            last_end = out[-1][1]
+            if last_end is None or start <= last_end:
+                if last_end is not None and (end is None or end > last_end):
+                    out[-1] = (out[-1][0], end)
+                continue
+        out.append((start, end))
+    return out
+
+
+def intersect_intervals(a, b):
+    """Intersection of two sorted, disjoint (start, end) lists (two pointers)."""
+    out = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start = max(a[i][0], b[j][0])
+        ea, eb = a[i][1], b[j][1]
+        end = ea if eb is None else eb if ea is None else min(ea, eb)
+        if end is None or start < end:
+            out.append((start, end))
+        # Advance whichever interval finishes first (open ends finish last).
+        if eb is None or (ea is not None and ea <= eb):
+            i += 1
+        else:
+            j += 1
+    return out
+
+
+class _Node:
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center, members):
+        self.center = center
+        self.by_start = sorted(members, key=lambda iv: iv[0])
+        self.by_end = sorted(members, key=lambda iv: iv[1], reverse=True)
+        self.left = self.right = None
+
+
+class IntervalIndex:
+    """Stabbing queries over (start, end, item) with datetime bounds."""
+
+    def __init__(self, intervals):
+        # Work on epoch seconds; empty intervals can never contain a point.
+        ivs = [(_ts(s), _ts(e), item) for s, e, item in intervals]
+        ivs = [iv for iv in ivs if iv[0] < iv[1]]
+        self.size = len(ivs)
+        self.root = None
+        stack = [(ivs, None, None)]          # (intervals, parent, side)
+        while stack:
+            chunk, parent, side = stack.pop()
+            if not chunk:
+                continue
+            starts = sorted(iv[0] for iv in chunk)
+            center = starts[len(starts) // 2]
+            left, here, right = [], [], []
+            for iv in chunk:
+                if iv[1] <= center:
+                    left.append(iv)
+                elif iv[0] > center:
+                    right.append(iv)
+                else:
+                    here.append(iv)
+            node = _Node(center, here)
+            if parent is None:
+                self.root = node
+            else:
+                setattr(parent, side, node)
+            stack.append((left, node, "left"))
+            stack.append((right, node, "right"))
+
+    def __len__(self):
+        return self.size
+
+    def stab(self, t):
+        """(start, end, item) of every interval containing time t (epoch seconds)."""
+        out = []
+        node = self.root
+        while node is not None:
+            if t < node.center:
+                for iv in node.by_start:
+                    if iv[0] > t:
+                        break
+                    out.append(iv)
+                node = node.left
+            else:
+                for iv in node.by_end:
+                    if iv[1] <= t:
+                        break
+                    out.append(iv)
+                node = node.right
+        return out
+
+    def at(self, when):
+        """Items of every interval open at datetime `when`."""
+        return [iv[2] for iv in self.stab(when.timestamp())]
+
+
+class BoardIndex:
+    """As-of-time board snapshots built from {key: status_intervals()}."""
+
+    def __init__(self, timelines, wip=WIP_STATES):
+        by_status = {}
+        stints = []
+        for key, intervals in timelines.items():
+            for status, enter, exit_ in intervals:
+                by_status.setdefault(status, []).append((enter, exit_, key))
+            for enter, exit_ in wip_stints(intervals, wip):
+                stints.append((enter, exit_, key))
+        self.statuses = {s: IntervalIndex(ivs) for s, ivs in by_status.items()}
+        self.wip = IntervalIndex(stints)
+
+    def snapshot(self, when, status=None):
+        """{status: sorted keys} at `when`, or just the keys for one status."""
+        if status is not None:
+            index = self.statuses.get(status)
+            return sorted(index.at(when)) if index else []
+        return {s: sorted(index.at(when)) for s, index in self.statuses.items()}
+
+    def wip_snapshot(self, when, age=None):
+        """[(key, stint start)] of WIP at `when`, oldest first.
+
+        With age(start, when) given, entries are (key, start, age) instead."""
+        t = when.timestamp()
+        rows = sorted((iv[0], iv[2]) for iv in self.wip.stab(t))
+        starts = [datetime.fromtimestamp(s, when.tzinfo) for s, _key in rows]
+        if age is None:
+            return [(key, st) for (_s, key), st in zip(rows, starts)]
+        return [(key, st, age(st, when)) for (_s, key), st in zip(rows, starts)]
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__.strip().splitlines()[-1])
+    when = datetime.fromisoformat(sys.argv[1])
+    if len(sys.argv[1]) == 10:
+        when = datetime.combine(when.date(), time(23, 59, 59))
+    when = when.astimezone()                 # naive input means local time
+    status = sys.argv[2] if len(sys.argv) > 2 else None
+
+    board = BoardIndex(load_status_timelines(
+        sorted(glob.glob(os.path.join(BASE, "raw_search_*.json")))))
+    print(f"Board as of {when.isoformat(timespec='minutes')}")
+    if status:
+        keys = board.snapshot(when, status)
+        print(f"\n{status} ({len(keys)}): {' '.join(keys)}")
+        return
+    for s, keys in sorted(board.snapshot(when).items()):
+        if keys and s != "Done":
+            print(f"  {s:20s} {len(keys):4d}  {' '.join(keys[:12])}"
+                  + (" ..." if len(keys) > 12 else ""))
+    print(f"\nWIP ({len(board.wip.stab(when.timestamp()))} items), oldest first:")
+    for key, start in board.wip_snapshot(when)[:15]:
+        print(f"  {key:12s} since {start:%Y-%m-%d}  "
+              f"({(when - start).total_seconds() / 86400:.1f} calendar days)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Dense integer ids for Jira issue keys.
+
+"BIP-30531" is split into project "BIP" and number 30531 and mapped to a
+dense id (0, 1, 2, ... in first-seen order).  A {key: value} dict can then
+become a list/array indexed by id (KeyInterner.column) and a key set a
+bitset for membership tests (Bitset); the id -> key list is only needed for
+display.
+"""
+from array import array
+
+
+def split_key(key):
+    """'BIP-30531' -> ('BIP', 30531)."""
+    project, _, number = key.rpartition("-")
+    return project, int(number)
+
+
+class KeyInterner:
+    """Bidirectional issue key <-> dense int id mapping."""
+
+    def __init__(self, keys=()):
+        self._projects = {}     # project -> {number: id}
+        self.keys = []          # id -> key (display only)
+        for k in keys:
+            self.intern(k)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def intern(self, key):
+        """Return the id for key, assigning the next free id if new."""
+        project, number = split_key(key)
+        ids = self._projects.setdefault(project, {})
+        i = ids.get(number)
+        if i is None:
+            i = ids[number] = len(self.keys)
+            self.keys.append(key)
+        return i
+
+    def id(self, key):
+        """Return the id for key, or -1 if it was never interned."""
+        project, number = split_key(key)
+        return self._projects.get(project, {}).get(number, -1)
+
+    def column(self, mapping, default=None, typecode=None):
+        """Turn a {key: value} dict into a list (or typed array) indexed by id.
+
+        Keys not interned yet are ignored; ids without a value get default."""
+        col = [default] * len(self.keys)
+        for k, v in mapping.items():
+            i = self.id(k)
+            if i >= 0:
+                col[i] = v
+        return array(typecode, col) if typecode else col
+
+    def bitset(self, keys):
+        """Bitset of the ids of keys (keys not interned yet are ignored)."""
+        bs = Bitset(len(self.keys))
+        for k in keys:
+            i = self.id(k)
+            if i >= 0:
+                bs.add(i)
+        return bs
+
+
+class Bitset:
+    """Fixed-size set of small ints backed by a bytearray."""
+    __slots__ = ("bits",)
+
+    def __init__(self, size):
+        self.bits = bytearray((size + 7) >> 3)
+
+    def add(self, i):
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def __contains__(self, i):
+        return 0 <= i < len(self.bits) << 3 and bool(self.bits[i >> 3] & (1 << (i & 7)))
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Automatic outlier candidates for cycle-time curation.
+
+Flags issues whose cycle time or In Progress time is extreme relative to
+their own sprint (robust z-score on the median absolute deviation, plus
+Tukey IQR fences), and issues that were closed as part of a batch: many
+issues moved to Done by the same author on the same day.  The result is a
+ranked candidate list with human-readable reasons, meant to replace the
+ad-hoc investigate_*.py scripts used to build EXCLUDED_KEYS by hand.
+
+Usage: python3 outliers.py [--top N]
+"""
+import json, os, sys, glob, time, math
+from collections import defaultdict
+from datetime import datetime
+
+from records import IssueRecord
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+
+MAD_Z_THRESHOLD  = 3.5    # Iglewicz & Hoaglin modified z-score cut-off
+IQR_K            = 1.5    # Tukey fence multiplier
+MIN_SPRINT_N     = 8      # smaller sprints fall back to pooled statistics
+BATCH_MIN_SIZE   = 3      # same author + same day closes to count as a batch
+OUTLIER_FIELDS   = [
+    # (record field, label)
+    ("cycle_days", "cycle time"),
+    ("ip_days",    "In Progress time"),
+]
+
+
+def _quantile(sorted_vals, q):
+    """Linear-interpolated quantile (0-1) of an already sorted list."""
+    n = len(sorted_vals)
+    k = q * (n - 1)
+    f = math.floor(k)
+    c = math.ceil(k)
+    if f == c:
+        return sorted_vals[f]
+    return sorted_vals[f] * (c - k) + sorted_vals[c] * (k - f)
+
+
+def robust_stats(values):
+    """Return (median, mad, q1, q3) for a list of numbers, or None if empty."""
+    if not values:
+        return None
+    vals = sorted(values)
+    med = _quantile(vals, 0.5)
+    mad = _quantile(sorted(abs(v - med) for v in vals), 0.5)
+    return med, mad, _quantile(vals, 0.25), _quantile(vals, 0.75)
+
+
+def batch_close_groups(done_events):
+    """Group Done transitions by (author, day).
+
+    done_events maps key -> (author, ISO timestamp) of the final transition
+    to Done.  Returns key -> (author, day, batch_size) for every key whose
+    group has at least BATCH_MIN_SIZE members."""
+    groups = defaultdict(list)
+    for key, (author, ts) in done_events.items():
+        if author and ts:
+            groups[(author, ts[:10])].append(key)
+    out = {}
+    for (author, day), keys in groups.items():
+        if len(keys) >= BATCH_MIN_SIZE:
+            for k in keys:
+                out[k] = (author, day, len(keys))
+    return out
+
+
+def find_candidates(records, done_events=None):
+    """Rank outlier candidates.
+
+    records are IssueRecords (see records.py); those without a cycle time
+    are ignored.  Returns a list of {"key", "sprint", "score", "reasons"}
+    sorted by descending score."""
+    rows = [r for r in records if r.cycle_days is not None]
+
+    # One pass to bucket values per sprint (and pooled), one pass to score.
+    by_sprint = defaultdict(lambda: defaultdict(list))
+    pooled = defaultdict(list)
+    for r in rows:
+        for field, _label in OUTLIER_FIELDS:
+            v = getattr(r, field)
+            if v is not None:
+                by_sprint[r.sprint][field].append(v)
+                pooled[field].append(v)
+
+    # field -> (stats, scope); scope names the population in the reasons.
+    pooled_stats = {f: (robust_stats(v), "pooled") for f, v in pooled.items()}
+    sprint_stats = {}
+    for sp, fields in by_sprint.items():
+        sprint_stats[sp] = {}
+        for f, vals in fields.items():
+            sprint_stats[sp][f] = ((robust_stats(vals), "sprint") if len(vals) >= MIN_SPRINT_N
+                                   else pooled_stats[f])
+
+    batches = batch_close_groups(done_events or {})
+
+    candidates = []
+    for r in rows:
+        score = 0.0
+        reasons = []
+        stats = sprint_stats.get(r.sprint, pooled_stats)
+        for field, label in OUTLIER_FIELDS:
+            v = getattr(r, field)
+            if v is None or field not in stats:
+                continue
+            (med, mad, q1, q3), scope = stats[field]
+            fence = q3 + IQR_K * (q3 - q1)
+            z = 0.6745 * (v - med) / mad if mad > 0 else 0.0
+            if z > MAD_Z_THRESHOLD:
+                score += z
+                reasons.append(f"{label} {v:.1f}d is {z:.1f} MADs above "
+                               f"{scope} median {med:.1f}d")
+            elif v > fence:
+                score += 1.0 + (v - fence) / max(fence, 1.0)
+                reasons.append(f"{label} {v:.1f}d above {scope} IQR fence {fence:.1f}d")
+
+        batch = batches.get(r.key)
+        if batch:
+            author, day, size = batch
+            med_ct = stats["cycle_days"][0][0] if "cycle_days" in stats else 0
+            # Batch closes only matter when the item had been sitting open;
+            # a burst of quick items closed at sprint end is normal.
+            if r.cycle_days > med_ct:
+                score += math.log2(size)
+                reasons.append(f"batch-closed with {size - 1} other issue(s) "
+                               f"by {author} on {day}")
+
+        if reasons:
+            candidates.append({"key": r.key, "sprint": r.sprint,
+                               "score": round(score, 2), "reasons": reasons})
+
+    candidates.sort(key=lambda c: (-c["score"], c["key"]))
+    return candidates
+
+
+def load_done_events(raw_paths):
+    """Return key -> (author, timestamp) of each issue's final move to Done.
+
+    Files are read in order and a later file's event wins, as in analyze.py."""
+    events = {}
+    for path in raw_paths:
+        with open(path) as f:
+            raw = json.load(f)
+        for iss in raw.get("issues", []):
+            last = None
+            for cl in iss.get("changelogs", []):
+                for item in cl.get("items", []):
+                    if item.get("field") == "status" and item.get("to_string") == "Done":
+                        last = ((cl.get("author") or {}).get("display_name"),
+                                cl.get("created"))
+            if last:
+                events[iss["key"]] = last
+    return events
+
+
+def main():
+    top = 30
+    if "--top" in sys.argv:
+        top = int(sys.argv[sys.argv.index("--top") + 1])
+
+    with open(os.path.join(BASE, "issue_data_full.json")) as f:
+        issues = json.load(f)
+    with open(os.path.join(BASE, "key_to_sprint.json")) as f:
+        k2s = json.load(f)
+    # The pattern also matches raw_search_sample_*.json, which sort last.
+    raw_paths = sorted(glob.glob(os.path.join(BASE, "raw_search_*.json")))
+    done_events = load_done_events(raw_paths)
+
+    # Calendar-day cycle time here; analyze.py feeds business-day records.
+    records = []
+    for key, d in issues.items():
+        cycle = None
+        if d.get("first_active") and d.get("done_at"):
+            fa = datetime.fromisoformat(d["first_active"])
+            da = datetime.fromisoformat(d["done_at"])
+            cycle = (da - fa).total_seconds() / 86400
+        records.append(IssueRecord(key=key, sprint=k2s.get(key, "Unknown"),
+                                   cycle_days=cycle,
+                                   ip_days=d.get("in_progress_minutes", 0) / 1440))
+
+    t0 = time.perf_counter()
+    candidates = find_candidates(records, done_events)
+    elapsed = (time.perf_counter() - t0) * 1000
+
+    print(f"{len(candidates)} candidates from {len(records)} issues "
+          f"in {elapsed:.1f} ms\n")
+    for c in candidates[:top]:
+        print(f"{c['key']:12s} {c['sprint'].replace('BIP AI ', ''):10s} "
+              f"score={c['score']:>5.1f}")
+        for reason in c["reasons"]:
+            print(f"              - {reason}")
+
+
+if __name__ == "__main__":
+    main()
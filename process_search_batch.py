@@ -2,11 +2,18 @@
 """
 Process search results with expand=changelog into issue_data_full.json format.
 Reads raw_search_batch_<N>.json files, extracts status transitions, computes durations.
+Done issues go to issue_data_full.json; issues still open go to open_issues.json
+(with their current status and when their current stint of active work began)
+for the aging-WIP report.
 Usage: python3 process_search_batch.py <batch_number>
 """
 import json, sys, os
 from datetime import datetime
 
+from classify import classify_issue, DEFAULT_WORK_TYPE
+from sprint_files import sprint_index, sprint_names
+from flow import WIP_STATES
+
 def parse_dt(s):
     """Parse Jira datetime string"""
     if not s:
@@ -52,8 +59,7 @@ def process_issue(issue):
     resolution_date = issue.get("resolutiondate", "")
     status_name = issue.get("status", {}).get("name", "")
     
-    if status_name != "Done":
-        return None  # Skip non-Done issues
+    is_done = status_name == "Done"
     
     changelogs = issue.get("changelogs", [])
     
@@ -86,7 +92,9 @@ def process_issue(issue):
             done_at = sc["timestamp"]
             break
     
-    if not first_active or not done_at:
+    if not is_done:
+        done_at = None      # reopened issues carry an old Done transition
+    elif not first_active or not done_at:
         return None  # Skip if no IP->Done transition found
     
     # Compute status durations from transitions
@@ -102,6 +110,7 @@ def process_issue(issue):
     # Build timeline: start from created in Backlog, then apply transitions
     current_status = "backlog"
     current_ts = parse_dt(created)
+    active_since = None     # start of the current run of WIP statuses
     
     for sc in status_changes:
         sc_ts = parse_dt(sc["timestamp"])
@@ -117,6 +126,21 @@ def process_issue(issue):
         elif sc["to"] == "Done":
             current_status = "done"
         current_ts = sc_ts
+        if sc["to"] in WIP_STATES:
+            if active_since is None or sc["from"] not in WIP_STATES:
+                active_since = sc["timestamp"]
+        else:
+            active_since = None
+    
+    if not is_done:
+        return {
+            "created": created,
+            "status": status_name,
+            "status_since": status_changes[-1]["timestamp"] if status_changes else created,
+            "first_active": first_active,
+            "active_since": active_since,
+            **durations,
+        }
     
     return {
         "created": created,
@@ -127,9 +151,23 @@ def process_issue(issue):
     }
 
 
+def load_work_types():
+    """Classify every issue in the sprint files -> {key: work_type}.
+
+    An issue listed in several sprints keeps the first non-default type."""
+    work_types = {}
+    for sprint in sprint_names():
+        for iss in sprint_index(sprint):
+            if work_types.get(iss["key"], DEFAULT_WORK_TYPE) == DEFAULT_WORK_TYPE:
+                work_types[iss["key"]] = classify_issue(iss)
+    return work_types
+
+
 def main():
     import glob as _glob
     out_file = "issue_data_full.json"
+    open_file = "open_issues.json"
+    work_types = load_work_types()
 
     # If a batch number is provided, process that single file (legacy mode).
     # Otherwise reprocess ALL raw_search_*.json + raw_search_sample_*.json files from scratch.
@@ -141,6 +179,7 @@ def main():
             print("No raw_search_*.json files found"); sys.exit(1)
 
     data = {}   # rebuild from scratch
+    open_data = {}
     added = 0
     skipped = 0
     for raw_file in raw_files:
@@ -148,18 +187,24 @@ def main():
         issues = raw.get("issues", [])
         for issue in issues:
             key = issue["key"]
-            if key in data:
+            if key in data or key in open_data:
                 skipped += 1
                 continue
             result = process_issue(issue)
             if result:
-                data[key] = result
+                result["work_type"] = work_types.get(key, DEFAULT_WORK_TYPE)
+                if "status" in result:
+                    open_data[key] = result
+                else:
+                    data[key] = result
                 added += 1
             else:
                 skipped += 1
 
     json.dump(data, open(out_file, "w"))
-    print(f"Processed {len(raw_files)} files: {added} issues added, {skipped} skipped. Total: {len(data)}")
+    json.dump(open_data, open(open_file, "w"))
+    print(f"Processed {len(raw_files)} files: {added} issues added, {skipped} skipped. "
+          f"Total: {len(data)} done, {len(open_data)} open")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Per-issue record type and a columnar view over a list of records.
+
+IssueRecord is a slotted dataclass (no per-instance __dict__), several times
+smaller than the 14-key dicts analyze.py used to build.  RecordTable adds
+column access on top: each column is materialised once and cached, so
+aggregations are reductions over a column rather than fresh list
+comprehensions over the records.
+"""
+from array import array
+from dataclasses import dataclass, fields
+from itertools import compress
+from collections import defaultdict
+
+
+@dataclass(slots=True)
+class IssueRecord:
+    key: str
+    sprint: str
+    id: int = -1
+    excl: int = 0
+    cycle_days: float = None
+    lead_days: float = None
+    backlog_days: float = 0.0
+    ip_days: float = 0.0
+    test_days: float = 0.0
+    pr_days: float = 0.0
+    blocked_days: float = 0.0
+    flagged_days: float = 0.0
+    cancel_days: float = 0.0
+    active_days: float = 0.0
+    has_cycle: bool = False
+    rework: int = 0
+
+
+RECORD_FIELDS = tuple(f.name for f in fields(IssueRecord))
+# Columns that are never None are stored as typed arrays.
+_FLOAT_COLUMNS = {"backlog_days", "ip_days", "test_days", "pr_days",
+                  "blocked_days", "flagged_days", "cancel_days", "active_days"}
+
+
+class RecordTable:
+    """Immutable sequence of IssueRecords with cached column access."""
+
+    def __init__(self, records):
+        self.records = list(records)
+        self._cols = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, i):
+        return self.records[i]
+
+    def column(self, name):
+        """All values of one field, in record order (cached)."""
+        col = self._cols.get(name)
+        if col is None:
+            values = [getattr(r, name) for r in self.records]
+            col = array("d", values) if name in _FLOAT_COLUMNS else values
+            self._cols[name] = col
+        return col
+
+    def select(self, name, where=None):
+        """Values of column name, optionally filtered by a boolean column."""
+        if where is None:
+            return list(self.column(name))
+        return list(compress(self.column(name), self.column(where)))
+
+    def total(self, name, where=None):
+        return sum(self.select(name, where))
+
+    def group_by(self, name):
+        """{value: RecordTable} in one pass over the records."""
+        groups = defaultdict(list)
+        for value, r in zip(self.column(name), self.records):
+            groups[value].append(r)
+        return {value: RecordTable(rs) for value, rs in groups.items()}
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Carryover and scope churn per sprint, from sprint membership intervals.
+
+Input is the per-issue sprint-interval table built in analyze.py's
+changelog pass ({key: [(sprint, added, removed)]}, see
+sprints.sprint_memberships()).  One pass over the intervals classifies
+each membership against its sprint window:
+
+  committed   member at the commitment cut-off (sprint start + COMMIT_GRACE,
+              so items pulled in during planning count as planned; planning
+              has slipped into a sprint's second day, e.g. FY26Q1.1)
+  added       joined after the cut-off, before the sprint ended
+  removed     left after the sprint started, before it ended (items pulled
+              out during planning count here, not as committed)
+  carried     still a member when the sprint ended but done after it
+  carried_in  done in this sprint after being a member of an earlier one
+
+Only issues present in the changelog extract are counted, so these are
+rates among delivered work, not a full board audit.
+"""
+from datetime import timedelta
+
+COMMIT_GRACE = timedelta(days=2)
+SCOPE_FIELDS = ("committed", "added", "removed", "carried_over", "carried_in",
+                "completed", "sp_added", "sp_changed")
+
+
+def sprint_scope(memberships, windows, done_at, done_sprint, sp_at=None):
+    """{sprint: {field: value}} for every sprint in `windows`.
+
+    memberships  {key: [(sprint, added, removed)]}
+    windows      sprints.SprintWindowIndex
+    done_at      {key: datetime of the final move to Done}
+    done_sprint  {key: sprint the issue is attributed to}
+    sp_at        optional (key, ts) -> story points; adds sp_added (points
+                 of items added mid-sprint) and sp_changed (re-estimation
+                 of committed items between cut-off and sprint end)"""
+    out = {s: dict.fromkeys(SCOPE_FIELDS, 0) for s in windows.names}
+    bounds = {s: windows.window(s) for s in windows.names}
+    for key, rows in memberships.items():
+        done = done_at.get(key)
+        home = done_sprint.get(key)
+        earlier = False
+        rows = sorted((r for r in rows if r[0] in bounds), key=lambda r: bounds[r[0]][0])
+        for sprint, added, removed in rows:
+            start, end = bounds[sprint]
+            cutoff = start + COMMIT_GRACE
+            if added >= end or (removed is not None and removed <= start):
+                continue                      # never overlapped the window
+            row = out[sprint]
+            if sprint == home:
+                row["completed"] += 1
+                if earlier:
+                    row["carried_in"] += 1
+            earlier = True
+            if added <= cutoff:
+                if removed is not None and removed <= cutoff:
+                    row["removed"] += 1   # pulled out during planning
+                    continue
+                row["committed"] += 1
+                if sp_at:
+                    before, after = sp_at(key, cutoff), sp_at(key, min(end, done or end))
+                    if before is not None and after is not None:
+                        row["sp_changed"] += after - before
+            else:
+                row["added"] += 1
+                if sp_at:
+                    row["sp_added"] += sp_at(key, added) or 0
+            if removed is not None and removed < end:
+                row["removed"] += 1
+            elif done is not None and done >= end and sprint != home:
+                row["carried_over"] += 1
+    for row in out.values():
+        base = row["committed"]
+        row["churn_pct"] = round((row["added"] + row["removed"]) / base * 100, 1) if base else None
+        row["sp_added"] = round(row["sp_added"], 1)
+        row["sp_changed"] = round(row["sp_changed"], 1)
+    return out
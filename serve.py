@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Local dashboard server with a cached, filterable metrics API.
+
+Serves dashboard.html and its dashboard_data/ chunks, plus JSON endpoints
+the page queries when its filter bar changes:
+
+  /api/meta                       sprints, teams, SP buckets, exclusions
+  /api/metrics?<filters>          overall stats, per-sprint series, status split
+  /api/issues?<filters>           the matching issues (columnar)
+
+Filters: sprint_from / sprint_to (full or short sprint name), team and sp
+(comma-separated team labels / SP buckets), exclude (exclusion bitmask;
+defaults to the dashboard's).
+
+Per-issue business-day metrics, teams and exclusion bits come from
+analyze.py's "issues" chunk (done_at from issue_data_full.json); the
+business days there are unrounded and are rounded only in responses.  The rows
+are loaded once into a cube (cube.py) over sprint x team x SP bucket x
+exclusion bits, so /api/metrics merges a few pre-aggregated cells instead
+of scanning issues.  Percentiles are exact: each cell of the cuboid read
+also has its cycle times as a sorted list (built once per cuboid), and the
+selected lists are merged - the cube's sketch is too coarse for small
+per-sprint samples.  Data is reloaded (and the cache cleared) when
+analyze.py rewrites the chunk manifest; until analyze.py has run the API
+answers 503.  Responses are memoized in an LRU cache keyed by the
+normalized filter, carry a content-hash ETag per encoding (If-None-Match
+-> 304) and are sent gzipped when the client accepts it; static chunks use
+their precompressed .json.gz sibling.
+
+Usage: python3 serve.py [port]        # then open http://localhost:8765/
+"""
+import gzip, hashlib, heapq, json, os, sys, threading
+from functools import lru_cache
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+from aging import CycleTimeCDF
+from classify import TEAM_LABELS, UNTAGGED_TEAM
+from cube import SP_BUCKETS, Agg, Cube, sp_bucket
+from sprints import SPRINT_WINDOWS
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+ISSUE_DATA = os.path.join(BASE, "issue_data_full.json")
+METRICS_JSON = os.path.join(BASE, "computed_metrics.json")
+DATA_DIR = os.path.join(BASE, "dashboard_data")
+MANIFEST = os.path.join(DATA_DIR, "manifest.json")
+ISSUES_CHUNK = os.path.join(DATA_DIR, "issues.json")
+CUBE_DIMS = ("sprint", "team", "sp_bucket", "excl")
+STATUS_FIELDS = (("In Progress", "ip"), ("In Testing", "test"),
+                 ("Peer Review Needed", "pr"), ("Blocked", "blocked"))
+DAY_COLUMNS = {"cycle", "flagged"} | {f for _name, f in STATUS_FIELDS}   # rounded on output
+STATIC = {"/": "dashboard.html", "/dashboard.html": "dashboard.html",
+          "/computed_metrics.json": "computed_metrics.json"}
+CONTENT_TYPES = {".html": "text/html; charset=utf-8", ".json": "application/json"}
+CACHE_SIZE = 256
+DEFAULT_PORT = 8765
+
+
+def _load_json(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
+def _short(sprint):
+    return sprint.replace("BIP AI ", "")
+
+
+class DashboardData:
+    """Everything the API filters over, loaded once per analyze.py run."""
+
+    def __init__(self, stamp):
+        self.stamp = stamp
+        self.sprints = list(SPRINT_WINDOWS)
+        self.position = {s: i for i, s in enumerate(self.sprints)}
+        issue_data = _load_json(ISSUE_DATA, {})
+        metrics = _load_json(METRICS_JSON, {})
+        self.exclusions = metrics.get("exclusions", [])
+        self.exclude_mask = metrics.get("exclude_mask", 0)
+
+        chunk = _load_json(ISSUES_CHUNK)
+        self.rows = []
+        self.cube = Cube(CUBE_DIMS)
+        self._cycles = {}     # cuboid dims -> {coords: sorted cycle times}
+        for values in chunk["rows"]:
+            d = dict(zip(chunk["columns"], values))
+            d["sp_bucket"] = sp_bucket(d["sp"])
+            d["done_at"] = issue_data.get(d["key"], {}).get("done_at")
+            self.rows.append(d)
+            # Status days only for issues with a cycle time, as on the page.
+            self.cube.add([d[dim] for dim in CUBE_DIMS], sp=d["sp"], cycle=d["cycle"],
+                          status_days=({f: d[f] for _name, f in STATUS_FIELDS}
+                                       if d["cycle"] is not None else None))
+        self.cube.build()
+        self.teams = [t for t in TEAM_LABELS + [UNTAGGED_TEAM]
+                      if t in self.cube.members("team")]
+
+    def sprint_pos(self, name, default):
+        """Position of a full or short sprint name (default if absent)."""
+        if not name:
+            return default
+        for s, i in self.position.items():
+            if name in (s, _short(s)):
+                return i
+        raise ValueError(f"unknown sprint: {name}")
+
+    def normalize(self, query):
+        """Query-string dict -> hashable filter tuple (the cache key)."""
+        def one(k):
+            return (query.get(k) or [""])[0]
+
+        def many(k):
+            return tuple(sorted({v for raw in query.get(k, []) for v in raw.split(",") if v}))
+
+        lo = self.sprint_pos(one("sprint_from"), 0)
+        hi = self.sprint_pos(one("sprint_to"), len(self.sprints) - 1)
+        mask = int(one("exclude")) if one("exclude") else self.exclude_mask
+        return (lo, hi, many("team"), many("sp"), mask)
+
+    def select(self, key):
+        lo, hi, teams, sps, mask = key
+        return [r for r in self.rows
+                if lo <= self.position.get(r["sprint"], -1) <= hi
+                and not r["excl"] & mask
+                and (not teams or r["team"] in teams)
+                and (not sps or r["sp_bucket"] in sps)]
+
+    def meta(self):
+        return {"sprints": self.sprints, "teams": self.teams,
+                "sp_buckets": [label for _top, label in SP_BUCKETS],
+                "exclusions": self.exclusions, "exclude_mask": self.exclude_mask}
+
+    def cycle_lists(self, by):
+        """{coords: sorted cycle times} for the cuboid grouped by `by`."""
+        lists = self._cycles.get(by)
+        if lists is None:
+            lists = {}
+            for r in self.rows:
+                if r["cycle"] is not None:
+                    lists.setdefault(tuple(r[dim] for dim in by), []).append(r["cycle"])
+            for v in lists.values():
+                v.sort()
+            self._cycles[by] = lists
+        return lists
+
+    def cells(self, key):
+        """[(sprint, team, Agg, sorted cycle times)] of the cube cells matching
+        the filter.
+
+        Read from the cuboid that keeps sprint and team plus only the
+        dimensions actually filtered, so unfiltered ones arrive rolled up."""
+        lo, hi, teams, sps, mask = key
+        allowed = {"sprint": set(self.sprints[lo:hi + 1])}
+        if teams:
+            allowed["team"] = set(teams)
+        if sps:
+            allowed["sp_bucket"] = set(sps)
+        if mask:
+            allowed["excl"] = {b for b in self.cube.members("excl") if not b & mask}
+        by = tuple(dim for dim in CUBE_DIMS if dim in ("sprint", "team") or dim in allowed)
+        cycles = self.cycle_lists(by)
+        return [(coords[0], coords[1], agg, cycles.get(coords, []))
+                for coords, agg in self.cube.rollup(*by).items()
+                if all(coords[by.index(dim)] in ok for dim, ok in allowed.items())]
+
+    def metrics(self, key):
+        lo, hi = key[0], key[1]
+        overall, all_cycles = Agg(), []
+        by_sprint = {s: Agg() for s in self.sprints[lo:hi + 1]}
+        sprint_cycles = {s: [] for s in by_sprint}
+        by_team = {t: Agg() for t in self.teams}
+        for sprint, team, agg, cycles in self.cells(key):
+            overall = overall.merge(agg)
+            by_sprint[sprint] = by_sprint[sprint].merge(agg)
+            by_team[team] = by_team[team].merge(agg)
+            sprint_cycles[sprint].append(cycles)
+            all_cycles.append(cycles)
+        status = {name: overall.status_days.get(f, 0.0) for name, f in STATUS_FIELDS}
+        total = sum(status.values())
+        return {
+            "filter": {"sprint_from": self.sprints[lo], "sprint_to": self.sprints[hi],
+                       "team": list(key[2]), "sp": list(key[3]), "exclude": key[4]},
+            "overall": dict(_cycle_stats(overall, all_cycles), sample_size=overall.n,
+                            story_points=round(overall.sp, 1)),
+            "sprints": [dict(_cycle_stats(agg, sprint_cycles[s]), sprint=s, issues=agg.n,
+                             story_points=round(agg.sp, 1), **_status_avgs(agg))
+                        for s, agg in by_sprint.items()],
+            "status_pct": {k: round(v / total * 100, 1) if total else 0 for k, v in status.items()},
+            "teams": {t: agg.n for t, agg in by_team.items()},
+        }
+
+    def issues(self, key):
+        cols = ("key", "sprint", "team", "sp", "cycle", "ip", "test", "pr", "blocked",
+                "flagged", "done_at")
+        return {"columns": list(cols),
+                "rows": [[round(r[c], 2) if c in DAY_COLUMNS and r[c] is not None else r[c]
+                          for c in cols]
+                         for r in self.select(key)]}
+
+
+def _cycle_stats(agg, cycle_lists):
+    """Cycle-time stats of merged cells: mean from the Agg, exact
+    percentiles from the cells' sorted cycle-time lists."""
+    n = agg.cycle.n
+    if not n:
+        return {"with_cycle": 0, "cycle_median": None, "cycle_mean": None,
+                "cycle_p85": None, "cycle_p95": None}
+    cdf = CycleTimeCDF(list(heapq.merge(*cycle_lists)))
+    return {"with_cycle": n,
+            "cycle_median": round(cdf.percentile(50), 2),
+            "cycle_mean": round(agg.cycle_sum / n, 2),
+            "cycle_p85": round(cdf.percentile(85), 2),
+            "cycle_p95": round(cdf.percentile(95), 2)}
+
+
+def _status_avgs(agg):
+    n = agg.cycle.n or 1
+    return {f"avg_{f}_days": round(agg.status_days.get(f, 0.0) / n, 2)
+            for _name, f in STATUS_FIELDS}
+
+
+# ── Data, cache and encoded responses ───────────────────────────────────────
+_data = None
+_lock = threading.Lock()
+
+
+def _manifest_stamp():
+    try:
+        return os.stat(MANIFEST).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def current_data():
+    """The loaded data, reloaded when analyze.py has rewritten the chunks;
+    None while the manifest or the issues chunk is missing."""
+    global _data
+    with _lock:
+        stamp = _manifest_stamp()
+        if stamp is None or not os.path.isfile(ISSUES_CHUNK):
+            _data = None
+        elif _data is None or stamp != _data.stamp:
+            _data = DashboardData(stamp)
+            _response.cache_clear()
+        return _data
+
+
+def encode(obj):
+    """(body, gzipped body, etag) for a JSON-serializable object."""
+    body = json.dumps(obj, separators=(",", ":")).encode()
+    return body, gzip.compress(body, mtime=0), hashlib.sha1(body).hexdigest()[:16]
+
+
+def etag_matches(header, etag):
+    """True if an If-None-Match header lists etag (weak comparison) or is '*'."""
+    tags = [t.strip() for t in (header or "").split(",")]
+    return "*" in tags or etag in (t[2:] if t.startswith("W/") else t for t in tags)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _response(data, endpoint, key):
+    if endpoint == "meta":
+        return encode(data.meta())
+    if endpoint == "metrics":
+        return encode(data.metrics(key))
+    return encode(data.issues(key))
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "DashboardServer/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path.startswith("/api/"):
+            self.api(url.path[len("/api/"):], parse_qs(url.query))
+        else:
+            self.static(url.path)
+
+    def api(self, endpoint, query):
+        if endpoint not in ("meta", "metrics", "issues"):
+            return self.send_error(404)
+        data = current_data()
+        if data is None:
+            return self.send_error(503, "dashboard data not found; run analyze.py first")
+        try:
+            key = None if endpoint == "meta" else data.normalize(query)
+        except ValueError as e:
+            return self.send_error(400, str(e))
+        body, gz, etag = _response(data, endpoint, key)
+        self.reply(body, gz, etag, "application/json", "no-cache")
+
+    def static(self, path):
+        if path in STATIC:
+            rel = STATIC[path]
+        elif path.startswith("/dashboard_data/") and ".." not in path:
+            rel = path.lstrip("/")
+        else:
+            return self.send_error(404)
+        full = os.path.join(BASE, rel)
+        if not os.path.isfile(full):
+            return self.send_error(404)
+        st = os.stat(full)
+        etag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        with open(full, "rb") as f:
+            body = f.read()
+        gz = None
+        if os.path.isfile(full + ".gz"):
+            with open(full + ".gz", "rb") as f:
+                gz = f.read()
+        self.reply(body, gz, etag, CONTENT_TYPES.get(os.path.splitext(full)[1],
+                                                     "application/octet-stream"), "no-cache")
+
+    def reply(self, body, gz, tag, content_type, cache_control):
+        """Send body (or gz when accepted); tag is the unquoted ETag of body."""
+        use_gz = gz is not None and "gzip" in (self.headers.get("Accept-Encoding") or "")
+        payload = gz if use_gz else body
+        etag = f'"{tag}-gz"' if use_gz else f'"{tag}"'
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gz:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, fmt, *args):
+        sys.stderr.write("%s %s\n" % (self.log_date_time_string(), fmt % args))
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PORT
+    data = current_data()
+    if data is None:
+        print("No dashboard data yet: run analyze.py (the API answers 503 until then)")
+    else:
+        print(f"Loaded {len(data.rows)} issues across {len(data.sprints)} sprints")
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    print(f"Serving http://localhost:{port}/  (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
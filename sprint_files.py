@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Shared loader for sprint_issues/*.json.
+
+The sprint files carry full Markdown descriptions, but most consumers only
+need a handful of fields.  sprint_index() serves those fields from a
+sidecar file (sprint_index.json) that is rebuilt only when a sprint file's
+size or mtime changes, so throughput counts and work-type classification
+never decode descriptions.  Index entries are SprintIssue dicts: any field
+outside INDEX_FIELDS is fetched from the full file on first access.
+Full files are parsed at most once per process (load_sprint()).
+
+Usage: python3 sprint_files.py        # rebuild the sidecar index and report
+"""
+import json, os, glob
+
+BASE = os.path.dirname(os.path.abspath(__file__))
+SPRINT_DIR = os.path.join(BASE, "sprint_issues")
+INDEX_FILE = os.path.join(BASE, "sprint_index.json")
+
+INDEX_FIELDS = ("key", "status", "summary", "labels", "assignee")
+
+_full_cache = {}    # path -> (stamp, [issue, ...], {key: issue})
+_index_cache = None # file basename -> {"stamp": [...], "issues": [...]}
+
+
+def sprint_path(sprint):
+    """'BIP AI FY26Q1.1' -> .../sprint_issues/BIP_AI_FY26Q1.1.json"""
+    return os.path.join(SPRINT_DIR, sprint.replace(" ", "_") + ".json")
+
+def sprint_paths():
+    """All sprint files on disk, sorted by name."""
+    return sorted(glob.glob(os.path.join(SPRINT_DIR, "*.json")))
+
+def _stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _load_full(path):
+    stamp = _stamp(path)
+    cached = _full_cache.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path) as f:
+            issues = json.load(f)
+        cached = (stamp, issues, {iss["key"]: iss for iss in issues})
+        _full_cache[path] = cached
+    return cached
+
+def load_sprint(sprint):
+    """Full issue dicts for a sprint (parsed once per process), [] if missing."""
+    path = sprint_path(sprint)
+    if not os.path.exists(path):
+        return []
+    return _load_full(path)[1]
+
+
+class SprintIssue(dict):
+    """Index entry; non-index fields load the full sprint file lazily."""
+    __slots__ = ("_path",)
+
+    def _full(self):
+        return _load_full(self._path)[2].get(self["key"], {})
+
+    def __missing__(self, field):
+        full = self._full()
+        if field not in full:
+            raise KeyError(field)
+        return full[field]
+
+    def get(self, field, default=None):
+        if dict.__contains__(self, field):
+            return dict.__getitem__(self, field)
+        return self._full().get(field, default)
+
+
+def _index_entry(iss):
+    status = iss.get("status") or {}
+    assignee = iss.get("assignee") or None
+    return {
+        "key": iss["key"],
+        "status": {"name": status.get("name"), "category": status.get("category")},
+        "summary": iss.get("summary"),
+        "labels": iss.get("labels") or [],
+        "assignee": ({"display_name": assignee.get("display_name"),
+                      "name": assignee.get("name")} if assignee else None),
+    }
+
+def _load_index():
+    """Load the sidecar and refresh stale entries; rewrite it if anything changed."""
+    global _index_cache
+    if _index_cache is None:
+        try:
+            with open(INDEX_FILE) as f:
+                _index_cache = json.load(f)
+        except (OSError, ValueError):
+            _index_cache = {}
+    changed = False
+    for path in sprint_paths():
+        name = os.path.basename(path)
+        stamp = _stamp(path)
+        entry = _index_cache.get(name)
+        if entry is None or entry["stamp"] != stamp:
+            _index_cache[name] = {"stamp": stamp,
+                                  "issues": [_index_entry(i) for i in _load_full(path)[1]]}
+            changed = True
+    if changed:
+        with open(INDEX_FILE, "w") as f:
+            json.dump(_index_cache, f, separators=(",", ":"))
+    return _index_cache
+
+def sprint_index(sprint):
+    """Light-weight SprintIssue entries for a sprint, [] if the file is missing."""
+    path = sprint_path(sprint)
+    if not os.path.exists(path):
+        return []
+    out = []
+    for fields in _load_index()[os.path.basename(path)]["issues"]:
+        iss = SprintIssue(fields)
+        iss._path = path
+        out.append(iss)
+    return out
+
+def sprint_names():
+    """Sprint names ('BIP AI FY26Q1.1', ...) of every file on disk."""
+    return [os.path.basename(p)[:-5].replace("_", " ") for p in sprint_paths()]
+
+
+if __name__ == "__main__":
+    total = 0
+    for sp in sprint_names():
+        n = len(sprint_index(sp))
+        total += n
+        print(f"{sp:20s} {n:4d} issues")
+    print(f"Indexed {total} issues -> {INDEX_FILE}")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Sprint windows and per-issue sprint membership.
+
+SprintWindowIndex keeps the sprint start instants sorted, so mapping any
+timestamp (e.g. done_at) to the sprint running at that moment is one
+bisect.  A sprint's window runs from 00:00 on its first day up to the
+start of the next sprint, so weekend work after the last day still
+belongs to the sprint that just ended; the last sprint ends at midnight
+after its last day.
+
+sprint_memberships() rebuilds, from the Sprint field changes in the
+changelog, when an issue was added to and removed from each sprint.  The
+field holds a comma-separated list of every sprint the issue has been
+in, so memberships are the set differences between consecutive values.
+
+Usage: python3 sprints.py [timestamp ...]
+"""
+import sys
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+
+# (first day, last day) of each sprint, in sprint order.
+SPRINT_WINDOWS = {
+    "BIP AI FY25Q4.1": ("2025-07-07", "2025-07-18"),
+    "BIP AI FY25Q4.2": ("2025-07-21", "2025-08-01"),
+    "BIP AI FY25Q4.3": ("2025-08-04", "2025-08-15"),
+    "BIP AI FY25Q4.4": ("2025-08-18", "2025-08-29"),
+    "BIP AI FY25Q4.5": ("2025-09-01", "2025-09-12"),
+    "BIP AI FY25Q4.6": ("2025-09-15", "2025-09-26"),
+    "BIP AI FY25Q4.7": ("2025-09-29", "2025-10-03"),
+    "BIP AI FY26Q1.1": ("2025-10-06", "2025-10-17"),
+    "BIP AI FY26Q1.2": ("2025-10-20", "2025-10-31"),
+    "BIP AI FY26Q1.3": ("2025-11-03", "2025-11-14"),
+    "BIP AI FY26Q1.4": ("2025-11-17", "2025-11-28"),
+    "BIP AI FY26Q1.5": ("2025-12-01", "2025-12-12"),
+    "BIP AI FY26Q1.6": ("2025-12-15", "2025-12-26"),
+    "BIP AI FY26Q1.7": ("2025-12-29", "2026-01-09"),
+    "BIP AI FY26Q2.1": ("2026-01-12", "2026-01-23"),
+    "BIP AI FY26Q2.2": ("2026-01-26", "2026-02-06"),
+    "BIP AI FY26Q2.3": ("2026-02-09", "2026-02-20"),
+}
+
+
+class SprintWindowIndex:
+    def __init__(self, windows=SPRINT_WINDOWS, tz=None):
+        rows = sorted((date.fromisoformat(a), date.fromisoformat(b), name)
+                      for name, (a, b) in windows.items())
+        self.names = [name for _a, _b, name in rows]
+        self.days = {name: (a, b) for a, b, name in rows}
+        self.starts = [datetime.combine(a, time(), tz) for a, _b, _n in rows]
+        last_day = rows[-1][1] if rows else None
+        self.end = datetime.combine(last_day + timedelta(days=1), time(), tz) if rows else None
+        self.position = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    def sprint_at(self, ts):
+        """Name of the sprint whose window contains ts, or None."""
+        if ts is None:
+            return None
+        i = bisect_right(self.starts, ts) - 1
+        if i < 0 or ts >= self.end:
+            return None
+        return self.names[i]
+
+    def window(self, sprint):
+        """[start, end) instants of one sprint's window."""
+        i = self.position[sprint]
+        end = self.starts[i + 1] if i + 1 < len(self.starts) else self.end
+        return self.starts[i], end
+
+
+def parse_sprint_field(value):
+    """'A, B' -> ['A', 'B'] (empty / None -> [])."""
+    return [s.strip() for s in (value or "").split(",") if s.strip()]
+
+
+def sprint_memberships(created, changes, initial=()):
+    """[(sprint, added, removed)] for one issue; removed is None if still a member.
+
+    changes is an iterable of (timestamp, from_value, to_value) of the Sprint
+    field.  Before the first change the issue is in the sprints of its
+    first from_value (or `initial` when there are no changes at all)."""
+    changes = sorted(changes, key=lambda c: c[0])
+    current = parse_sprint_field(changes[0][1]) if changes else list(initial)
+    since = {s: created for s in current}
+    out = []
+    for ts, _from, to in changes:
+        new = parse_sprint_field(to)
+        for s in list(since):
+            if s not in new:
+                out.append((s, since.pop(s), ts))
+        for s in new:
+            since.setdefault(s, ts)
+    out.extend((s, added, None) for s, added in since.items())
+    out.sort(key=lambda m: m[1])
+    return out
+
+
+def main():
+    from calendars import get_calendar
+    index = SprintWindowIndex(tz=get_calendar().tz)
+    stamps = sys.argv[1:] or [datetime.now().astimezone().isoformat()]
+    for s in stamps:
+        ts = datetime.fromisoformat(s)
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=index.starts[0].tzinfo)   # team-local time
+        print(f"{s}: {index.sprint_at(ts) or '(outside all sprints)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Point-in-time story points from the Story Points changelog.
+
+sp_history() turns an issue's Story Points field changes into a step
+function starting at creation (SpHistory: parallel sorted lists of change
+times and values); sp_as_of() reads it at any instant with one bisect of
+the stored times.  The value "at commitment" is read at
+the moment the issue was committed to a sprint: the sprint's start, or
+the time it was added if that was later (commitment_time()).
+
+Issues whose points were set at creation and never changed have no
+history; callers fall back to a separately collected value for those.
+"""
+from bisect import bisect_right
+
+
+def parse_sp(value):
+    """'3' / '2.5' -> float; empty or None (points cleared) -> None."""
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class SpHistory:
+    """Story points step function: values[i] is in effect from times[i]."""
+    __slots__ = ("times", "values")
+
+    def __init__(self):
+        self.times = []
+        self.values = []
+
+    def append(self, ts, value):
+        self.times.append(ts)
+        self.values.append(value)
+
+    def __len__(self):
+        return len(self.times)
+
+    def __iter__(self):
+        return zip(self.times, self.values)
+
+
+def sp_history(created, changes):
+    """SpHistory for one issue, empty without any SP change.
+
+    changes is an iterable of (timestamp, from_string, to_string); the value
+    before the first change is that change's from_string."""
+    changes = sorted(changes, key=lambda c: c[0])
+    hist = SpHistory()
+    if changes:
+        hist.append(created, parse_sp(changes[0][1]))
+        for ts, _from, to in changes:
+            hist.append(ts, parse_sp(to))
+    return hist
+
+
+def sp_as_of(history, ts):
+    """Story points in effect at ts (None before creation or when unset)."""
+    i = bisect_right(history.times, ts) - 1
+    return history.values[i] if i >= 0 else None
+
+
+def sp_final(history):
+    return history.values[-1] if history else None
+
+
+def commitment_time(memberships, sprint, window_start):
+    """When the issue was committed to `sprint`: the later of the sprint
+    start and the time it was added (sprints.sprint_memberships() rows)."""
+    added = [a for s, a, _r in memberships if s == sprint and a is not None]
+    if not added:
+        return window_start
+    return max(window_start, min(added))
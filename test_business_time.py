@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Checks for business_time.BusinessCalendar.
+
+Usage: python3 -m unittest test_business_time     (or pytest)
+"""
+import unittest
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from business_time import BusinessCalendar
+
+TZ = ZoneInfo("America/New_York")
+
+
+class YearBoundaryTest(unittest.TestCase):
+    def test_start_before_compiled_range(self):
+        # Compiling 2025 first and then asking for an interval that starts in
+        # 2024 recompiles with an earlier origin mid-query.
+        cal = BusinessCalendar(TZ, holidays={date(2024, 12, 25), date(2025, 1, 1)})
+        cal.days_between(datetime(2025, 3, 3, tzinfo=TZ), datetime(2025, 3, 4, tzinfo=TZ))
+        start = datetime(2024, 12, 20, tzinfo=TZ)
+        end = datetime(2025, 1, 6, tzinfo=TZ)
+        # Dec 20, 23, 24, 26, 27, 30, 31, Jan 2, 3: nine business days.
+        self.assertEqual(cal.days_between(start, end), 9.0)
+        self.assertEqual(cal.days_between(start, end), 9.0)
+
+    def test_fresh_calendar_matches_precompiled(self):
+        start = datetime(2024, 12, 30, 15, 30, tzinfo=TZ)
+        end = datetime(2025, 1, 2, 9, 0, tzinfo=TZ)
+        fresh = BusinessCalendar(TZ).minutes_between(start, end)
+        cal = BusinessCalendar(TZ)
+        cal.is_business_day(date(2025, 6, 1))
+        self.assertEqual(cal.minutes_between(start, end), fresh)
+        self.assertEqual(fresh, (8.5 + 24 + 24 + 9) * 60)
+
+    def test_business_days_across_years(self):
+        cal = BusinessCalendar(TZ, holidays={date(2025, 1, 1)})
+        cal.is_business_day(date(2025, 6, 2))
+        self.assertEqual(cal.business_days(date(2024, 12, 30), date(2025, 1, 3)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Streaming top-K leaderboards.
+
+A TopK holds one bounded min-heap per ranking, so any number of
+leaderboards is filled in a single pass over the records at O(N log K)
+total.  Ties keep the earlier-pushed item, matching a stable descending
+sort.  TopK instances built over different shards of the data can be
+combined with merge().
+"""
+import heapq
+from itertools import count
+
+
+class Ranking:
+    """One leaderboard: score(item) for items where where(item) is true."""
+
+    def __init__(self, name, score, where=None, k=10):
+        self.name = name
+        self.score = score
+        self.where = where
+        self.k = k
+
+
+class TopK:
+    def __init__(self, rankings):
+        self.rankings = {r.name: r for r in rankings}
+        self._heaps = {r.name: [] for r in rankings}
+        self._seq = count()
+
+    def push(self, item):
+        seq = next(self._seq)
+        for name, r in self.rankings.items():
+            if r.where is not None and not r.where(item):
+                continue
+            self._offer(name, (r.score(item), -seq, item))
+
+    def _offer(self, name, entry):
+        heap = self._heaps[name]
+        if len(heap) < self.rankings[name].k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def update(self, items):
+        for item in items:
+            self.push(item)
+        return self
+
+    def merge(self, other):
+        """Fold another TopK over the same rankings into this one.
+
+        The other shard's entries are re-sequenced after this one's, so on
+        equal scores this shard's items win."""
+        for name, heap in other._heaps.items():
+            for score, neg_seq, item in sorted(heap, key=lambda e: -e[1]):
+                self._offer(name, (score, -next(self._seq), item))
+        return self
+
+    def results(self, name):
+        """Items of one leaderboard, highest score first."""
+        return [e[2] for e in sorted(self._heaps[name],
+                                     key=lambda e: (e[0], e[1]), reverse=True)]